@@ -1,6 +1,10 @@
 # config.py
 
-import random
+import hashlib
+from dataclasses import dataclass,field,fields,replace
+from typing import Optional
+
+from topology import Topology,erdos_renyi
 
 CITIES=[f"C{i}" for i in range(12)]
 
@@ -10,14 +14,8 @@ INITIAL_MEMORY=0.0
 
 COLLAPSE_THRESHOLD=0.3
 
-random.seed(7)
-
-INITIAL_WEIGHTS={}
-
-for i in CITIES:
-    for j in CITIES:
-        if i!=j and random.random()<0.35:
-            INITIAL_WEIGHTS[(i,j)]=round(random.uniform(0.3,1.0),2)
+SEED=7
+EDGE_PROBABILITY=0.35
 
 ALPHA=0.025
 BETA=0.03
@@ -32,13 +30,93 @@ MU=0.50
 
 TICKS=250
 
+def default_topology():
+    """The default city graph (erdos_renyi is cached: one draw per process)."""
+    return erdos_renyi(len(CITIES),EDGE_PROBABILITY,SEED)
+
 def init_state():
-    return {
-        city:{
-            "stability":INITIAL_STABILITY,
-            "tension":INITIAL_TENSION,
-            "memory":INITIAL_MEMORY,
-            "collapsed":False,
+    return DEFAULT_CONFIG.init_state()
+
+@dataclass(frozen=True)
+class CascadeConfig:
+    """
+    One experiment: a topology (see topology.py), the model constants,
+    defaulting to the module values above, and the cities sabotaged at
+    tick 0 (sabotaged=None: the first two cities of the topology).
+    Passed to the run functions, so runs on different configs can share
+    a process.
+    """
+
+    topology:Topology=field(default_factory=default_topology)
+
+    alpha:float=ALPHA
+    beta:float=BETA
+    gamma:float=GAMMA
+    k1:float=K1
+    k2:float=K2
+    lambda_:float=LAMBDA
+    delta:float=DELTA
+    mu:float=MU
+
+    collapse_threshold:float=COLLAPSE_THRESHOLD
+    initial_stability:float=INITIAL_STABILITY
+    initial_tension:float=INITIAL_TENSION
+    initial_memory:float=INITIAL_MEMORY
+    ticks:int=TICKS
+
+    sabotaged:Optional[tuple]=None
+
+    def __post_init__(self):
+        if self.sabotaged is None:
+            return
+
+        sabotaged=tuple(self.sabotaged)
+        known=set(self.cities)
+
+        unknown=[city for city in sabotaged if city not in known]
+        if unknown:
+            raise ValueError(f"Sabotaged cities not in the topology: {unknown}")
+        if len(set(sabotaged))!=len(sabotaged):
+            raise ValueError(f"Sabotaged cities repeat: {list(sabotaged)}")
+
+        object.__setattr__(self,"sabotaged",sabotaged)
+
+    @property
+    def cities(self):
+        return self.topology.cities
+
+    @property
+    def weights(self):
+        return self.topology.weights
+
+    @property
+    def sabotaged_cities(self):
+        """The cities sabotaged at tick 0."""
+        if self.sabotaged is None:
+            return tuple(self.cities[:2])
+        return self.sabotaged
+
+    @property
+    def key(self):
+        """Content hash of the topology and constants."""
+        values=[self.topology.key if f.name=="topology" else getattr(self,f.name) for f in fields(self)]
+        return hashlib.sha1(repr(values).encode("utf-8")).hexdigest()[:16]
+
+    def replace(self,**changes):
+        return replace(self,**changes)
+
+    def init_state(self):
+        return {
+            city:{
+                "stability":self.initial_stability,
+                "tension":self.initial_tension,
+                "memory":self.initial_memory,
+                "collapsed":False,
+            }
+            for city in self.cities
         }
-        for city in CITIES
-    }
+
+DEFAULT_CONFIG=CascadeConfig()
+
+# the default topology's weights, as a plain dict
+INITIAL_WEIGHTS=dict(DEFAULT_CONFIG.weights)
@@ -1,19 +1,28 @@
 # control_model.py
 
-from copy import deepcopy
-from config import CITIES,INITIAL_WEIGHTS,TICKS,ALPHA,BETA,GAMMA,K1,K2,COLLAPSE_THRESHOLD,init_state
+from recorder import TrajectoryRecorder
+from config import DEFAULT_CONFIG
 
-def run_control(sabotage_level=0.3):
-    state=init_state()
-    W=deepcopy(INITIAL_WEIGHTS)
-    logs=[]
+def run_control(sabotage_level=0.3,recorder=None,config=None):
+    if config is None:
+        config=DEFAULT_CONFIG
+
+    CITIES=config.cities
+    ALPHA,BETA,GAMMA,K1,K2=config.alpha,config.beta,config.gamma,config.k1,config.k2
+    COLLAPSE_THRESHOLD,TICKS=config.collapse_threshold,config.ticks
+
+    state=config.init_state()
+    W=dict(config.weights)
+
+    if recorder is None:
+        recorder=TrajectoryRecorder(CITIES,TICKS)
 
     for tick in range(TICKS):
         loss={city:0.0 for city in CITIES}
 
         if tick==0:
-            loss["C0"]+=sabotage_level
-            loss["C1"]+=sabotage_level
+            for city in config.sabotaged_cities:
+                loss[city]+=sabotage_level
 
         spread={}
         for i in CITIES:
@@ -40,6 +49,6 @@ def run_control(sabotage_level=0.3):
                     if (city,k) in W:
                         W[(city,k)]=0.0
 
-        logs.append(deepcopy(state))
+        recorder.record(tick,state)
 
-    return logs
+    return recorder
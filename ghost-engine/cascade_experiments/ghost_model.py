@@ -1,44 +1,238 @@
 # ghost_model.py
 
-from copy import deepcopy
-from config import CITIES,INITIAL_WEIGHTS,TICKS,ALPHA,BETA,GAMMA,K1,K2,LAMBDA,DELTA,MU,COLLAPSE_THRESHOLD,init_state
+import heapq
 
-def run_ghost(sabotage_level=0.3,use_memory=True,use_nonlinear=True,use_topology=True):
-    state=init_state()
-    W=deepcopy(INITIAL_WEIGHTS)
-    logs=[]
+from recorder import TrajectoryRecorder
+from config import DEFAULT_CONFIG
 
-    for tick in range(TICKS):
+class MemoryOffset:
+    # city memories under one global offset. A collapse adds DELTA to
+    # every other city's memory, capped at 1.0 per city; here it only
+    # counts a bump, and total() stays O(1).
+    # A city is in one of three groups:
+    # - fresh: written since the last bump, memory as written
+    # - linear: memory is o+bumps*DELTA
+    # - capped: memory is 1.0 (DELTA >= 0 only, later bumps keep it there)
+    # The next bump moves the fresh cities on; with DELTA < 0 only that
+    # first bump can meet the cap, with DELTA >= 0 a heap of linear
+    # cities (largest o first) finds the ones each bump caps.
+    def __init__(self,delta,memories):
+        self.delta=delta
+        self.bumps=0
+        self.fresh=dict(memories)
+        self.fresh_total=0.0
+        for memory in self.fresh.values():
+            self.fresh_total+=memory
+        self.linear={}
+        self.linear_total=0.0
+        self.capped=set()
+        self.heap=[]
+
+    def read(self,city):
+        if city in self.fresh:
+            return self.fresh[city]
+        if city in self.capped:
+            return 1.0
+        return min(1.0,self.linear[city]+self.bumps*self.delta)
+
+    def write(self,city,memory):
+        if city in self.fresh:
+            self.fresh_total-=self.fresh[city]
+        elif city in self.capped:
+            self.capped.discard(city)
+        else:
+            self.linear_total-=self.linear.pop(city)
+
+        self.fresh[city]=memory
+        self.fresh_total+=memory
+
+    def bump(self,city):
+        # every city but the collapsed one (just written, so fresh)
+        self.bumps+=1
+        B,D=self.bumps,self.delta
+
+        for n,memory in self.fresh.items():
+            if n==city:
+                continue
+            if D<0:
+                o=min(1.0,memory+D)-B*D
+            elif memory+D>=1.0:
+                self.capped.add(n)
+                continue
+            else:
+                o=memory+D-B*D
+                heapq.heappush(self.heap,(-o,n))
+
+            self.linear[n]=o
+            self.linear_total+=o
+
+        memory=self.fresh[city]
+        self.fresh={city:memory}
+        self.fresh_total=memory
+
+        # linear cities this bump takes to the cap (entries of cities
+        # written since they were pushed are skipped)
+        while self.heap and B*D-self.heap[0][0]>=1.0:
+            o,n=heapq.heappop(self.heap)
+            if self.linear.get(n)==-o:
+                self.linear_total-=self.linear.pop(n)
+                self.capped.add(n)
+
+    def total(self):
+        return self.fresh_total+self.linear_total+len(self.linear)*self.bumps*self.delta+len(self.capped)
+
+def _setup(config,recorder):
+    if config is None:
+        config=DEFAULT_CONFIG
+    if recorder is None:
+        recorder=TrajectoryRecorder(config.cities,config.ticks)
+
+    # in / out edges per city, sources in city order (spread sums in that order)
+    rank={city:n for n,city in enumerate(config.cities)}
+    incoming={city:[] for city in config.cities}
+    outgoing={city:[] for city in config.cities}
+
+    for edge in sorted(config.weights,key=lambda e:rank[e[0]]):
+        incoming[edge[1]].append(edge)
+        outgoing[edge[0]].append(edge)
+
+    return config,recorder,incoming,outgoing
+
+def run_ghost(sabotage_level=0.3,use_memory=True,use_nonlinear=True,use_topology=True,recorder=None,config=None):
+    # O(edges) per tick, O(degree) per collapse: a running collapsed
+    # count, in/out adjacency lists and one global memory offset. Its
+    # sums run in a different order than the original model's, so
+    # results match run_ghost_reference to rounding, not to the last bit
+    config,recorder,incoming,outgoing=_setup(config,recorder)
+
+    CITIES=config.cities
+    ALPHA,BETA,GAMMA,K1,K2=config.alpha,config.beta,config.gamma,config.k1,config.k2
+    LAMBDA,DELTA,MU=config.lambda_,config.delta,config.mu
+
+    state=config.init_state()
+    W=dict(config.weights)
+
+    # collapse pressure by collapsed count (0.02 added once per city)
+    collapsed_count=0
+    pressure=[0.0]
+
+    for tick in range(config.ticks):
         loss={city:0.0 for city in CITIES}
 
         if tick==0:
-            loss["C0"]+=sabotage_level
-            loss["C1"]+=sabotage_level
+            for city in config.sabotaged_cities:
+                loss[city]+=sabotage_level
 
         spread={}
         for i in CITIES:
             s=0.0
-            for j in CITIES:
-                if (j,i) in W:
+            for edge in incoming[i]:
+                j=edge[0]
 
-                    # 🔥 collapse amplifier
-                    mult = 1.8 if state[j]["collapsed"] else 1.0
+                # 🔥 collapse amplifier
+                mult = 1.8 if state[j]["collapsed"] else 1.0
 
-                    s += state[j]["tension"] * W[(j,i)] * ALPHA * mult
+                s += state[j]["tension"] * W[edge] * ALPHA * mult
 
             spread[i]=s
 
+        memories=MemoryOffset(DELTA,((city,state[city]["memory"]) for city in CITIES))
+
         for city in CITIES:
             if state[city]["collapsed"]:
                 continue
-            
+
             # 🔥 collapsed neighbors continuously generate pressure
-            collapse_pressure = sum(
-                0.02 for n in CITIES
-                if n != city and state[n]["collapsed"]
-            )
-            loss[city] += collapse_pressure
-            
+            while len(pressure)<=collapsed_count:
+                pressure.append(pressure[-1]+0.02)
+
+            loss[city] += pressure[collapsed_count]
+
+            if use_memory:
+                memory=GAMMA*memories.read(city)+loss[city]
+                pressure_source=memory
+            else:
+                memory=0.0
+                pressure_source=loss[city]
+
+            memories.write(city,memory)
+
+            base=K1*pressure_source+K2*spread[city]
+
+            if use_nonlinear:
+                amp=base*(1.0+LAMBDA*(state[city]["tension"]**2))
+            else:
+                amp=base
+
+            state[city]["tension"]+=amp
+            state[city]["tension"]=min(1.0,state[city]["tension"])
+
+            neighbor_memory_avg=(memories.total()-memory)/2.0
+
+            state[city]["stability"]-=BETA*(state[city]["tension"]+MU*neighbor_memory_avg)
+            state[city]["stability"]=max(0.0,state[city]["stability"])
+
+            if state[city]["stability"]<config.collapse_threshold:
+                state[city]["collapsed"]=True
+                collapsed_count+=1
+
+                if use_topology:
+                    for edge in outgoing[city]:
+                        W[edge]*=0.6
+                    for edge in incoming[city]:
+                        W[edge]*=0.6
+
+                    memories.bump(city)
+
+        for city in CITIES:
+            state[city]["memory"]=memories.read(city)
+
+        recorder.record(tick,state)
+
+    return recorder
+
+def run_ghost_reference(sabotage_level=0.3,use_memory=True,use_nonlinear=True,use_topology=True,recorder=None,config=None):
+    # the original model: memories summed in city order and collapse
+    # bumps applied to every city at once, O(N^2) per tick. Reproduces
+    # the original results to the last bit; run_ghost is the fast path
+    config,recorder,incoming,outgoing=_setup(config,recorder)
+
+    CITIES=config.cities
+    ALPHA,BETA,GAMMA,K1,K2=config.alpha,config.beta,config.gamma,config.k1,config.k2
+    LAMBDA,DELTA,MU=config.lambda_,config.delta,config.mu
+
+    state=config.init_state()
+    W=dict(config.weights)
+
+    collapsed_count=0
+    pressure=[0.0]
+
+    for tick in range(config.ticks):
+        loss={city:0.0 for city in CITIES}
+
+        if tick==0:
+            for city in config.sabotaged_cities:
+                loss[city]+=sabotage_level
+
+        spread={}
+        for i in CITIES:
+            s=0.0
+            for edge in incoming[i]:
+                j=edge[0]
+                mult = 1.8 if state[j]["collapsed"] else 1.0
+                s += state[j]["tension"] * W[edge] * ALPHA * mult
+
+            spread[i]=s
+
+        for city in CITIES:
+            if state[city]["collapsed"]:
+                continue
+
+            while len(pressure)<=collapsed_count:
+                pressure.append(pressure[-1]+0.02)
+
+            loss[city] += pressure[collapsed_count]
+
             if use_memory:
                 state[city]["memory"]=GAMMA*state[city]["memory"]+loss[city]
                 pressure_source=state[city]["memory"]
@@ -56,27 +250,29 @@ def run_ghost(sabotage_level=0.3,use_memory=True,use_nonlinear=True,use_topology
             state[city]["tension"]+=amp
             state[city]["tension"]=min(1.0,state[city]["tension"])
 
-            neighbor_memory_avg=sum(
-                state[n]["memory"] for n in CITIES if n!=city
-            )/2.0
+            neighbor_memory_avg=0.0
+            for n in CITIES:
+                if n!=city:
+                    neighbor_memory_avg+=state[n]["memory"]
+            neighbor_memory_avg/=2.0
 
             state[city]["stability"]-=BETA*(state[city]["tension"]+MU*neighbor_memory_avg)
             state[city]["stability"]=max(0.0,state[city]["stability"])
 
-            if state[city]["stability"]<COLLAPSE_THRESHOLD:
+            if state[city]["stability"]<config.collapse_threshold:
                 state[city]["collapsed"]=True
+                collapsed_count+=1
 
                 if use_topology:
-                    for k in CITIES:
-                        if (city,k) in W:
-                            W[(city,k)]*=0.6
-                        if (k,city) in W:
-                            W[(k,city)]*=0.6
+                    for edge in outgoing[city]:
+                        W[edge]*=0.6
+                    for edge in incoming[city]:
+                        W[edge]*=0.6
 
                     for n in CITIES:
                         if n!=city:
                             state[n]["memory"]=min(1.0,state[n]["memory"]+DELTA)
 
-        logs.append(deepcopy(state))
+        recorder.record(tick,state)
 
-    return logs
+    return recorder
@@ -0,0 +1,307 @@
+# matrix_model.py
+
+"""
+Array versions of run_control / run_ghost for large topologies.
+
+W is the weight matrix in CSR form with one row per *target*: row i
+lists the sources j (ascending) of the edges j -> i, so spread is
+ALPHA * (W @ tension). Anything with indptr / indices / data arrays
+(e.g. scipy.sparse.csr_matrix) or an (indptr, indices, data) tuple is
+accepted; without W, the run uses its config's topology
+(Topology.csr()). Constants come from `config` (a CascadeConfig,
+default: config.DEFAULT_CONFIG).
+
+City state is kept as vectors (stability, tension, memory, collapsed)
+and updated with the same float operations, in the same order, as the
+dict models, so the 12-city results are identical. Runs return the
+final vectors plus collapse_tick (-1: never collapsed); timeline() and
+snapshot() turn them back into the dict models' output.
+"""
+
+import numpy as np
+
+from config import DEFAULT_CONFIG
+
+# cities per vectorized block in run_ghost_csr (doubled while no city collapses)
+_BLOCK = 64
+
+
+def csr_from_weights(weights, cities):
+    """(indptr, indices, data) of a {(source, target): weight} dict."""
+    index = {city: i for i, city in enumerate(cities)}
+    n = len(cities)
+
+    sources = np.fromiter((index[j] for j, _ in weights), dtype=np.int64, count=len(weights))
+    targets = np.fromiter((index[i] for _, i in weights), dtype=np.int64, count=len(weights))
+    data = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+
+    order = np.lexsort((sources, targets))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(targets, minlength=n), out=indptr[1:])
+
+    return indptr, sources[order], data[order]
+
+
+class _Edges:
+    """
+    Mutable copy of W: spread per tick in O(edges), in / out edges of
+    a collapsing city scaled in O(degree).
+    """
+
+    def __init__(self, W):
+        if isinstance(W, tuple):
+            indptr, indices, data = W
+        else:
+            indptr, indices, data = W.indptr, W.indices, W.data
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.n = len(self.indptr) - 1
+
+        self.src = np.asarray(indices, dtype=np.int64)
+        self.dst = np.repeat(np.arange(self.n), np.diff(self.indptr))
+        self.data = np.array(data, dtype=np.float64)  # copied: runs rescale it
+
+        # positions of each city's out-edges
+        self.out_pos = np.argsort(self.src, kind="stable")
+        self.out_ptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.src, minlength=self.n), out=self.out_ptr[1:])
+
+    def spread(self, tension, alpha, mult=None):
+        # bincount sums each row in storage order, as the dict loops do
+        contrib = tension[self.src] * self.data * alpha
+        if mult is not None:
+            contrib *= mult[self.src]
+
+        return np.bincount(self.dst, weights=contrib, minlength=self.n)
+
+    def out_edges(self, city):
+        return self.out_pos[self.out_ptr[city]:self.out_ptr[city + 1]]
+
+    def in_edges(self, city):
+        return slice(self.indptr[city], self.indptr[city + 1])
+
+
+def _setup(W, config):
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    edges = _Edges(config.topology.csr() if W is None else W)
+    n = edges.n
+
+    state = (
+        np.full(n, config.initial_stability),
+        np.full(n, config.initial_tension),
+        np.full(n, config.initial_memory),
+        np.zeros(n, dtype=bool),
+        np.full(n, -1, dtype=np.int64),
+    )
+
+    return config, edges, n, state
+
+
+def _seeds(config, seeds):
+    """Indexes of the sabotaged cities (None: the config's)."""
+    if seeds is None:
+        rank = {city: i for i, city in enumerate(config.cities)}
+        seeds = [rank[city] for city in config.sabotaged_cities]
+
+    return seeds
+
+
+def _sabotage(n, seeds, sabotage_level):
+    loss = np.zeros(n)
+    for seed in seeds:
+        loss[seed] += sabotage_level
+
+    return loss
+
+
+def _result(stability, tension, memory, collapsed, collapse_tick):
+    return {
+        "stability": stability,
+        "tension": tension,
+        "memory": memory,
+        "collapsed": collapsed,
+        "collapse_tick": collapse_tick,
+    }
+
+
+def run_control_csr(W=None, sabotage_level=0.3, seeds=None, ticks=None, recorder=None,
+                    config=None):
+    """
+    run_control on W; `seeds` are the indexes of the sabotaged cities
+    (None: config.sabotaged_cities).
+    Every tick is passed to `recorder` (a TrajectoryRecorder), if any.
+    """
+    config, edges, n, state = _setup(W, config)
+    stability, tension, memory, collapsed, collapse_tick = state
+    seeds = _seeds(config, seeds)
+
+    ALPHA, BETA, GAMMA, K1, K2 = config.alpha, config.beta, config.gamma, config.k1, config.k2
+    COLLAPSE_THRESHOLD = config.collapse_threshold
+
+    zero = np.zeros(n)
+
+    for tick in range(config.ticks if ticks is None else ticks):
+        loss = _sabotage(n, seeds, sabotage_level) if tick == 0 else zero
+        spread = edges.spread(tension, ALPHA)
+
+        # cities only read last tick's tensions: one vector update per tick
+        live = np.flatnonzero(~collapsed)
+        lost = loss[live]
+
+        memory[live] = GAMMA * memory[live] + lost
+
+        t = np.minimum(1.0, tension[live] + (K1 * lost + K2 * spread[live]))
+        tension[live] = t
+        stability[live] = np.maximum(0.0, stability[live] - BETA * t)
+
+        for city in live[stability[live] < COLLAPSE_THRESHOLD]:
+            collapsed[city] = True
+            collapse_tick[city] = tick
+            edges.data[edges.out_edges(city)] = 0.0
+
+        if recorder is not None:
+            recorder.record_arrays(tick, stability, tension, memory, collapsed)
+
+    return _result(stability, tension, memory, collapsed, collapse_tick)
+
+
+def run_ghost_csr(W=None, sabotage_level=0.3, use_memory=True, use_nonlinear=True,
+                  use_topology=True, seeds=None, ticks=None, memory_sums="exact",
+                  recorder=None, config=None):
+    """
+    run_ghost on W; `seeds` are the indexes of the sabotaged cities
+    (None: config.sabotaged_cities).
+    Every tick is passed to `recorder` (a TrajectoryRecorder), if any.
+
+    Within a tick, cities see the collapses (and memory bumps) of the
+    cities before them, so each tick is processed in blocks that end at
+    the next collapse. neighbor_memory_avg sums the memory of every
+    other city: memory_sums="exact" adds them in city order like the
+    dict model (O(N) per city); "running" keeps a running total (O(1)
+    per city, last-bit rounding differences) and is what makes 100k
+    cities practical.
+    """
+    if memory_sums not in ("exact", "running"):
+        raise ValueError(f"Unknown memory_sums: {memory_sums}")
+
+    config, edges, n, state = _setup(W, config)
+    stability, tension, memory, collapsed, collapse_tick = state
+    seeds = _seeds(config, seeds)
+
+    ALPHA, BETA, GAMMA, K1, K2 = config.alpha, config.beta, config.gamma, config.k1, config.k2
+    LAMBDA, DELTA, MU = config.lambda_, config.delta, config.mu
+    COLLAPSE_THRESHOLD = config.collapse_threshold
+
+    zero = np.zeros(n)
+
+    # collapse pressure by collapsed count (0.02 added once per city)
+    pressure = [0.0]
+    n_collapsed = 0
+
+    for tick in range(config.ticks if ticks is None else ticks):
+        loss = _sabotage(n, seeds, sabotage_level) if tick == 0 else zero
+
+        mult = np.where(collapsed, 1.8, 1.0)
+        spread = edges.spread(tension, ALPHA, mult)
+
+        order = np.flatnonzero(~collapsed)
+        total = memory.sum()
+        pos = 0
+        block = _BLOCK
+
+        while pos < len(order):
+            idx = order[pos:pos + block]
+
+            while len(pressure) <= n_collapsed:
+                pressure.append(pressure[-1] + 0.02)
+
+            lost = loss[idx] + pressure[n_collapsed]
+            old_m = memory[idx]
+
+            if use_memory:
+                new_m = GAMMA * old_m + lost
+                pressure_source = new_m
+            else:
+                new_m = np.zeros(len(idx))
+                pressure_source = lost
+
+            base = K1 * pressure_source + K2 * spread[idx]
+            t = tension[idx]
+
+            if use_nonlinear:
+                amp = base * (1.0 + LAMBDA * (t ** 2))
+            else:
+                amp = base
+
+            t = np.minimum(1.0, t + amp)
+
+            # memory of every other city, after the earlier cities' updates
+            if memory_sums == "exact":
+                work = memory.copy()
+                others = np.empty(len(idx))
+
+                for k, city in enumerate(idx):
+                    work[city] = new_m[k]
+                    rest = np.delete(work, city)
+                    others[k] = np.cumsum(rest)[-1] if len(rest) else 0.0
+            else:
+                running = total + np.cumsum(new_m - old_m)
+                others = running - new_m
+
+            s = np.maximum(0.0, stability[idx] - BETA * (t + MU * (others / 2.0)))
+
+            down = np.flatnonzero(s < COLLAPSE_THRESHOLD)
+            done = down[0] + 1 if len(down) else len(idx)
+
+            memory[idx[:done]] = new_m[:done]
+            tension[idx[:done]] = t[:done]
+            stability[idx[:done]] = s[:done]
+            pos += done
+
+            if not len(down):
+                if memory_sums == "running":
+                    total = running[-1]
+                block *= 2
+                continue
+
+            city = idx[done - 1]
+            collapsed[city] = True
+            collapse_tick[city] = tick
+            n_collapsed += 1
+            block = _BLOCK
+
+            if use_topology:
+                edges.data[edges.out_edges(city)] *= 0.6
+                edges.data[edges.in_edges(city)] *= 0.6
+
+                kept = memory[city]
+                np.minimum(1.0, memory + DELTA, out=memory)
+                memory[city] = kept
+
+            total = memory.sum()
+
+        if recorder is not None:
+            recorder.record_arrays(tick, stability, tension, memory, collapsed)
+
+    return _result(stability, tension, memory, collapsed, collapse_tick)
+
+
+def timeline(result, cities):
+    """{city: collapse tick} in collapse order (compare_runs.collapse_timeline)."""
+    ticks = result["collapse_tick"]
+    down = np.flatnonzero(ticks >= 0)
+    down = down[np.argsort(ticks[down], kind="stable")]
+
+    return {cities[i]: int(ticks[i]) for i in down}
+
+
+def snapshot(result, cities):
+    """Final state in the dict models' layout (compare_runs.final_snapshot)."""
+    columns = [result[field].tolist() for field in ("stability", "tension", "memory", "collapsed")]
+
+    return {
+        city: {"stability": s, "tension": t, "memory": m, "collapsed": c}
+        for city, s, t, m, c in zip(cities, *columns)
+    }
@@ -0,0 +1,174 @@
+# recorder.py
+
+"""
+Compact trajectories for cascade runs.
+
+Frames live in flat array('d') buffers, so the dict models record
+without NumPy. When NumPy is installed, the readers return views of
+those buffers as arrays (no copy); without it they return lists.
+"""
+
+from array import array
+
+FIELDS = ("stability", "tension", "memory")
+
+
+def _numpy():
+    """NumPy, or None (imported on first use, as topology.py does)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class TrajectoryRecorder:
+    """
+    City state per tick in preallocated arrays, instead of a deepcopy
+    of the whole state dict every tick.
+
+    - frames: (recorded ticks x cities x FIELDS) floats; every=k keeps
+      ticks 0, k, 2k, ... (frame_ticks), events_only=True keeps none;
+      only the frames recorded so far are listed
+    - collapse_tick: first tick each city was seen collapsed (-1: never)
+    - the last recorded state is always kept, so collapse_timeline()
+      and snapshot() are exact whatever is sampled
+    """
+
+    def __init__(self, cities, ticks, every=1, events_only=False):
+        if every < 1:
+            raise ValueError("every must be >= 1")
+
+        self.cities = list(cities)
+        self.every = every
+
+        n = len(self.cities)
+        self._width = n * len(FIELDS)  # floats per frame
+        self._capacity = 0 if events_only else (ticks + every - 1) // every
+
+        self._frames = array("d", bytes(8 * self._capacity * self._width))
+        self._rows = 0  # frames recorded
+        self._collapse_tick = array("q", [-1]) * n
+
+        self.last_tick = -1
+        self._last = array("d", bytes(8 * self._width))
+
+    def record(self, tick, state):
+        """Record a dict model's state ({city: {field: value}}) after `tick`."""
+        rows = [state[city] for city in self.cities]
+
+        values = array("d", [row[field] for row in rows for field in FIELDS])
+        collapsed = [i for i, row in enumerate(rows) if row["collapsed"]]
+
+        self._store(tick, values, collapsed)
+
+    def record_arrays(self, tick, stability, tension, memory, collapsed):
+        """Record an array model's state vectors after `tick` (needs NumPy)."""
+        np = _numpy()
+
+        values = np.column_stack((stability, tension, memory)).astype(np.float64).ravel()
+
+        self._store(tick, array("d", values.tobytes()), np.flatnonzero(collapsed).tolist())
+
+    def _store(self, tick, values, collapsed):
+        """values: flat frame (cities x FIELDS); collapsed: city indexes."""
+        self._last[:] = values
+        self.last_tick = tick
+
+        row, offset = divmod(tick, self.every)
+        if not offset and row < self._capacity:
+            start = row * self._width
+            self._frames[start:start + self._width] = values
+            self._rows = max(self._rows, row + 1)
+
+        ticks = self._collapse_tick
+        for i in collapsed:
+            if ticks[i] < 0:
+                ticks[i] = tick
+
+    # -----------------------------
+    # READERS
+    # -----------------------------
+    @property
+    def frames(self):
+        """Recorded frames (frame_ticks x cities x FIELDS)."""
+        return self._shaped(self._frames, self._rows)
+
+    @property
+    def frame_ticks(self):
+        """Tick of each recorded frame."""
+        np = _numpy()
+
+        if np is None:
+            return list(range(0, self._rows * self.every, self.every))
+
+        return np.arange(self._rows) * self.every
+
+    @property
+    def last_frame(self):
+        """Last recorded state (cities x FIELDS)."""
+        return self._shaped(self._last)
+
+    @property
+    def collapse_tick(self):
+        """First collapse tick of each city (-1: never)."""
+        np = _numpy()
+
+        if np is None:
+            return self._collapse_tick.tolist()
+
+        return np.frombuffer(self._collapse_tick, dtype=np.int64)
+
+    def _shaped(self, buffer, rows=None):
+        """
+        The first `rows` frames of buffer (None: buffer is one frame) as
+        cities x FIELDS: a NumPy view, or nested lists without NumPy.
+        """
+        n, k = len(self.cities), len(FIELDS)
+        size = n * k if rows is None else rows * n * k
+        np = _numpy()
+
+        if np is not None:
+            view = np.frombuffer(buffer, dtype=np.float64)[:size]
+            return view.reshape((n, k) if rows is None else (rows, n, k))
+
+        cities = [buffer[i:i + k].tolist() for i in range(0, size, k)]
+
+        if rows is None:
+            return cities
+
+        return [cities[r * n:(r + 1) * n] for r in range(rows)]
+
+    def collapse_timeline(self) -> dict:
+        """{city: collapse tick}, in collapse order."""
+        ticks = self._collapse_tick
+        down = sorted((i for i in range(len(ticks)) if ticks[i] >= 0), key=ticks.__getitem__)
+
+        return {self.cities[i]: ticks[i] for i in down}
+
+    def snapshot(self, tick=None) -> dict:
+        """
+        State after `tick` (a recorded frame; None: the last recorded
+        tick) in the dict models' layout.
+        """
+        if tick is None:
+            tick, values = self.last_tick, self._last
+        else:
+            row, offset = divmod(tick, self.every)
+            if offset or not 0 <= row < self._rows or tick > self.last_tick:
+                raise KeyError(f"tick {tick} was not recorded")
+            start = row * self._width
+            values = self._frames[start:start + self._width]
+
+        k = len(FIELDS)
+
+        return {
+            city: {
+                "stability": values[i * k],
+                "tension": values[i * k + 1],
+                "memory": values[i * k + 2],
+                "collapsed": 0 <= self._collapse_tick[i] <= tick,
+            }
+            for i, city in enumerate(self.cities)
+        }
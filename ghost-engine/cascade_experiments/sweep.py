@@ -0,0 +1,250 @@
+# sweep.py
+
+"""
+Parameter sweeps over the cascade models, fanned out over a process pool.
+
+Every run is keyed by a hash of its parameters. Results stream into a
+directory of columnar chunks (part-00000.npz, ...: one array per column,
+one row per run) written every `flush_every` runs; a sweep restarted on
+the same directory skips the runs it already holds.
+
+    python sweep.py results/ --sabotage 0.3 0.5 0.7 --seed 7 8 9 \\
+        --use-memory true false --lambda 0.8 1.2 1.6
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+
+import numpy as np
+
+import config
+import control_model
+import ghost_model
+from recorder import TrajectoryRecorder
+from topology import erdos_renyi
+
+MODELS = ("ghost", "control")
+MEMORY_SUMS = ("exact", "running")
+
+# one value per parameter unless the grid lists several
+DEFAULTS = {
+    "model": "ghost",
+    "sabotage": 0.7,
+    "use_memory": True,
+    "use_nonlinear": True,
+    "use_topology": True,
+    "memory_sums": "running",
+    "seed": config.SEED,
+    "alpha": config.ALPHA,
+    "beta": config.BETA,
+    "gamma": config.GAMMA,
+    "lambda": config.LAMBDA,
+    "mu": config.MU,
+}
+
+_TYPES = {"model": str, "memory_sums": str, "seed": int, "use_memory": bool, "use_nonlinear": bool, "use_topology": bool}
+
+# parameters a model does not read (pinned to their defaults, so they
+# do not multiply its runs)
+_UNUSED = {"control": ("use_memory", "use_nonlinear", "use_topology", "memory_sums", "lambda", "mu")}
+
+# sweep parameter -> CascadeConfig field
+_CONSTANTS = {"alpha": "alpha", "beta": "beta", "gamma": "gamma", "lambda": "lambda_", "mu": "mu"}
+
+
+def run_key(params) -> str:
+    """Stable hash of one run's parameters."""
+    blob = json.dumps(params, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:16]
+
+
+def expand(grid):
+    """(key, params) for every distinct run of `grid` ({parameter: values})."""
+    for name in grid:
+        if name not in DEFAULTS:
+            raise ValueError(f"Unknown sweep parameter: {name}")
+
+    axes = {name: grid.get(name, (default,)) for name, default in DEFAULTS.items()}
+    seen = set()
+
+    for values in itertools.product(*axes.values()):
+        params = {name: _TYPES.get(name, float)(value) for name, value in zip(axes, values)}
+
+        if params["model"] not in MODELS:
+            raise ValueError(f"Unknown model: {params['model']}")
+        if params["memory_sums"] not in MEMORY_SUMS:
+            raise ValueError(f"Unknown memory_sums: {params['memory_sums']}")
+
+        for name in _UNUSED.get(params["model"], ()):
+            params[name] = DEFAULTS[name]
+
+        key = run_key(params)
+        if key not in seen:
+            seen.add(key)
+            yield key, params
+
+
+# -----------------------------
+# WORKER
+# -----------------------------
+def cascade_config(params):
+    """The CascadeConfig of one run (the default topology, drawn with its seed)."""
+    topology = erdos_renyi(len(config.CITIES), config.EDGE_PROBABILITY, params["seed"])
+    constants = {field: params[name] for name, field in _CONSTANTS.items()}
+
+    return config.CascadeConfig(topology=topology, **constants)
+
+
+def run_one(item) -> dict:
+    """One run: its parameters plus collapse ticks and final state."""
+    key, params = item
+    run_config = cascade_config(params)
+    recorder = TrajectoryRecorder(run_config.cities, run_config.ticks, events_only=True)
+
+    if params["model"] == "control":
+        control_model.run_control(params["sabotage"], recorder=recorder, config=run_config)
+    else:
+        # "exact": the original model's ordered sums, to the last bit
+        run = ghost_model.run_ghost_reference if params["memory_sums"] == "exact" else ghost_model.run_ghost
+        run(
+            params["sabotage"],
+            use_memory=params["use_memory"],
+            use_nonlinear=params["use_nonlinear"],
+            use_topology=params["use_topology"],
+            recorder=recorder,
+            config=run_config,
+        )
+
+    ticks = recorder.collapse_tick
+    down = ticks[ticks >= 0]
+    final = recorder.last_frame
+
+    return {
+        "key": key,
+        **params,
+        "collapsed": len(down),
+        "first_collapse": int(down.min()) if len(down) else -1,
+        "last_collapse": int(down.max()) if len(down) else -1,
+        "collapse_tick": ticks.copy(),
+        "stability": final[:, 0].copy(),
+        "tension": final[:, 1].copy(),
+        "memory": final[:, 2].copy(),
+    }
+
+
+# -----------------------------
+# RESULTS
+# -----------------------------
+def _parts(path):
+    return sorted(name for name in os.listdir(path) if name.startswith("part-") and name.endswith(".npz"))
+
+
+def load_results(path) -> dict:
+    """Every stored run, as {column: array} (empty if there are none)."""
+    if not os.path.isdir(path):
+        return {}
+
+    chunks = []
+    for name in _parts(path):
+        with np.load(os.path.join(path, name)) as part:
+            chunks.append({column: part[column] for column in part.files})
+
+    if not chunks:
+        return {}
+
+    return {column: np.concatenate([chunk[column] for chunk in chunks]) for column in chunks[0]}
+
+
+def _write_part(path, rows):
+    columns = {name: np.array([row[name] for row in rows]) for name in rows[0]}
+
+    # written aside, then renamed: a part is either complete or absent
+    name = os.path.join(path, f"part-{len(_parts(path)):05d}.npz")
+    with open(name + ".tmp", "wb") as f:
+        np.savez(f, **columns)
+
+    os.replace(name + ".tmp", name)
+
+
+def sweep(grid, path, processes=None, flush_every=256) -> int:
+    """
+    Run every run of `grid` not already stored under `path`, over
+    `processes` worker processes (default: one per core; 1 runs them
+    in-process). Returns the number of runs added.
+    """
+    os.makedirs(path, exist_ok=True)
+
+    done = set(load_results(path).get("key", np.array([])).tolist())
+    pending = [item for item in expand(grid) if item[0] not in done]
+
+    if not pending:
+        return 0
+
+    processes = processes or os.cpu_count() or 1
+    pool = None
+
+    if processes == 1:
+        results = map(run_one, pending)
+    else:
+        pool = multiprocessing.Pool(processes)
+        chunksize = max(1, min(64, len(pending) // (4 * processes)))
+        results = pool.imap_unordered(run_one, pending, chunksize)
+
+    rows = []
+    added = 0
+
+    try:
+        for row in results:
+            rows.append(row)
+
+            if len(rows) >= flush_every:
+                _write_part(path, rows)
+                added += len(rows)
+                rows = []
+    finally:
+        # keep what finished, even on interrupt: a restart resumes after it
+        if rows:
+            _write_part(path, rows)
+            added += len(rows)
+
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return added
+
+
+def _flag(text):
+    if text.lower() in ("1", "true", "yes", "on"):
+        return True
+    if text.lower() in ("0", "false", "no", "off"):
+        return False
+
+    raise argparse.ArgumentTypeError(f"not a flag: {text}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the cascade models over a parameter grid.")
+    parser.add_argument("path", help="results directory (resumed if it exists)")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--flush-every", type=int, default=256)
+
+    parser.add_argument("--model", nargs="+", choices=MODELS)
+    parser.add_argument("--sabotage", nargs="+", type=float)
+    parser.add_argument("--use-memory", nargs="+", type=_flag)
+    parser.add_argument("--use-nonlinear", nargs="+", type=_flag)
+    parser.add_argument("--use-topology", nargs="+", type=_flag)
+    parser.add_argument("--memory-sums", nargs="+", choices=MEMORY_SUMS)
+    parser.add_argument("--seed", nargs="+", type=int)
+    for name in _CONSTANTS:
+        parser.add_argument(f"--{name}", nargs="+", type=float)
+
+    args = vars(parser.parse_args())
+    grid = {name: args[name] for name in DEFAULTS if args[name] is not None}
+
+    added = sweep(grid, args["path"], args["processes"], args["flush_every"])
+    print(f"{added} runs added to {args['path']}")
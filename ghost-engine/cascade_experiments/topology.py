@@ -0,0 +1,124 @@
+# topology.py
+
+"""
+City graphs for the cascade models.
+
+Generators are cached (same arguments: the same Topology object) and
+every Topology carries a content hash, so a worker can hold many
+topologies at once and results can be keyed by the graph itself.
+"""
+
+import hashlib
+import random
+from functools import lru_cache
+from types import MappingProxyType
+
+
+class Topology:
+    """
+    A weighted, directed city graph: city names and
+    {(source, target): weight}. Read-only; `key` hashes the content,
+    so equal graphs share a key however they were built.
+    """
+
+    def __init__(self, cities, weights):
+        self.cities = tuple(cities)
+        self.weights = MappingProxyType(dict(weights))
+
+        blob = repr((self.cities, sorted(self.weights.items()))).encode("utf-8")
+        self.key = hashlib.sha1(blob).hexdigest()[:16]
+
+        self._csr = None
+
+    def __eq__(self, other):
+        return isinstance(other, Topology) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"Topology({len(self.cities)} cities, {len(self.weights)} edges, key={self.key})"
+
+    def csr(self):
+        """(indptr, indices, data) for matrix_model, built once."""
+        if self._csr is None:
+            from matrix_model import csr_from_weights
+
+            self._csr = csr_from_weights(self.weights, self.cities)
+
+        return self._csr
+
+
+def _cities(n):
+    return [f"C{i}" for i in range(n)]
+
+
+def _weight(rng):
+    return round(rng.uniform(0.3, 1.0), 2)
+
+
+@lru_cache(maxsize=64)
+def erdos_renyi(n, p, seed):
+    """Every ordered pair linked with probability p (O(n^2) draws)."""
+    rng = random.Random(seed)
+    cities = _cities(n)
+    weights = {}
+
+    for i in cities:
+        for j in cities:
+            if i != j and rng.random() < p:
+                weights[(i, j)] = _weight(rng)
+
+    return Topology(cities, weights)
+
+
+@lru_cache(maxsize=64)
+def scale_free(n, m, seed):
+    """
+    Preferential attachment (Barabasi-Albert): each new city links to m
+    earlier ones, picked in proportion to their degree. Links run both
+    ways with independent weights.
+    """
+    if not 1 <= m < n:
+        raise ValueError("scale_free needs 1 <= m < n")
+
+    rng = random.Random(seed)
+    cities = _cities(n)
+    weights = {}
+
+    # one entry per edge end: uniform picks are degree-proportional
+    ends = []
+
+    for new in range(m, n):
+        if new == m:
+            chosen = range(m)  # the first m cities
+        else:
+            picked = set()
+            while len(picked) < m:
+                picked.add(rng.choice(ends))
+            chosen = sorted(picked)
+
+        for old in chosen:
+            weights[(cities[new], cities[old])] = _weight(rng)
+            weights[(cities[old], cities[new])] = _weight(rng)
+            ends += (new, old)
+
+    return Topology(cities, weights)
+
+
+@lru_cache(maxsize=64)
+def grid(rows, cols, seed):
+    """rows x cols lattice; each city linked both ways to its 4 neighbors."""
+    rng = random.Random(seed)
+    cities = _cities(rows * cols)
+    weights = {}
+
+    for r in range(rows):
+        for c in range(cols):
+            here = cities[r * cols + c]
+
+            for dr, dc in ((-1, 0), (0, -1), (0, 1), (1, 0)):
+                if 0 <= r + dr < rows and 0 <= c + dc < cols:
+                    weights[(here, cities[(r + dr) * cols + c + dc])] = _weight(rng)
+
+    return Topology(cities, weights)
@@ -0,0 +1,97 @@
+# tests/bench_apply_events.py
+
+import json
+import time
+
+import numpy as np
+
+from ghost.api import GhostAPI
+from ghost.engine import _json_safe
+
+
+# ------------------------------------------------------------
+# WORKLOAD
+# ------------------------------------------------------------
+def make_columns(n_events=1_000_000, n_agents=1_000, seed=7):
+    rng = np.random.default_rng(seed)
+
+    sources = [f"A{i}" for i in rng.integers(0, n_agents, n_events).tolist()]
+    targets = [f"A{i}" for i in rng.integers(0, n_agents, n_events).tolist()]
+    types = np.array(["help", "insult", "betrayal"])[rng.integers(0, 3, n_events)].tolist()
+
+    return sources, targets, types, rng.random(n_events)
+
+
+# ------------------------------------------------------------
+# RUNNERS
+# ------------------------------------------------------------
+def run_apply_event(store, sources, targets, types, intensities):
+    api = GhostAPI({"relationship_store": store})
+    apply_event = api.apply_event
+
+    t0 = time.perf_counter()
+    for s, t, kind, x in zip(sources, targets, types, intensities.tolist()):
+        apply_event(s, t, {"type": kind, "intensity": x})
+
+    return time.perf_counter() - t0, api
+
+
+def run_kernel_loop(store, sources, targets, types, intensities):
+    # the batch validated once, then one apply_core_delta per event:
+    # what a plain loop over the columns can save
+    api = GhostAPI({"relationship_store": store})
+    apply_core_delta = api.engine.relationships.apply_core_delta
+    event_map = api.event_map
+
+    t0 = time.perf_counter()
+    for s, t, kind, x in zip(sources, targets, types, intensities.tolist()):
+        deltas = event_map[kind]
+        trust = deltas.get("trust")
+        attachment = deltas.get("attachment")
+
+        apply_core_delta(
+            s, t,
+            None if trust is None else trust * x,
+            None if attachment is None else attachment * x,
+        )
+
+    return time.perf_counter() - t0, api
+
+
+def run_apply_events(store, sources, targets, types, intensities):
+    api = GhostAPI({"relationship_store": store})
+
+    t0 = time.perf_counter()
+    api.apply_events(sources, targets, types, intensities)
+
+    return time.perf_counter() - t0, api
+
+
+def _dump(api):
+    return json.dumps(_json_safe(api.engine.snapshot()))
+
+
+# ------------------------------------------------------------
+# ENTRYPOINT
+# ------------------------------------------------------------
+if __name__ == "__main__":
+
+    print("\n=== APPLY_EVENT vs APPLY_EVENTS (1M events) ===\n")
+
+    for n_agents in (1_500, 1_000, 300):
+        columns = make_columns(n_agents=n_agents)
+        pairs = len(set(zip(columns[0], columns[1])))
+
+        for store in ("compact", "dict"):
+            seq_s, seq = run_apply_event(store, *columns)
+            loop_s, _ = run_kernel_loop(store, *columns)
+            bulk_s, bulk = run_apply_events(store, *columns)
+
+            assert _dump(bulk) == _dump(seq), "apply_events diverged from apply_event"
+
+            print(
+                f"{n_agents:>5} agents, {pairs:>7,} pairs, {store:>7}: "
+                f"apply_event {seq_s:5.2f} s | "
+                f"kernel loop {loop_s:5.2f} s ({seq_s / loop_s:.1f}x) | "
+                f"apply_events {bulk_s:5.2f} s ({seq_s / bulk_s:.1f}x)"
+            )
@@ -0,0 +1,101 @@
+# tests/bench_relationship_storage.py
+
+import random
+import time
+import tracemalloc
+
+from ghost.engine import GhostEngine
+
+
+# ------------------------------------------------------------
+# WORKLOAD
+# ------------------------------------------------------------
+def make_pairs(n_agents=20_000, n_edges=200_000, seed=7):
+    random.seed(seed)
+
+    agents = [f"N{i}" for i in range(n_agents)]
+    pairs = set()
+
+    while len(pairs) < n_edges:
+        a, b = random.sample(agents, 2)
+        pairs.add((a, b))
+
+    return list(pairs)
+
+
+# ------------------------------------------------------------
+# RUNNER
+# ------------------------------------------------------------
+def run_storage(store, pairs, updates=200_000, seed=7):
+    random.seed(seed)
+
+    # memory: one edge per pair
+    tracemalloc.start()
+    e = GhostEngine({"relationship_store": store})
+    for a, b in pairs:
+        e.relationships.apply_delta(a, b, {"trust": 0.1, "attachment": 0.05})
+
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # build throughput (tracemalloc off)
+    e = GhostEngine({"relationship_store": store})
+    rels = e.relationships
+
+    t0 = time.perf_counter()
+    for a, b in pairs:
+        rels.apply_delta(a, b, {"trust": 0.1, "attachment": 0.05})
+    build_s = time.perf_counter() - t0
+
+    # updates on existing edges
+    sample = [random.choice(pairs) for _ in range(updates)]
+    apply_delta = rels.apply_delta
+    deltas = {"trust": -0.05}
+
+    t0 = time.perf_counter()
+    for a, b in sample:
+        apply_delta(a, b, deltas)
+    update_s = time.perf_counter() - t0
+
+    # reads
+    get = rels.get
+
+    t0 = time.perf_counter()
+    for a, b in sample:
+        get(a, b)
+    read_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    rels.tick()
+    tick_s = time.perf_counter() - t0
+
+    return {
+        "store": store,
+        "bytes_per_edge": mem / len(pairs),
+        "build_ips": len(pairs) / build_s,
+        "update_ips": updates / update_s,
+        "read_ips": updates / read_s,
+        "tick_ms": tick_s * 1e3,
+    }
+
+
+# ------------------------------------------------------------
+# ENTRYPOINT
+# ------------------------------------------------------------
+if __name__ == "__main__":
+
+    print("\n=== RELATIONSHIP STORAGE ===\n")
+
+    pairs = make_pairs()
+
+    for store in ("dict", "compact"):
+        r = run_storage(store, pairs)
+
+        print(
+            f"[{r['store']:>7}] "
+            f"mem/edge={r['bytes_per_edge']:,.0f}B "
+            f"| build={r['build_ips']:,.0f}/s "
+            f"| apply_delta={r['update_ips']:,.0f}/s "
+            f"| get={r['read_ips']:,.0f}/s "
+            f"| tick={r['tick_ms']:.1f}ms"
+        )
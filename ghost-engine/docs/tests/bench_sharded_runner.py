@@ -0,0 +1,176 @@
+# tests/bench_sharded_runner.py
+
+import json
+import os
+import random
+import time
+from collections import Counter
+
+from ghost.engine import GhostEngine
+from ghost.sharding import ShardedRunner, _LocalShard, _Shard
+
+
+# ------------------------------------------------------------
+# WORKLOAD (bench_runtime_stress.py: apply_event, then tick(dt))
+# ------------------------------------------------------------
+KINDS = ("conflict", "support", "betrayal", "alliance", "argue")
+
+
+def make_ticks(n_agents=5_000, ticks=10, interactions_per_tick=10_000, seed=7, bias_existing=0.75):
+    """
+    One batch of apply_event events per tick. Targets are biased towards
+    existing neighbors, like bench_runtime_stress.choose_target.
+    """
+    rng = random.Random(seed)
+
+    agents = [f"N{i}" for i in range(n_agents)]
+    next_agent = {agents[i]: agents[(i + 1) % n_agents] for i in range(n_agents)}
+    neighbors = {}
+
+    batches = []
+
+    for _ in range(ticks):
+        batch = []
+
+        for _ in range(interactions_per_tick):
+            a = rng.choice(agents)
+            known = neighbors.get(a)
+
+            if known and rng.random() < bias_existing:
+                b = rng.choice(known)
+            else:
+                b = rng.choice(agents)
+                if b == a:
+                    b = next_agent[a]
+
+            if b not in neighbors.setdefault(a, []):
+                neighbors[a].append(b)
+                neighbors.setdefault(b, []).append(a)
+
+            batch.append({
+                "kind": rng.choice(KINDS),
+                "actor_id": a,
+                "target_id": b,
+                "payload": {"intensity": rng.random() ** 0.7},
+            })
+
+        batches.append(batch)
+
+    return batches
+
+
+# ------------------------------------------------------------
+# RUNNERS
+# ------------------------------------------------------------
+def run_sequential(batches, dt=1.0):
+    e = GhostEngine()
+    apply_event = e.apply_event
+
+    t0 = time.perf_counter()
+    for batch in batches:
+        for event in batch:
+            apply_event(event)
+        e.tick(dt=dt)
+    elapsed = time.perf_counter() - t0
+
+    return elapsed, e.snapshot()
+
+
+def run_sharded(batches, n_shards, dt=1.0):
+    with ShardedRunner(n_shards) as runner:
+        t0 = time.perf_counter()
+        for batch in batches:
+            runner.apply_events(batch)
+            runner.tick(dt=dt)
+        elapsed = time.perf_counter() - t0
+
+        return elapsed, runner.snapshot()
+
+
+def shard_times(batches, n_shards, dt=1.0):
+    """
+    In-process shards, each timed on its own: (coordinator seconds,
+    per-shard seconds, per-shard share of the rows). coordinator + the
+    slowest shard estimates the wall time on n_shards free cores, where
+    the machine has fewer.
+    """
+    busy = Counter()
+    rows = Counter()
+    send = _LocalShard.send
+    events = _Shard.events
+
+    def timed(shard, payload):
+        t0 = time.perf_counter()
+        send(shard, payload)
+        busy[shard._shard.index] += time.perf_counter() - t0
+
+    def counted(shard, orders, *columns):
+        rows[shard.index] += len(orders)
+        return events(shard, orders, *columns)
+
+    _LocalShard.send = timed
+    _Shard.events = counted
+
+    try:
+        runner = ShardedRunner(n_shards, processes=False)
+
+        t0 = time.perf_counter()
+        for batch in batches:
+            runner.apply_events(batch)
+            runner.tick(dt=dt)
+        elapsed = time.perf_counter() - t0
+    finally:
+        _LocalShard.send = send
+        _Shard.events = events
+
+    n_events = sum(map(len, batches))
+
+    return (
+        elapsed - sum(busy.values()),
+        [busy[i] for i in range(n_shards)],
+        [rows[i] / n_events for i in range(n_shards)],
+    )
+
+
+# ------------------------------------------------------------
+# ENTRYPOINT
+# ------------------------------------------------------------
+if __name__ == "__main__":
+
+    batches = make_ticks()
+    n_events = sum(map(len, batches))
+
+    print("\n=== SHARDED RUNNER (bench_runtime_stress workload) ===\n")
+    print(f"events={n_events:,} cores={os.cpu_count()}\n")
+
+    base_time, base_snap = run_sequential(batches)
+    reference = json.dumps(base_snap)
+
+    print(f"{'sequential':>12}: {n_events / base_time:>10,.0f} ev/s")
+
+    max_shards = max(2, os.cpu_count() or 1)
+    n_shards = 1
+
+    while n_shards <= max_shards:
+        elapsed, snap = run_sharded(batches, n_shards)
+
+        print(
+            f"{n_shards:>9} sh: {n_events / elapsed:>10,.0f} ev/s "
+            f"speedup={base_time / elapsed:5.2f}x "
+            f"identical={json.dumps(snap) == reference}"
+        )
+
+        n_shards *= 2
+
+    print("\nin-process shards, timed apart (estimate for free cores):\n")
+
+    for n_shards in (1, 2, 4, 8):
+        coordinator, shards, share = shard_times(batches, n_shards)
+        critical = coordinator + max(shards)
+
+        print(
+            f"{n_shards:>9} sh: rows/shard={max(share):4.0%} "
+            f"coordinator={coordinator:.3f}s "
+            f"slowest shard={max(shards):.3f}s "
+            f"est. speedup={base_time / critical:5.2f}x"
+        )
@@ -0,0 +1,90 @@
+# tests/bench_step_many.py
+
+import random
+import time
+
+from ghost.engine import GhostEngine
+
+
+# ------------------------------------------------------------
+# WORKLOAD
+# ------------------------------------------------------------
+def make_events(n_events=50_000, n_agents=2_000, seed=7):
+    random.seed(seed)
+
+    agents = [f"N{i}" for i in range(n_agents)]
+    intents = ("greet", "help", "threat", "observe")
+
+    return [
+        {
+            "source": "npc_server",
+            "intent": random.choice(intents),
+            "actor": random.choice(agents),
+            "target": random.choice(agents),
+            "intensity": random.random(),
+        }
+        for _ in range(n_events)
+    ]
+
+
+def to_columns(events):
+    return {
+        name: [e[name] for e in events]
+        for name in ("source", "intent", "actor", "target", "intensity")
+    }
+
+
+# ------------------------------------------------------------
+# RUNNERS
+# ------------------------------------------------------------
+def run_step_loop(events):
+    e = GhostEngine()
+    step = e.step
+
+    t0 = time.perf_counter()
+    for event in events:
+        step(event)
+
+    return time.perf_counter() - t0, e.snapshot()
+
+
+def run_step_many(events):
+    e = GhostEngine()
+
+    t0 = time.perf_counter()
+    e.step_many(events)
+
+    return time.perf_counter() - t0, e.snapshot()
+
+
+def run_step_many_columnar(columns):
+    e = GhostEngine()
+
+    t0 = time.perf_counter()
+    e.step_many(columns)
+
+    return time.perf_counter() - t0, e.snapshot()
+
+
+# ------------------------------------------------------------
+# ENTRYPOINT
+# ------------------------------------------------------------
+if __name__ == "__main__":
+
+    print("\n=== STEP vs STEP_MANY ===\n")
+
+    events = make_events()
+    columns = to_columns(events)
+
+    loop_s, loop_snap = run_step_loop(events)
+    many_s, many_snap = run_step_many(events)
+    cols_s, cols_snap = run_step_many_columnar(columns)
+
+    assert many_snap == loop_snap, "step_many diverged from step() loop"
+    assert cols_snap == loop_snap, "columnar step_many diverged from step() loop"
+
+    n = len(events)
+
+    print(f"step() loop:          {n / loop_s:>12,.0f} events/sec")
+    print(f"step_many(list):      {n / many_s:>12,.0f} events/sec  ({loop_s / many_s:.2f}x)")
+    print(f"step_many(columns):   {n / cols_s:>12,.0f} events/sec  ({loop_s / cols_s:.2f}x)")
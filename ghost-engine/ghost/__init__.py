@@ -9,9 +9,12 @@ from .api import GhostAPI
 
 from .engine import GhostEngine
 
+from .pool import EnginePool
+
 __all__ = [
     "GhostAPI",
     "GhostEngine",
+    "EnginePool",
     "init",
     "step",
     "reset",
@@ -24,7 +27,8 @@ _ACTIVE_ENGINE: GhostEngine | None = None
 
 def snapshot():
     """
-    Return an immutable snapshot of the active engine state.
+    Return a snapshot of the active engine state (read-only records;
+    see GhostEngine.snapshot).
     """
     if _ACTIVE_ENGINE is None:
         raise RuntimeError(
@@ -1,3 +1,11 @@
+from array import array
+from collections.abc import Mapping, MutableMapping
+
+from itertools import islice
+
+from ghost.snapshot import GrowthMarks, TouchJournal
+
+
 class AgentRegistry:
     """
     Tracks agents inside the Ghost engine.
@@ -12,24 +20,269 @@ class AgentRegistry:
         self._ctx = ctx
         self._agents = ctx.setdefault("agents", {})
 
+        # agent id -> cycle last handed out for mutation (touch order),
+        # plus the cycle of the last update to every agent at once
+        self._touched = TouchJournal()
+        self._touched_all_at = -1
+        self._grown = GrowthMarks()
+
     def ensure(self, agent_id: str):
         """
         Ensure an agent exists.
         Returns the agent state dict.
         """
 
-        return self._agents.setdefault(
-            agent_id,
-            {
+        agent = self._agents.get(agent_id)
+        stamp = self._ctx.get("cycles", 0)
+
+        # only allocate the default state for new agents
+        if agent is None:
+            self._grown.mark(stamp, len(self._agents))
+            agent = self._agents[agent_id] = {
                 "mood": 0.5,
                 "memory": {},
                 "last_intent": None,
                 "tension": 0.0,
             }
-        )
+
+        self._touched.touch(agent_id, stamp)
+
+        return agent
 
     def get(self, agent_id: str):
         return self._agents.get(agent_id)
 
     def all(self):
         return self._agents
+
+    def touch_all(self):
+        """Record a bulk update of every agent (e.g. affect recovery)."""
+        self._touched_all_at = self._ctx.get("cycles", 0)
+
+    def changed_since(self, stamp):
+        """
+        (agent_id, state) for agents touched at or after cycle `stamp`,
+        or None when every agent was updated (or the journal does not
+        reach back to `stamp`).
+        """
+        if self._touched_all_at >= stamp or not self._touched.covers(stamp):
+            return None
+
+        agents = self._agents
+        return [
+            (agent_id, agents[agent_id])
+            for agent_id in self._touched.since(stamp)
+            if agent_id in agents
+        ]
+
+    def journals(self):
+        """Change journals (see ghost.snapshot.TouchJournal)."""
+        return (self._touched,)
+
+    def created_since(self, stamp):
+        """(agent_id, state) for agents created at or after cycle `stamp`, in order."""
+        agents = self._agents
+        start = self._grown.size_at(stamp, len(agents))
+        return list(islice(agents.items(), start, None))
+
+
+class CompactAgentRegistry(AgentRegistry):
+    """
+    Array-backed agent store (ctx["agent_store"] = "compact").
+
+    Agent ids are interned to integer indices:
+    - mood / tension live in contiguous array('d') columns
+    - last_intent / memory live in parallel lists (memory allocated on first use)
+
+    ctx["agents"] is a dict-like view, so ctx["agents"][id]["mood"]
+    and snapshot() keep working.
+    """
+
+    def __init__(self, ctx: dict):
+        self._ctx = ctx
+
+        self._index = {}
+        self._ids = []
+        self._mood = array("d")
+        self._tension = array("d")
+        self._last_intent = []
+        self._memory = []
+        self._extra = {}  # index -> non-standard keys
+        self._touched = TouchJournal()
+        self._touched_all_at = -1
+        self._grown = GrowthMarks()
+
+        existing = ctx.get("agents") or {}
+
+        self._agents = AgentTable(self)
+        ctx["agents"] = self._agents
+
+        # adopt agents from a provided context
+        for agent_id, agent in existing.items():
+            view = self.ensure(agent_id)
+            for k, v in agent.items():
+                view[k] = v
+
+    def ensure(self, agent_id: str):
+        """
+        Ensure an agent exists.
+        Returns a dict-like view over the agent's columns.
+        """
+
+        i = self._index.get(agent_id)
+        stamp = self._ctx.get("cycles", 0)
+
+        if i is None:
+            i = len(self._ids)
+            self._grown.mark(stamp, i)
+            self._index[agent_id] = i
+            self._ids.append(agent_id)
+            self._mood.append(0.5)
+            self._tension.append(0.0)
+            self._last_intent.append(None)
+            self._memory.append(None)
+
+        self._touched.touch(agent_id, stamp)
+
+        return AgentView(self, i)
+
+    def get(self, agent_id: str):
+        i = self._index.get(agent_id)
+
+        if i is None:
+            return None
+
+        return AgentView(self, i)
+
+    def created_since(self, stamp):
+        ids = self._ids
+        start = self._grown.size_at(stamp, len(ids))
+        return [(ids[i], AgentView(self, i)) for i in range(start, len(ids))]
+
+
+class AgentView(MutableMapping):
+    """
+    Dict-like view of one agent in a CompactAgentRegistry.
+    """
+
+    __slots__ = ("_store", "_i")
+
+    _FIELDS = ("mood", "memory", "last_intent", "tension")
+
+    def __init__(self, store: CompactAgentRegistry, i: int):
+        self._store = store
+        self._i = i
+
+    def __getitem__(self, key):
+        store = self._store
+
+        if key == "mood":
+            return store._mood[self._i]
+
+        if key == "tension":
+            return store._tension[self._i]
+
+        if key == "last_intent":
+            return store._last_intent[self._i]
+
+        if key == "memory":
+            memory = store._memory[self._i]
+            if memory is None:
+                memory = store._memory[self._i] = {}
+            return memory
+
+        extra = store._extra.get(self._i)
+        if extra is None or key not in extra:
+            raise KeyError(key)
+
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        store = self._store
+
+        if key == "mood":
+            store._mood[self._i] = value
+        elif key == "tension":
+            store._tension[self._i] = value
+        elif key == "last_intent":
+            store._last_intent[self._i] = value
+        elif key == "memory":
+            store._memory[self._i] = value
+        else:
+            store._extra.setdefault(self._i, {})[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELDS:
+            raise TypeError(f"cannot delete core agent field: {key}")
+
+        extra = self._store._extra.get(self._i)
+        if extra is None or key not in extra:
+            raise KeyError(key)
+
+        del extra[key]
+
+    def __iter__(self):
+        yield from self._FIELDS
+        yield from self._store._extra.get(self._i, ())
+
+    def __len__(self):
+        return len(self._FIELDS) + len(self._store._extra.get(self._i, ()))
+
+    def __repr__(self):
+        return repr(self._plain())
+
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(self._plain(), memo)
+
+    def _plain(self) -> dict:
+        """Plain dict copy (does not allocate an unused memory dict)."""
+        store = self._store
+        i = self._i
+        memory = store._memory[i]
+
+        out = {
+            "mood": store._mood[i],
+            "memory": {} if memory is None else memory,
+            "last_intent": store._last_intent[i],
+            "tension": store._tension[i],
+        }
+        out.update(store._extra.get(i, ()))
+
+        return out
+
+
+class AgentTable(Mapping):
+    """
+    Read-only mapping of agent id -> AgentView.
+    New agents are created through CompactAgentRegistry.ensure().
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: CompactAgentRegistry):
+        self._store = store
+
+    def __getitem__(self, agent_id):
+        i = self._store._index.get(agent_id)
+
+        if i is None:
+            raise KeyError(agent_id)
+
+        return AgentView(self._store, i)
+
+    def __contains__(self, agent_id):
+        return agent_id in self._store._index
+
+    def __iter__(self):
+        return iter(self._store._ids)
+
+    def __len__(self):
+        return len(self._store._ids)
+
+    def __repr__(self):
+        return repr({k: v._plain() for k, v in self.items()})
+
+    def __deepcopy__(self, memo):
+        import copy
+        return {k: copy.deepcopy(v._plain(), memo) for k, v in self.items()}
@@ -5,7 +5,15 @@ This wraps internal systems into a clean, stable interface
 for external developers.
 """
 
+from bisect import bisect_left
+
 from .engine import GhostEngine
+from .transitions import TransitionWatch
+
+try:
+    import numpy as np
+except ImportError:  # optional: apply_events falls back to apply_delta
+    np = None
 
 
 # -----------------------------
@@ -18,6 +26,140 @@ DEFAULT_EVENT_MAP = {
 }
 
 
+def event_deltas(event_map: dict, event: dict) -> dict:
+    """
+    Validate an event and scale its base deltas by intensity.
+    """
+    event_type, intensity = _checked(event)
+
+    return _scaled(_base_deltas(event_map, event_type), intensity)
+
+
+def _checked(event) -> tuple:
+    """(type, intensity) of an event dict; ValueError if it is malformed."""
+    if not isinstance(event, dict):
+        raise ValueError("Event must be a dict")
+
+    event_type = event.get("type")
+    intensity = event.get("intensity", 1.0)
+
+    if not isinstance(intensity, (int, float)):
+        raise ValueError("Event intensity must be numeric")
+
+    return event_type, intensity
+
+
+def _base_deltas(event_map: dict, event_type) -> dict:
+    if event_type not in event_map:
+        raise ValueError(f"Unknown event type: {event_type}")
+
+    return event_map[event_type]
+
+
+def _scaled(base_deltas: dict, intensity) -> dict:
+    return {k: v * intensity for k, v in base_deltas.items()}
+
+
+class EventKernels:
+    """
+    An event map compiled into one kernel per event type.
+
+    A kernel knows up front which relationship fields its type touches:
+    types that only move trust and/or attachment are applied through
+    RelationshipGraph.apply_core_delta (fixed float updates, no dict
+    walk); any other type keeps the generic apply_delta path.
+
+    Kernels are compiled when the map is assigned. Each keeps a copy of
+    the deltas it was compiled from and is recompiled on use when the
+    map's entry no longer equals it, so entries added, replaced, removed
+    or edited in place (also in a shared map such as DEFAULT_EVENT_MAP)
+    apply exactly as apply_events applies them.
+    """
+
+    __slots__ = ("event_map", "_kernels")
+
+    def __init__(self, event_map: dict):
+        self.event_map = event_map
+        self._kernels = {kind: _compile(deltas) for kind, deltas in event_map.items()}
+
+    def apply(self, graph, source: str, target: str, event: dict):
+        """Validate an event (as event_deltas does) and apply it to graph."""
+        event_type, intensity = _checked(event)
+
+        kernel = self._kernels.get(event_type)
+
+        # a small dict compare: stale kernels never apply
+        if kernel is None or kernel[0] != self.event_map.get(event_type):
+            kernel = self._recompile(event_type)
+
+        base_deltas, trust, attachment, core = kernel
+
+        if not core:
+            graph.apply_delta(source, target, _scaled(base_deltas, intensity))
+        else:
+            graph.apply_core_delta(
+                source, target,
+                None if trust is None else trust * intensity,
+                None if attachment is None else attachment * intensity,
+            )
+
+    def _recompile(self, event_type):
+        try:
+            base_deltas = _base_deltas(self.event_map, event_type)
+        except ValueError:
+            self._kernels.pop(event_type, None)
+            raise
+
+        kernel = self._kernels[event_type] = _compile(base_deltas)
+        return kernel
+
+
+def _compile(base_deltas: dict) -> tuple:
+    """(copy of base_deltas, trust, attachment, core fields only)"""
+    base_deltas = dict(base_deltas)
+
+    # core fields only, in apply_delta's update order
+    core = tuple(base_deltas) in ((), ("trust",), ("attachment",), ("trust", "attachment"))
+
+    return base_deltas, base_deltas.get("trust"), base_deltas.get("attachment"), core
+
+
+# bulk read fields (get_relationships(as_array=True))
+_ROW_FIELDS = (
+    ("trust", "f8"),
+    ("attachment", "f8"),
+    ("stability", "f8"),
+    ("band", "u1"),
+)
+
+
+def _structured(rows, fields):
+    if np is None:
+        raise RuntimeError("as_array=True requires numpy")
+
+    return np.fromiter(rows, dtype=np.dtype(list(fields)))
+
+
+def _column(values):
+    """Event column as a list (NumPy arrays yield Python scalars)."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+
+    return values if isinstance(values, list) else list(values)
+
+
+def _check_intensities(intensities):
+    if np is not None and isinstance(intensities, np.ndarray):
+        # bool, integer and float dtypes
+        if intensities.dtype.kind not in "biuf":
+            raise ValueError("Event intensity must be numeric")
+        return
+
+    for kind in set(map(type, intensities)):
+        if not issubclass(kind, (int, float)):
+            raise ValueError("Event intensity must be numeric")
+
+
 class GhostAPI:
 
     # -----------------------------
@@ -31,34 +173,103 @@ class GhostAPI:
         "loyal": 1.0,
     }
 
+    # state bands, in trust order (bulk reads report band indexes)
+    STATES = ("hostile", "unfriendly", "neutral", "friendly", "loyal")
+
     def __init__(self, config: dict | None = None, event_map: dict | None = None):
         self.engine = GhostEngine(config or {})
         self._transitions = {}  # NEW
         self.event_map = event_map or DEFAULT_EVENT_MAP
 
+        # push-based transitions (see subscribe_transitions)
+        self._subscribers = []
+        self._watch = None
+
     # -----------------------------
     # CORE METHOD (THIS IS YOUR PRODUCT)
     # -----------------------------
+    @property
+    def event_map(self) -> dict:
+        return self._events.event_map
+
+    @event_map.setter
+    def event_map(self, event_map: dict):
+        # compiled once here, not per event
+        self._events = EventKernels(event_map)
+
     def apply_event(self, source: str, target: str, event: dict):
-        if not isinstance(event, dict):
-            raise ValueError("Event must be a dict")
+        self._events.apply(self.engine.relationships, source, target, event)
 
-        event_type = event.get("type")
-        intensity = event.get("intensity", 1.0)
-        
-        if not isinstance(intensity, (int, float)):
-            raise ValueError("Event intensity must be numeric")
+    def apply_events(self, sources, targets, types, intensities=None):
+        """
+        Apply a batch of events given as parallel columns (sequences or
+        NumPy arrays). Event i is
+
+            apply_event(sources[i], targets[i],
+                        {"type": types[i], "intensity": intensities[i]})
+
+        with intensities defaulting to 1.0. Intensities are what
+        apply_event takes: Python bools, ints and floats, or a NumPy
+        array of a bool, integer or float dtype (bools act as 0 / 1).
+        The whole batch is validated before anything is applied.
+
+        Scaled deltas are computed once per event type as vectors, then
+        applied in order through RelationshipGraph.apply_deltas: the
+        result is identical to calling apply_event for every event.
+
+        The bulk path is built for the compact store
+        ({"relationship_store": "compact"}), whose columns take the
+        vectors directly. The dict store gives the same result, but it
+        still reads and writes one record dict per edge, so it gains
+        much less (see docs/testing.md).
+        """
+        sources = _column(sources)
+        targets = _column(targets)
+        types = _column(types)
+        n = len(sources)
 
-        if event_type not in self.event_map:
-            raise ValueError(f"Unknown event type: {event_type}")
+        if intensities is None:
+            intensities = [1.0] * n
+        elif not (np is not None and isinstance(intensities, np.ndarray)):
+            intensities = _column(intensities)
 
-        base_deltas = self.event_map[event_type]
+        if not len(targets) == len(types) == len(intensities) == n:
+            raise ValueError("Event columns must have the same length")
 
-        scaled_deltas = {
-            k: v * intensity for k, v in base_deltas.items()
-        }
+        # ---- bulk validation ----
+        event_map = self.event_map
+        kinds = list(dict.fromkeys(types))
+
+        for kind in kinds:
+            _base_deltas(event_map, kind)
+
+        _check_intensities(intensities)
+
+        fields = list(dict.fromkeys(k for kind in kinds for k in event_map[kind]))
+        graph = self.engine.relationships
+
+        # custom delta keys need one apply_delta per event
+        if np is None or not set(fields) <= set(graph.BULK_FIELDS):
+            apply_delta = graph.apply_delta
+
+            for source, target, kind, intensity in zip(sources, targets, types, _column(intensities)):
+                apply_delta(source, target, _scaled(event_map[kind], intensity))
 
-        self.engine.relationships.apply_delta(source, target, scaled_deltas)
+            return
+
+        # ---- scaled delta vectors, per event type ----
+        kind_ids = {kind: i for i, kind in enumerate(kinds)}
+        kind_of = np.fromiter(map(kind_ids.__getitem__, types), dtype=np.intp, count=n)
+        scale = np.asarray(intensities, dtype=np.float64)
+
+        columns = {}
+        for field in fields:
+            present = np.array([field in event_map[kind] for kind in kinds], dtype=bool)
+            base = np.array([event_map[kind].get(field, 0.0) for kind in kinds], dtype=np.float64)
+
+            columns[field] = (present[kind_of], base[kind_of] * scale)
+
+        graph.apply_deltas(sources, targets, columns)
         
     def tick(self):
         """
@@ -66,6 +277,53 @@ class GhostAPI:
         """
         self.engine.relationships.tick()
     
+    # -----------------------------
+    # TRANSITION SUBSCRIPTIONS
+    # -----------------------------
+    def subscribe_transitions(self, subscriber):
+        """
+        Push state transitions to `subscriber` (a callable, or a
+        queue-like object with put()) as apply_event / tick cause them:
+
+            {"event", "from", "to", "a", "b", "trust"}
+
+        ("event" is the trigger get_relationship would report). Only
+        edges whose trust crossed a STATE_THRESHOLDS boundary are
+        reported; polling state (get_relationship) is not touched.
+        Returns the subscriber.
+        """
+        self._subscribers.append(subscriber)
+
+        if self._watch is None:
+            self._watch = TransitionWatch(
+                self.engine.relationships,
+                self._state_bounds(),
+                self.STATES,
+                self._emit_transition,
+            )
+
+        return subscriber
+
+    def unsubscribe_transitions(self, subscriber):
+        self._subscribers.remove(subscriber)
+
+        if not self._subscribers:
+            self._watch.close()
+            self._watch = None
+
+    def _emit_transition(self, a, b, prev, new, trust):
+        trigger = self._handle_transition(a, b, (prev, new))
+        trigger.update(a=a, b=b, trust=self._clamp(trust))
+
+        for subscriber in list(self._subscribers):
+            put = getattr(subscriber, "put", None)
+            (subscriber if put is None else put)(dict(trigger))
+
+    def _state_bounds(self) -> tuple:
+        """Upper (inclusive) trust bound of every state band but the last."""
+        t = self.STATE_THRESHOLDS
+        return t["hostile"], t["unfriendly"], t["neutral"], t["friendly"]
+
     def _clamp(self, value, min_v=-1.0, max_v=1.0):
         return max(min(value, max_v), min_v)
 
@@ -177,6 +435,70 @@ class GhostAPI:
             "trigger": trigger,
         }
 
+    # -----------------------------
+    # BULK READS (READ-ONLY)
+    # -----------------------------
+    def get_relationships(self, pairs, as_array: bool = False):
+        """
+        Read many relationships at once: one
+        (trust, attachment, stability, state) tuple per (a, b) pair,
+        valued as get_relationship() values them (unknown pairs read as
+        neutral zeros).
+
+        Mutates nothing (no transition tracking, no lazy decay
+        catch-up, no journal) and allocates no per-pair dict.
+
+        as_array=True returns a NumPy structured array instead, with
+        fields trust, attachment, stability and band (index into STATES).
+        """
+        rows = self._rows(self.engine.relationships.peek_many(pairs), as_array)
+
+        return _structured(rows, _ROW_FIELDS) if as_array else list(rows)
+
+    def get_relationships_for(self, agent: str, as_array: bool = False):
+        """
+        Every relationship of `agent`, in neighbor order, as
+        (other, trust, attachment, stability, state) tuples.
+        Read-only, like get_relationships(); as_array=True adds an
+        "agent" (object) field in front of its fields.
+        """
+        peeks = self.engine.relationships.peek_neighbors(agent)
+        rows = self._rows(peeks, as_array, keyed=True)
+
+        if as_array:
+            return _structured(rows, (("agent", object),) + _ROW_FIELDS)
+
+        return list(rows)
+
+    def _rows(self, peeks, bands: bool, keyed: bool = False):
+        """
+        Row tuples from peeks: (trust, attachment) or None, or
+        (key, trust, attachment) when keyed. States are band indexes
+        when `bands`.
+        """
+        bounds = self._state_bounds()
+        labels = range(len(self.STATES)) if bands else self.STATES
+        neutral = (0.0, 0.0, 0.0, labels[bisect_left(bounds, 0.0)])
+
+        for peek in peeks:
+            if peek is None:
+                yield neutral
+                continue
+
+            if keyed:
+                key, trust, attachment = peek
+            else:
+                trust, attachment = peek
+
+            trust = max(min(trust, 1.0), -1.0)
+            attachment = max(min(attachment, 1.0), -1.0)
+            state = labels[bisect_left(bounds, trust)]
+
+            if keyed:
+                yield key, trust, attachment, abs(trust), state
+            else:
+                yield trust, attachment, abs(trust), state
+
     # -----------------------------
     # OPTIONAL: BULK SNAPSHOT
     # -----------------------------
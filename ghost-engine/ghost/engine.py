@@ -1,7 +1,16 @@
 from dataclasses import asdict
 from ghost.step import GhostStep
-from ghost.agents import AgentRegistry
-from ghost.relationships import RelationshipGraph
+from collections import deque
+from collections.abc import Mapping
+from ghost.agents import AgentRegistry, CompactAgentRegistry
+from ghost.export import write_edge_list, write_gexf, write_graphml
+from ghost.factions import FactionIndex
+from ghost.metrics import RelationshipMetrics
+from ghost.propagation import ThreatPropagation
+from ghost.relationships import CompactRelationshipGraph, RelationshipGraph
+from itertools import islice
+from ghost.snapshot import GrowthMarks, SnapshotCache, TouchJournal, build_delta
+from ghost.topk import TrustIndex
 
 def _json_safe(x):
 
@@ -17,12 +26,117 @@ def _json_safe(x):
     if isinstance(x, set):
         return sorted(_json_safe(v) for v in x)
 
+    # dict-like views (compact stores)
+    if isinstance(x, Mapping):
+        return {str(k): _json_safe(v) for k, v in x.items()}
+
     return x
 
 def clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+def _clamp01(value: float) -> float:
+    # Exactly clamp(value, 0.0, 1.0) (including NaN / -0.0), without the builtin calls
+    value = value if value < 1.0 else 1.0
+    return value if value > 0.0 else 0.0
+
+
+def _clamp_threat(value: float) -> float:
+    # Exactly clamp(value, 0.0, 999999.0)
+    value = value if value < 999999.0 else 999999.0
+    return value if value > 0.0 else 0.0
+
+
+_STEP_FIELDS = frozenset(("source", "intent", "actor", "target", "intensity"))
+
+
+def _step_row(event: dict):
+    """
+    (intent, actor, target, intensity) of a dict step, validated as
+    GhostStep(**event) would be, without building the dataclass.
+    """
+    if "source" not in event or not _STEP_FIELDS.issuperset(event):
+        GhostStep(**event)  # raises GhostStep's own TypeError
+
+    return (
+        event.get("intent"),
+        event.get("actor", "unknown"),
+        event.get("target"),
+        event.get("intensity", 0.0),
+    )
+
+
+def _columns(events: dict):
+    """
+    Validate columnar step input (same required fields and defaults as
+    GhostStep). Returns (rows, columns): the row columns in order
+    intent, actor, target, intensity, and the given columns as plain
+    Python lists (numpy columns are converted, so no numpy scalar
+    reaches the public state).
+    """
+    if "source" not in events:
+        raise TypeError("columnar step input requires a 'source' column")
+
+    unknown = set(events) - _STEP_FIELDS
+    if unknown:
+        raise TypeError(f"unknown step columns: {sorted(unknown)}")
+
+    columns = {
+        name: column.tolist() if hasattr(column, "tolist") else column
+        for name, column in events.items()
+    }
+
+    n = len(columns["source"])
+
+    for name, column in columns.items():
+        if len(column) != n:
+            raise ValueError(f"column '{name}' has length {len(column)}, expected {n}")
+
+    rows = (
+        columns.get("intent", (None,) * n),
+        columns.get("actor", ("unknown",) * n),
+        columns.get("target", (None,) * n),
+        columns.get("intensity", (0.0,) * n),
+    )
+
+    return rows, columns
+
+
+# greet / help share one shape:
+# (actor mood, actor tension, target mood, target tension, relationship deltas, threat)
+_SUPPORT_EFFECTS = {
+    "greet": (0.02, -0.01, 0.03, -0.01, {"trust": 0.02, "attachment": 0.01}, -0.02),
+    "help": (0.04, -0.02, 0.08, -0.04, {"trust": 0.05, "attachment": 0.02}, -0.05),
+}
+
+_THREAT_DELTAS = {"trust": -0.08}
+
+# runtime event kinds (apply_event), same shape as _SUPPORT_EFFECTS:
+# (actor mood, actor tension, target mood, target tension, relationship deltas, hostile)
+_EVENT_KINDS = {
+    "conflict": (-0.03, 0.05, -0.06, 0.08, {"trust": -0.06}, True),
+    "argue": (-0.01, 0.03, -0.02, 0.04, {"trust": -0.03}, True),
+    "betrayal": (-0.02, 0.04, -0.10, 0.12, {"trust": -0.15, "attachment": -0.05}, True),
+    "support": (0.03, -0.02, 0.05, -0.03, {"trust": 0.05, "attachment": 0.02}, False),
+    "alliance": (0.02, -0.01, 0.04, -0.02, {"trust": 0.08, "attachment": 0.05}, False),
+}
+
+# trust bands (GhostAPI.STATE_THRESHOLDS "friendly" / "hostile")
+_STRONG_TRUST = 0.2
+_HOSTILE_TRUST = -0.2
+
+# a hostile event that breaks a relationship (trust crosses into the
+# hostile band) cascades to this many of the target's neighbors
+_CASCADE_FANOUT = 8
+
+# runtime tick(): agent mood / tension relax towards baseline (0.5 / 0.0)
+# by this factor per unit of time
+_AFFECT_RECOVERY = 0.9
+
+_NO_EVENT = object()
+
+
 class GhostEngine:
     """
     Core Ghost engine.
@@ -39,8 +153,28 @@ class GhostEngine:
         self._ctx = context
 
         # Subsystems
-        self.agents = AgentRegistry(self._ctx)
-        self.relationships = RelationshipGraph(self._ctx)
+        agent_store = self._ctx.get("agent_store", "dict")
+
+        if agent_store == "dict":
+            self.agents = AgentRegistry(self._ctx)
+        elif agent_store == "compact":
+            self.agents = CompactAgentRegistry(self._ctx)
+        else:
+            raise ValueError(f"Unknown agent_store: {agent_store}")
+
+        relationship_store = self._ctx.get("relationship_store", "dict")
+
+        if relationship_store == "dict":
+            self.relationships = RelationshipGraph(self._ctx)
+        elif relationship_store == "compact":
+            self.relationships = CompactRelationshipGraph(self._ctx)
+        else:
+            raise ValueError(f"Unknown relationship_store: {relationship_store}")
+
+        # Who a threat in step() unsettles besides its target
+        self.propagation = ThreatPropagation.from_ctx(
+            self._ctx, self.relationships, self.top_trusted
+        )
 
         # Baseline state
         self._ctx.setdefault("cycles", 0)
@@ -51,6 +185,27 @@ class GhostEngine:
         npc.setdefault("threat_level", 0.0)
         npc.setdefault("last_intent", None)
 
+        # Incremental snapshots: change journals record from the first
+        # snapshot on, back to the oldest of the last `snapshot_history`
+        # snapshot / delta cycles (older deltas resend whole sections)
+        self._actors_touched = TouchJournal()
+        self._actors_grown = GrowthMarks()
+        self._snapshots = SnapshotCache()
+        self._snapshot_marks = deque(maxlen=max(1, self._ctx.get("snapshot_history", 8)))
+
+        # Derived indexes (built on first use)
+        self._factions = None
+        self._metrics = None
+        self._trust_index = None
+
+        # Threat propagation in step(): propagations that reached a
+        # neighbor, neighbors reached in total / by the last threat / by
+        # the widest one (not part of the public state)
+        self._threat_cascades = 0
+        self._threat_reach = 0
+        self._threat_last_reach = 0
+        self._threat_max_reach = 0
+
     def step(self, step_data=None):
         """
         Advance the Ghost engine by one cycle.
@@ -62,132 +217,453 @@ class GhostEngine:
         Internal types MUST NOT leak into public state.
         """
 
-        ctx = self._ctx
-        ctx["cycles"] += 1
+        self._advance((step_data,))
+        return self._ctx
 
-        npc = ctx["npc"]
-        
-        # passive decay (only if no threat this step)
-        if step_data is None:
-            npc["threat_level"] = clamp(npc["threat_level"] - 0.02, 0.0, 999999.0)
+    def step_many(self, events):
+        """
+        Advance the Ghost engine by one cycle per event, in order.
+
+        Accepts:
+        - list of step inputs (dict / GhostStep / None), same as step()
+        - dict of columns: {"actor": [...], "intent": [...],
+          "target": [...], "intensity": [...], "source": [...]}
+          ("source" is required; the rest default as in GhostStep)
+
+        Semantics are identical to calling step() for every event.
+        Only the final input is recorded in ctx["input"] / ctx["last_step"].
+
+        Speed: step_many() pays step()'s per-call setup (hoisting engine
+        state, recording the input) once per batch; the per-event work
+        is shared with step(). On docs/tests/bench_step_many.py a batch
+        runs about 1.1-1.3x faster than a step() loop, for list and
+        columnar input alike.
+        """
+
+        if isinstance(events, dict):
+            rows, columns = _columns(events)
+            self._advance(zip(*rows), columns)
+        else:
+            self._advance(events)
 
-        step: GhostStep | None = None
-        public_input: dict | None = None
-        
-        
+        return self._ctx
+
+    def _advance(self, events, columns=None):
+        """
+        Shared step loop.
 
-        # ---- Normalize input at boundary ----
-        if step_data is not None:
-            if isinstance(step_data, dict):
-                step = GhostStep(**step_data)
-                public_input = dict(step_data)
+        Engine state is hoisted into locals for the whole batch and
+        written back once.
+        """
 
-            elif isinstance(step_data, GhostStep):
-                step = step_data
-                public_input = asdict(step)
+        ctx = self._ctx
+        npc = ctx["npc"]
 
-            else:
-                raise TypeError("step_data must be dict or GhostStep")
+        ensure = self.agents.ensure
+        apply_delta = self.relationships.apply_delta
+        neighbors_of = self.relationships.neighbors
+        propagation = self.propagation
+        unbounded = propagation.unbounded
+
+        # emotional modulation (read once per batch, on first threat)
+        mood_gain = None
+
+        cycles = ctx["cycles"]
+        threat_level = npc["threat_level"]
+        last_intent = npc["last_intent"]
+
+        last_event = _NO_EVENT
+        count = 0
+
+        threat_cascades = self._threat_cascades
+        threat_reach = self._threat_reach
+        threat_last_reach = self._threat_last_reach
+        threat_max_reach = self._threat_max_reach
+
+        try:
+            for event in events:
+                # journals stamp this step's changes with the cycle it
+                # starts from, as a lone step() does
+                ctx["cycles"] = stamp = cycles
+                cycles += 1
+
+                # passive decay (only if no threat this step)
+                if event is None:
+                    threat_level = _clamp_threat(threat_level - 0.02)
+                    continue
+
+                # ---- Normalize input at boundary ----
+                if columns is not None:
+                    intent, actor, target, intensity = event
+                    count += 1
+                elif isinstance(event, dict):
+                    intent, actor, target, intensity = _step_row(event)
+                elif isinstance(event, GhostStep):
+                    intent, actor, target, intensity = (
+                        event.intent, event.actor, event.target, event.intensity
+                    )
+                else:
+                    raise TypeError("step_data must be dict or GhostStep")
+
+                last_event = event
+                last_intent = intent
+
+                # Ensure actor exists
+                actor_state = ensure(actor)
+                actor_state["last_intent"] = intent
+
+                # Optional target
+                target_state = None
+                if target:
+                    target_state = ensure(target)
+                    target_state["last_intent"] = intent
+
+                intensity = _clamp01(float(intensity))
+
+                # ---- Intent handling ----
+                if intent == "greet" or intent == "help":
+                    (
+                        actor_mood, actor_tension,
+                        target_mood, target_tension,
+                        deltas, threat_delta,
+                    ) = _SUPPORT_EFFECTS[intent]
+
+                    actor_state["mood"] = _clamp01(actor_state["mood"] + (actor_mood * intensity))
+                    actor_state["tension"] = _clamp01(actor_state["tension"] + (actor_tension * intensity))
+
+                    if target_state is not None:
+                        target_state["mood"] = _clamp01(target_state["mood"] + (target_mood * intensity))
+                        target_state["tension"] = _clamp01(target_state["tension"] + (target_tension * intensity))
+
+                        apply_delta(actor, target, deltas)
+
+                    threat_level = _clamp_threat(threat_level + (threat_delta * intensity))
+
+                elif intent == "threat":
+                    actor_state["mood"] = _clamp01(actor_state["mood"] - (0.05 * intensity))
+
+                    # actor memory invariant (public-facing)
+                    actors_mem = npc.setdefault("actors", {})
+                    entry = actors_mem.get(actor)
+                    if entry is None:
+                        self._actors_grown.mark(stamp, len(actors_mem))
+                        entry = actors_mem[actor] = {}
+                    entry["threat_count"] = entry.get("threat_count", 0) + 1
+                    self._actors_touched.touch(actor, stamp)
+
+                    actor_state["tension"] = _clamp01(actor_state["tension"] + (0.06 * intensity))
+
+                    if target_state is not None:
+                        target_state["mood"] = _clamp01(target_state["mood"] - (0.12 * intensity))
+                        target_state["tension"] = _clamp01(target_state["tension"] + (0.18 * intensity))
+
+                        apply_delta(actor, target, _THREAT_DELTAS)
+
+                        # ---- bounded propagation to target neighbors ----
+                        spread = 0.25 * intensity
+                        mood_drop = 0.03 * spread
+                        tension_rise = 0.08 * spread
+                        reached = 0
+
+                        if unbounded:
+                            for neighbor_id in neighbors_of(target):
+                                if neighbor_id == actor or neighbor_id == target:
+                                    continue
+
+                                neighbor_state = ensure(neighbor_id)
+                                neighbor_state["mood"] = _clamp01(neighbor_state["mood"] - mood_drop)
+                                neighbor_state["tension"] = _clamp01(neighbor_state["tension"] + tension_rise)
+                                reached += 1
+                        else:
+                            for neighbor_id, scale in propagation.reach(actor, target):
+                                neighbor_state = ensure(neighbor_id)
+                                neighbor_state["mood"] = _clamp01(neighbor_state["mood"] - (mood_drop * scale))
+                                neighbor_state["tension"] = _clamp01(neighbor_state["tension"] + (tension_rise * scale))
+                                reached += 1
+
+                        threat_last_reach = reached
+
+                        if reached:
+                            threat_cascades += 1
+                            threat_reach += reached
+
+                            if reached > threat_max_reach:
+                                threat_max_reach = reached
+
+                    # emotional modulation (public invariant)
+                    if mood_gain is None:
+                        mood_gain = 0.5 + ctx.get("state", {}).get("mood", 0.5)
+
+                    gain = 0.50 * intensity * mood_gain
+
+                    threat_level = _clamp_threat(threat_level + gain)
+
+                else:
+                    # Unknown or neutral intent -> mild decay only
+                    threat_level = _clamp_threat(threat_level - 0.01)
+
+        finally:
+            ctx["cycles"] = cycles
+            npc["threat_level"] = threat_level
+            self._threat_cascades = threat_cascades
+            self._threat_reach = threat_reach
+            self._threat_last_reach = threat_last_reach
+            self._threat_max_reach = threat_max_reach
+            npc["last_intent"] = last_intent
 
             # Public-facing state (DICT ONLY)
-            ctx["input"] = public_input
-            ctx["last_step"] = public_input
+            if last_event is not _NO_EVENT:
+                if columns is not None:
+                    public_input = {
+                        name: column[count - 1] for name, column in columns.items()
+                    }
+                elif isinstance(last_event, GhostStep):
+                    public_input = asdict(last_event)
+                else:
+                    public_input = dict(last_event)
+
+                ctx["input"] = public_input
+                ctx["last_step"] = public_input
+
+    # -----------------------------
+    # RUNTIME SURFACE
+    # -----------------------------
+    def apply_event(self, event: dict):
+        """
+        Apply one social interaction between two agents.
 
-        # If no step, just return current state
-        if step is None:
-            return ctx
+        event = {
+            "kind": "conflict" | "support" | "betrayal" | "alliance" | "argue",
+            "actor_id": str,
+            "target_id": str,
+            "payload": {"intensity": float},   # optional, default 1.0
+        }
 
-        npc["last_intent"] = step.intent
+        Unlike step(), this does not advance cycles or touch npc state.
+        """
+        if not isinstance(event, dict):
+            raise ValueError("Event must be a dict")
 
-        # Ensure actor exists
-        actor_state = self.agents.ensure(step.actor)
-        actor_state["last_intent"] = step.intent
+        kind = event.get("kind")
+        if kind not in _EVENT_KINDS:
+            raise ValueError(f"Unknown event kind: {kind}")
 
-        # Optional target
-        target_state = None
-        if step.target:
-            target_state = self.agents.ensure(step.target)
-            target_state["last_intent"] = step.intent
+        actor = event.get("actor_id")
+        target = event.get("target_id")
+        if not actor or not target:
+            raise ValueError("Event requires actor_id and target_id")
 
-        intensity = clamp(float(step.intensity), 0.0, 1.0)
+        intensity = (event.get("payload") or {}).get("intensity", 1.0)
+        if not isinstance(intensity, (int, float)):
+            raise ValueError("Event intensity must be numeric")
 
-        # ---- Intent handling ----
-        if step.intent == "greet":
-            actor_state["mood"] = clamp(actor_state["mood"] + (0.02 * intensity), 0.0, 1.0)
-            actor_state["tension"] = clamp(actor_state["tension"] - (0.01 * intensity), 0.0, 1.0)
+        intensity = clamp(float(intensity), 0.0, 1.0)
 
-            if target_state is not None:
-                target_state["mood"] = clamp(target_state["mood"] + (0.03 * intensity), 0.0, 1.0)
-                target_state["tension"] = clamp(target_state["tension"] - (0.01 * intensity), 0.0, 1.0)
+        (
+            actor_mood, actor_tension,
+            target_mood, target_tension,
+            deltas, hostile,
+        ) = _EVENT_KINDS[kind]
 
-                self.relationships.apply_delta(
-                    step.actor,
-                    step.target,
-                    {"trust": 0.02, "attachment": 0.01},
-                )
+        actor_state = self.agents.ensure(actor)
+        target_state = self.agents.ensure(target)
 
-            npc["threat_level"] = clamp(npc["threat_level"] - (0.02 * intensity), 0.0, 999999.0)
+        actor_state["mood"] = _clamp01(actor_state["mood"] + (actor_mood * intensity))
+        actor_state["tension"] = _clamp01(actor_state["tension"] + (actor_tension * intensity))
+        target_state["mood"] = _clamp01(target_state["mood"] + (target_mood * intensity))
+        target_state["tension"] = _clamp01(target_state["tension"] + (target_tension * intensity))
 
-        elif step.intent == "help":
-            actor_state["mood"] = clamp(actor_state["mood"] + (0.04 * intensity), 0.0, 1.0)
-            actor_state["tension"] = clamp(actor_state["tension"] - (0.02 * intensity), 0.0, 1.0)
+        relationships = self.relationships
+        before = relationships.trust(actor, target) if hostile else None
 
-            if target_state is not None:
-                target_state["mood"] = clamp(target_state["mood"] + (0.08 * intensity), 0.0, 1.0)
-                target_state["tension"] = clamp(target_state["tension"] - (0.04 * intensity), 0.0, 1.0)
+        rel = relationships.apply_delta(
+            actor, target, {k: v * intensity for k, v in deltas.items()}
+        )
 
-                self.relationships.apply_delta(
-                    step.actor,
-                    step.target,
-                    {"trust": 0.05, "attachment": 0.02},
-                )
+        if hostile and (before is None or before > _HOSTILE_TRUST):
+            if rel["pos"] - rel["neg"] <= _HOSTILE_TRUST:
+                self._cascade(actor, target, intensity)
 
-            npc["threat_level"] = clamp(npc["threat_level"] - (0.05 * intensity), 0.0, 999999.0)
+    def _cascade(self, actor, target, intensity: float):
+        """A relationship broke: unsettle (a bounded number of) the target's neighbors."""
+        ctx = self._ctx
+        ctx["cascade_events"] = ctx.get("cascade_events", 0) + 1
 
-        elif step.intent == "threat":
-            actor_state["mood"] = clamp(actor_state["mood"] - (0.05 * intensity), 0.0, 1.0)
-            
-            # actor memory invariant (public-facing)
-            actors_mem = npc.setdefault("actors", {})
-            entry = actors_mem.setdefault(step.actor, {})
-            entry["threat_count"] = entry.get("threat_count", 0) + 1
-            
-            actor_state["tension"] = clamp(actor_state["tension"] + (0.06 * intensity), 0.0, 1.0)
+        mood_drop = 0.01 * intensity
+        tension_rise = 0.03 * intensity
 
-            if target_state is not None:
-                target_state["mood"] = clamp(target_state["mood"] - (0.12 * intensity), 0.0, 1.0)
-                target_state["tension"] = clamp(target_state["tension"] + (0.18 * intensity), 0.0, 1.0)
+        ensure = self.agents.ensure
+        reached = 0
 
-                self.relationships.apply_delta(
-                    step.actor,
-                    step.target,
-                    {"trust": -0.08},
-                )
+        for neighbor_id in self.relationships.neighbors(target):
+            if neighbor_id == actor or neighbor_id == target:
+                continue
 
-                # ---- bounded propagation to target neighbors ----
-                neighbors = self.relationships.neighbors(step.target)
-                spread = 0.25 * intensity
+            neighbor_state = ensure(neighbor_id)
+            neighbor_state["mood"] = _clamp01(neighbor_state["mood"] - mood_drop)
+            neighbor_state["tension"] = _clamp01(neighbor_state["tension"] + tension_rise)
 
-                for neighbor_id in neighbors:
-                    if neighbor_id == step.actor or neighbor_id == step.target:
-                        continue
+            reached += 1
+            if reached == _CASCADE_FANOUT:
+                break
 
-                    neighbor_state = self.agents.ensure(neighbor_id)
-                    neighbor_state["mood"] = clamp(neighbor_state["mood"] - (0.03 * spread), 0.0, 1.0)
-                    neighbor_state["tension"] = clamp(neighbor_state["tension"] + (0.08 * spread), 0.0, 1.0)
+    def tick(self, dt: float = 1.0):
+        """
+        Advance runtime time by `dt`: decay every relationship by
+        decay ** dt, let agent affect recover towards baseline, and
+        refresh the global summaries (ctx["global_tension"],
+        ctx["stability_index"]).
+        """
+        self.relationships.tick(dt)
 
-            # emotional modulation (public invariant)
-            mood = ctx.get("state", {}).get("mood", 0.5)
+        recovery = _AFFECT_RECOVERY ** dt
+        self.agents.touch_all()
 
-            gain = 0.50 * intensity * (0.5 + mood)
+        tension = 0.0
+        settled = 0
+        n = 0
 
-            npc["threat_level"] = clamp(npc["threat_level"] + gain, 0.0, 999999.0)
+        for agent in self.agents.all().values():
+            agent["mood"] = 0.5 + (agent["mood"] - 0.5) * recovery
+            agent["tension"] = agent["tension"] * recovery
 
-        else:
-            # Unknown or neutral intent -> mild decay only
-            npc["threat_level"] = clamp(npc["threat_level"] - 0.01, 0.0, 999999.0)
+            tension += agent["tension"]
+            settled += agent["mood"] >= 0.5
+            n += 1
+
+        # mean tension, and the share of agents not in a low mood
+        self._ctx["global_tension"] = tension / n if n else 0.0
+        self._ctx["stability_index"] = settled / n if n else 1.0
+
+    def relationship_metrics(self) -> dict:
+        """
+        Relationship graph summary:
+        edge count, strong (trust >= 0.2) and hostile (trust <= -0.2)
+        edges, max rivalry (largest distrust), mean trust, cascades
+        (apply_event) and threat propagation from step().
+
+        Served by the streaming aggregator: O(1) between ticks.
+        """
+        summary = self.metrics_aggregator().summary()
+
+        edges = summary["edges"]
+        min_trust = summary["min_trust"]
+
+        return {
+            "edges": edges,
+            "strong_edges": summary["strong_edges"],
+            "hostile_edges": summary["hostile_edges"],
+            "max_rivalry": max(0.0, -min_trust) if edges else 0.0,
+            "mean_trust": summary["total_trust"] / edges if edges else 0.0,
+            "cascade_events": self._ctx.get("cascade_events", 0),
+            "threat_cascades": self._threat_cascades,
+            "threat_reach": self._threat_reach,
+        }
+
+    def propagation_stats(self) -> dict:
+        """
+        Threat propagation from step(), for profiling: propagations that
+        reached a neighbor, neighbors reached in total, by the last
+        threat and by the widest one.
+        """
+        return {
+            "propagations": self._threat_cascades,
+            "touched": self._threat_reach,
+            "last_touched": self._threat_last_reach,
+            "max_touched": self._threat_max_reach,
+        }
+
+    def faction_snapshot(self, agents, max_nodes: int = 400) -> dict:
+        """
+        Factions reached by (at most `max_nodes` of) the given agents.
+
+        A faction is a connected group (two or more agents) over strong
+        relationships (trust >= 0.2). Returns {"nodes", "factions",
+        "top_sizes"}; top_sizes lists the five largest faction sizes.
+        """
+        nodes = list(islice(agents, max_nodes))
+        sizes = sorted(self.faction_index().sizes(nodes).values(), reverse=True)
+
+        return {
+            "nodes": len(nodes),
+            "factions": len(sizes),
+            "top_sizes": sizes[:5],
+        }
+
+    def factions(self) -> list:
+        """Every faction as a member list, largest first."""
+        return self.faction_index().factions()
+
+    def faction_index(self) -> FactionIndex:
+        """
+        Incremental faction index over strong relationships.
+        Built on first use (one pass over the graph), then kept up to
+        date by apply_delta / tick.
+        """
+        if self._factions is None:
+            self._factions = FactionIndex(self.relationships, _STRONG_TRUST)
+
+        return self._factions
+
+    def trust_index(self) -> TrustIndex:
+        """
+        Per-agent trust ranking behind top_trusted / top_hostile.
+        Built on first use, then kept up to date by apply_delta / tick.
+        Only agents with at least ctx["trust_index_min_degree"]
+        neighbors (default 0: every agent) are indexed.
+        """
+        if self._trust_index is None:
+            self._trust_index = TrustIndex(
+                self.relationships, self._ctx.get("trust_index_min_degree", 0)
+            )
+
+        return self._trust_index
+
+    def top_trusted(self, agent, k: int = 5, skip=()):
+        """The k neighbors `agent` trusts most (none in `skip`), as (neighbor, trust)."""
+        return self.trust_index().top_trusted(agent, k, skip)
+
+    def top_hostile(self, agent, k: int = 5, skip=()):
+        """The k neighbors `agent` trusts least (none in `skip`), as (neighbor, trust)."""
+        return self.trust_index().top_hostile(agent, k, skip)
+
+    def metrics_aggregator(self) -> RelationshipMetrics:
+        """
+        Streaming trust summary behind relationship_metrics().
+        Registered on first use, then kept up to date by apply_delta /
+        tick.
+        """
+        if self._metrics is None:
+            self._metrics = RelationshipMetrics(
+                self.relationships, _STRONG_TRUST, _HOSTILE_TRUST
+            )
+
+        return self._metrics
 
-        return ctx
+    def export_relationship_graph_gexf(self, path) -> int:
+        """Stream the relationship graph to a GEXF file. Returns the edge count."""
+        return write_gexf(self.relationships, path)
+
+    def export_relationship_graph_graphml(self, path) -> int:
+        """Stream the relationship graph to a GraphML file. Returns the edge count."""
+        return write_graphml(self.relationships, path)
+
+    def export_relationship_graph_edges(self, path) -> int:
+        """
+        Stream the relationship graph to a compact binary edge list
+        (ghost.export.read_edge_list reads it back). Returns the edge count.
+        """
+        return write_edge_list(self.relationships, path)
+
+    @property
+    def _neighbors(self):
+        """Live adjacency (agent id -> neighbor ids), as the runtime exposed it."""
+        return self.relationships._neighbors
+
+    @property
+    def _rels(self):
+        """Live relationship map ("a|b" -> relationship)."""
+        return self.relationships._rels
 
     def state(self):
         """
@@ -198,6 +674,89 @@ class GhostEngine:
         return self._ctx
 
     def snapshot(self):
-        """Return an immutable snapshot of engine state."""
-        import copy
-        return _json_safe(copy.deepcopy(self._ctx))
+        """
+        Return a JSON-safe snapshot of engine state.
+
+        The snapshot and its sections (agents, relationships, neighbors,
+        npc, npc actors) are plain dicts owned by the caller: entries
+        may be added, replaced or removed. The records inside them
+        (each agent, relationship, neighbor list and actor entry) are
+        read-only and shared with other snapshots when untouched in
+        between; editing one raises TypeError.
+
+        Before incremental snapshots, records were caller-owned copies
+        too; code that edits them in place must take a mutable copy
+        first: ghost.snapshot.plain(snapshot) (or copy.deepcopy()).
+        """
+
+        # lazy decay: pending decay is part of the observable state
+        self.relationships.materialize()
+
+        snap = self._snapshots.build(self)
+        self._mark_snapshot(snap.get("cycles", 0))
+
+        return snap
+
+    def snapshot_delta(self, since_cycle: int):
+        """
+        Return what changed at or after `since_cycle` (a snapshot's "cycles").
+
+        Plain JSON-safe dict: changed agents / relationships / npc actors,
+        neighbor-list additions, npc fields and the remaining top-level
+        state. ghost.snapshot.apply_snapshot_delta(old, delta) turns the
+        snapshot taken at `since_cycle` into the current snapshot().
+        """
+
+        # lazy decay: pending decay is part of the observable state
+        self.relationships.materialize()
+
+        delta = build_delta(self, since_cycle)
+        self._mark_snapshot(delta["cycles"])
+
+        return delta
+
+    def _mark_snapshot(self, stamp):
+        # a client now holds the state of cycle `stamp`: journal from
+        # there on, and forget what no kept mark (nor the snapshot cache)
+        # can ask about
+        marks = self._snapshot_marks
+        marks.append(stamp)
+
+        floor = marks[0]
+        if self._snapshots.stamp is not None:
+            floor = min(floor, self._snapshots.stamp)
+
+        for journal in (*self.agents.journals(), self._actors_touched):
+            journal.start(stamp)
+            journal.trim(floor)
+
+        self.relationships.start_journals(stamp)
+        self.relationships.trim_journals(floor)
+
+    def invalidate_snapshot(self):
+        """
+        Force the next snapshot() to be a full rebuild.
+        Needed only after mutating state() outside the engine API.
+        """
+        self._snapshots.clear()
+
+    def actors_changed_since(self, stamp):
+        """
+        (actor_id, entry) for npc actor memory touched at or after cycle
+        `stamp`, or None when the journal does not reach back to `stamp`.
+        """
+        if not self._actors_touched.covers(stamp):
+            return None
+
+        actors = self._ctx["npc"].get("actors", {})
+        return [
+            (actor_id, actors[actor_id])
+            for actor_id in self._actors_touched.since(stamp)
+            if actor_id in actors
+        ]
+
+    def actors_created_since(self, stamp):
+        """(actor_id, entry) for npc actor memory created at or after cycle `stamp`."""
+        actors = self._ctx["npc"].get("actors", {})
+        start = self._actors_grown.size_at(stamp, len(actors))
+        return list(islice(actors.items(), start, None))
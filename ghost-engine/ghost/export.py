@@ -0,0 +1,161 @@
+"""
+Streaming relationship graph exporters.
+
+Every writer walks RelationshipGraph.nodes() / edge_rows() once and
+writes as it goes: memory stays flat however many edges are exported.
+"""
+
+import struct
+from xml.sax.saxutils import quoteattr
+
+# exported per-edge attributes, in edge_rows() order (after a, b)
+EDGE_FIELDS = (
+    "trust", "pos", "neg", "attachment",
+    "pos_gain", "neg_gain", "pos_decay", "neg_decay",
+)
+
+# binary edge list:
+#   header  b"GHEL", version (u16), field count (u16), node count (u32)
+#   nodes   per node: utf-8 length (u32) + utf-8 id
+#   edges   per edge: a index (u32), b index (u32), EDGE_FIELDS (f64 each),
+#           until end of file
+# all little-endian
+_MAGIC = b"GHEL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+_LENGTH = struct.Struct("<I")
+_EDGE = struct.Struct("<II" + "d" * len(EDGE_FIELDS))
+
+_CHUNK = 1 << 16  # bytes buffered between writes
+
+
+def write_gexf(graph, path) -> int:
+    """Write the graph as GEXF 1.2 (undirected). Returns the edge count."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n'
+            '  <graph mode="static" defaultedgetype="undirected">\n'
+            '    <attributes class="edge" mode="static">\n'
+        )
+        for i, name in enumerate(EDGE_FIELDS):
+            f.write(f'      <attribute id="{i}" title="{name}" type="double"/>\n')
+        f.write("    </attributes>\n    <nodes>\n")
+
+        for node in graph.nodes():
+            node = quoteattr(str(node))
+            f.write(f"      <node id={node} label={node}/>\n")
+
+        f.write("    </nodes>\n    <edges>\n")
+
+        count = 0
+        for row in graph.edge_rows():
+            values = "".join(
+                f'<attvalue for="{i}" value="{v!r}"/>' for i, v in enumerate(row[2:])
+            )
+            f.write(
+                f'      <edge id="{count}" source={quoteattr(str(row[0]))} '
+                f'target={quoteattr(str(row[1]))}><attvalues>{values}</attvalues></edge>\n'
+            )
+            count += 1
+
+        f.write("    </edges>\n  </graph>\n</gexf>\n")
+
+    return count
+
+
+def write_graphml(graph, path) -> int:
+    """Write the graph as GraphML (undirected). Returns the edge count."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        )
+        for name in EDGE_FIELDS:
+            f.write(f'  <key id="{name}" for="edge" attr.name="{name}" attr.type="double"/>\n')
+        f.write('  <graph id="relationships" edgedefault="undirected">\n')
+
+        for node in graph.nodes():
+            f.write(f"    <node id={quoteattr(str(node))}/>\n")
+
+        count = 0
+        for row in graph.edge_rows():
+            values = "".join(
+                f'<data key="{name}">{v!r}</data>' for name, v in zip(EDGE_FIELDS, row[2:])
+            )
+            f.write(
+                f"    <edge source={quoteattr(str(row[0]))} "
+                f"target={quoteattr(str(row[1]))}>{values}</edge>\n"
+            )
+            count += 1
+
+        f.write("  </graph>\n</graphml>\n")
+
+    return count
+
+
+def write_edge_list(graph, path) -> int:
+    """
+    Write the graph as a compact binary edge list (see the format
+    above). Returns the edge count.
+    """
+    nodes = [str(node) for node in graph.nodes()]
+    index = {node: i for i, node in enumerate(nodes)}
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(EDGE_FIELDS), len(nodes)))
+
+        buf = bytearray()
+        for node in nodes:
+            raw = node.encode("utf-8")
+            buf += _LENGTH.pack(len(raw))
+            buf += raw
+            if len(buf) >= _CHUNK:
+                f.write(buf)
+                buf.clear()
+
+        pack = _EDGE.pack
+        count = 0
+
+        for a, b, *values in graph.edge_rows():
+            buf += pack(index[str(a)], index[str(b)], *values)
+            count += 1
+            if len(buf) >= _CHUNK:
+                f.write(buf)
+                buf.clear()
+
+        f.write(buf)
+
+    return count
+
+
+def read_edge_list(path):
+    """
+    Stream a binary edge list back as edge_rows() tuples
+    (a, b, trust, pos, neg, attachment, pos_gain, neg_gain,
+    pos_decay, neg_decay).
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError("not a ghost edge list (truncated header)")
+
+        magic, version, n_fields, n_nodes = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION or n_fields != len(EDGE_FIELDS):
+            raise ValueError("not a ghost edge list (or unsupported version)")
+
+        nodes = []
+        for _ in range(n_nodes):
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            nodes.append(f.read(length).decode("utf-8"))
+
+        size = _EDGE.size
+        while True:
+            chunk = f.read(size * 4096)
+            if not chunk:
+                break
+            if len(chunk) % size:
+                raise ValueError("not a ghost edge list (truncated edge)")
+
+            for a, b, *values in _EDGE.iter_unpack(chunk):
+                yield (nodes[a], nodes[b], *values)
@@ -0,0 +1,293 @@
+"""
+Faction detection over strong relationships.
+"""
+
+from itertools import count
+
+# agents expanded per side by the local re-check of a weakened tie
+_LOCAL_CHECK = 64
+
+
+class FactionIndex:
+    """
+    Factions are connected groups of agents over strong ties
+    (trust >= `strong`), kept up to date as a RelationshipGraph observer.
+
+    - apply_delta: O(1) amortized per mutated edge (flat union-find on
+      new strong ties: the smaller faction is relabelled)
+    - tick: re-checks only candidate edges (pos >= strong); trust never
+      exceeds pos and decay only shrinks pos, so no other edge can
+      become strong without an apply_delta
+    - ties that weaken are queued and settled on the next read, per
+      faction: a few losses are re-checked locally (walks of at most
+      _LOCAL_CHECK agents from either end; a walk that runs out splits
+      off the piece it covered), many losses re-split that faction by
+      one walk over its own ties. No read walks the whole graph.
+    """
+
+    def __init__(self, graph, strong: float):
+        self._graph = graph
+        self.strong = strong
+
+        self._candidates = set()  # (a, b) with pos >= strong
+        self._ties = {}  # agent -> agents it has a strong tie with
+
+        self._label = {}  # agent -> faction label
+        self._members = {}  # label -> {member: None}
+        self._rep = {}  # label -> representative member (the faction id)
+        self._lost = []  # weakened ties not yet settled
+        self._labels = count()
+
+        for a, b in graph.pairs():
+            pos, neg = graph.reservoirs(a, b)
+            if pos >= strong:
+                self._candidates.add((a, b))
+                self._update((a, b), pos - neg)
+
+        graph.add_observer(self)
+
+    def close(self):
+        """Stop tracking the graph."""
+        self._graph.remove_observer(self)
+
+    # -----------------------------
+    # OBSERVER HOOKS
+    # -----------------------------
+    def on_delta(self, a, b, old_trust, new_trust, rel):
+        pair = (b, a) if b < a else (a, b)
+
+        if rel["pos"] >= self.strong:
+            self._candidates.add(pair)
+
+        self._update(pair, new_trust)
+
+    def on_tick(self, dt):
+        reservoirs = self._graph.reservoirs
+        strong = self.strong
+
+        for pair in list(self._candidates):
+            pos, neg = reservoirs(*pair)
+
+            if pos < strong:
+                self._candidates.discard(pair)
+
+            self._update(pair, pos - neg)
+
+    def _update(self, pair, trust):
+        a, b = pair
+        ties = self._ties
+        tied = b in ties.get(a, ())
+
+        if trust >= self.strong:
+            if not tied:
+                ties.setdefault(a, set()).add(b)
+                ties.setdefault(b, set()).add(a)
+                self._union(a, b)
+
+        elif tied:
+            ties[a].discard(b)
+            ties[b].discard(a)
+            self._lost.append(pair)
+
+            # bounded backlog when nothing reads the index
+            if len(self._lost) > len(self._label):
+                self._refresh()
+
+    # -----------------------------
+    # FLAT UNION-FIND
+    # -----------------------------
+    def _new_faction(self, group):
+        label = next(self._labels)
+
+        for x in group:
+            self._label[x] = label
+
+        self._members[label] = group
+        self._rep[label] = next(iter(group))
+
+    def _union(self, a, b):
+        labels = self._label
+        members = self._members
+
+        for x in (a, b):
+            if x not in labels:
+                self._new_faction({x: None})
+
+        la = labels[a]
+        lb = labels[b]
+
+        if la == lb:
+            return
+
+        if len(members[la]) < len(members[lb]):
+            la, lb = lb, la
+
+        moved = members.pop(lb)
+        del self._rep[lb]
+
+        for x in moved:
+            labels[x] = la
+        members[la].update(moved)
+
+    def _split(self, a, b) -> bool:
+        """
+        The tie a-b is gone: split its faction if that disconnected it.
+        False if both walks hit the bound (undecided).
+        """
+        # walk from the end with fewer ties first
+        ends = (a, b) if len(self._ties[a]) <= len(self._ties[b]) else (b, a)
+
+        for start, goal in (ends, ends[::-1]):
+            piece = self._walk(start, goal)
+
+            if piece is True:
+                return True  # still linked
+
+            if piece is not None:
+                # the walk ran out: `piece` is a whole faction now
+                self._detach(self._label[a], piece)
+                return True
+
+        return False
+
+    def _walk(self, start, goal):
+        """
+        Bounded walk over strong ties. True if it reaches `goal` (or one
+        of its tie partners), the agents reached if it runs out first,
+        None if it hits the bound.
+        """
+        ties = self._ties
+        near = ties[goal]
+        seen = {start}
+        found = [start]
+
+        for expanded, agent_id in enumerate(found):
+            if expanded == _LOCAL_CHECK:
+                return None
+
+            for other in ties[agent_id]:
+                if other == goal or other in near:
+                    return True
+
+                if other not in seen:
+                    seen.add(other)
+                    found.append(other)
+
+        return dict.fromkeys(found)
+
+    def _detach(self, label, piece):
+        members = self._members[label]
+
+        for x in piece:
+            del members[x]
+
+        if self._rep[label] in piece:
+            self._rep[label] = next(iter(members))
+
+        if len(piece) == 1:
+            # no ties left: unaffiliated
+            (x,) = piece
+            del self._label[x]
+            self._ties.pop(x, None)
+        else:
+            self._new_faction(piece)
+
+    def _refresh(self):
+        """Settle the ties weakened since the last read."""
+        if not self._lost:
+            return
+
+        labels = self._label
+        ties = self._ties
+
+        by_faction = {}
+        for a, b in self._lost:
+            if b not in ties[a]:
+                by_faction.setdefault(labels[a], []).append((a, b))
+
+        self._lost = []
+
+        for label, lost in by_faction.items():
+            # many losses: one walk over the faction beats many local ones
+            if len(lost) * _LOCAL_CHECK >= len(self._members[label]):
+                self._resplit(label)
+                continue
+
+            for a, b in lost:
+                # an earlier split may already have separated a and b
+                if labels.get(a) is not None and labels.get(a) == labels.get(b):
+                    if not self._split(a, b):
+                        self._resplit(labels[a])
+                        break
+
+    def _resplit(self, label):
+        labels = self._label
+        ties = self._ties
+
+        group = self._members.pop(label)
+        del self._rep[label]
+
+        for agent_id in group:
+            del labels[agent_id]
+
+        for start in group:
+            if start in labels:
+                continue
+
+            if not ties.get(start):
+                ties.pop(start, None)
+                continue
+
+            # walk the remaining ties from `start`: one new faction
+            found = [start]
+            labels[start] = None
+
+            for agent_id in found:
+                for other in ties[agent_id]:
+                    if other not in labels:
+                        labels[other] = None
+                        found.append(other)
+
+            self._new_faction(dict.fromkeys(found))
+
+    # -----------------------------
+    # READ
+    # -----------------------------
+    def faction_of(self, agent_id):
+        """Faction id (a representative member), or None if unaffiliated."""
+        self._refresh()
+
+        label = self._label.get(agent_id)
+
+        if label is None or len(self._members[label]) < 2:
+            return None
+
+        return self._rep[label]
+
+    def sizes(self, agents) -> dict:
+        """{faction id: faction size} for factions with a member in `agents`."""
+        self._refresh()
+
+        labels = self._label
+        members = self._members
+        rep = self._rep
+        out = {}
+
+        for agent_id in agents:
+            label = labels.get(agent_id)
+            if label is not None:
+                size = len(members[label])
+                if size > 1:
+                    out[rep[label]] = size
+
+        return out
+
+    def factions(self) -> list:
+        """Every faction as a member list, largest first."""
+        self._refresh()
+
+        return sorted(
+            (list(group) for group in self._members.values() if len(group) > 1),
+            key=len,
+            reverse=True,
+        )
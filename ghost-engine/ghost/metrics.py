@@ -0,0 +1,157 @@
+"""
+Streaming relationship metrics.
+"""
+
+from heapq import heapify, heappop, heappush
+
+_EVERY_EDGE = float("inf")
+
+
+class RelationshipMetrics:
+    """
+    Running trust summary of a RelationshipGraph, kept up to date as a
+    graph observer (same figures as RelationshipGraph.trust_summary):
+
+    - apply_delta: O(log n) per mutated edge (threshold counts, trust
+      sum, and a lazy-deletion heap of the edges that can hold the
+      minimum); new edges are also reported on creation, so one made
+      by a bare ensure_pair() counts towards the minimum
+    - eager tick: the graph sums the decayed edges up in its decay pass
+      (vectorized on the compact store) and hands the figures over, with
+      its SUMMARY_LOWEST lowest edges; no second pass
+    - lazy tick: nothing has decayed yet, so the summary is recomputed
+      by one trust_summary() pass on the next read
+    - the minimum only needs a recount once every listed low edge has
+      been raised above the highest of them (at least SUMMARY_LOWEST
+      raises since the last tick)
+
+    Reads are O(1) amortized between ticks. In lazy decay mode the
+    first read after each tick is O(E): the lazy clock decays edges
+    only when they are touched, and the decayed figures are not known
+    until every edge has been caught up.
+    """
+
+    def __init__(self, graph, strong: float, hostile: float):
+        # new edges start at trust 0.0 and must count as neither band
+        if not hostile < 0.0 < strong:
+            raise ValueError("metrics thresholds must satisfy hostile < 0 < strong")
+
+        self._graph = graph
+        self.strong = strong
+        self.hostile = hostile
+
+        # tick summaries for these bands come from the graph's decay pass
+        self.summary_bands = (strong, hostile)
+
+        self._strong_edges = 0
+        self._hostile_edges = 0
+        self._total = 0.0
+
+        # edges that can hold the minimum: key -> trust, plus a heap of
+        # (trust, key) with replaced entries dropped lazily; every other
+        # edge has trust >= _floor
+        self._low = {}
+        self._heap = []
+        self._floor = _EVERY_EDGE
+        self._stale = True
+
+        graph.add_observer(self)
+
+    def close(self):
+        """Stop tracking the graph."""
+        self._graph.remove_observer(self)
+
+    # -----------------------------
+    # OBSERVER HOOKS
+    # -----------------------------
+    def on_delta(self, a, b, old_trust, new_trust, rel):
+        if self._stale:
+            return
+
+        strong = self.strong
+        hostile = self.hostile
+
+        self._strong_edges += (new_trust >= strong) - (old_trust >= strong)
+        self._hostile_edges += (new_trust <= hostile) - (old_trust <= hostile)
+        self._total += new_trust - old_trust
+
+        key = self._graph._key(a, b)
+        low = self._low
+
+        if key in low or new_trust < self._floor:
+            low[key] = new_trust
+            heap = self._heap
+
+            if len(heap) > 2 * len(low) + 16:
+                self._heap = [(trust, k) for k, trust in low.items()]
+                heapify(self._heap)
+            else:
+                heappush(heap, (new_trust, key))
+
+    def on_create(self, a, b):
+        # a new edge starts at trust 0.0, in neither band; ensure_pair()
+        # creates one without a delta, so it is listed here
+        self.on_delta(a, b, 0.0, 0.0, None)
+
+    def on_tick(self, dt):
+        # an eager tick follows up with on_tick_summary()
+        if dt:
+            self._stale = True
+
+    def on_tick_summary(self, summary):
+        self._load(summary)
+
+    # -----------------------------
+    # READS
+    # -----------------------------
+    def summary(self) -> dict:
+        """{"edges", "strong_edges", "hostile_edges", "min_trust", "total_trust"}"""
+        if self._stale:
+            self._recount()
+
+        return {
+            "edges": len(self._graph._rels),
+            "strong_edges": self._strong_edges,
+            "hostile_edges": self._hostile_edges,
+            "min_trust": self._min_trust(),
+            "total_trust": self._total,
+        }
+
+    def _min_trust(self):
+        heap = self._heap
+        low = self._low
+
+        while heap and low[heap[0][1]] != heap[0][0]:
+            heappop(heap)
+
+        if heap and heap[0][0] <= self._floor:
+            return heap[0][0]
+
+        if not heap and self._floor is _EVERY_EDGE:
+            return None
+
+        # every listed edge rose above the floor: the next one is unknown
+        self._recount()
+        return self._min_trust()
+
+    def _recount(self):
+        graph = self._graph
+        self._load(graph.trust_summary(self.strong, self.hostile, graph.SUMMARY_LOWEST))
+
+    def _load(self, summary):
+        lowest = summary["lowest"]
+
+        self._strong_edges = summary["strong_edges"]
+        self._hostile_edges = summary["hostile_edges"]
+        self._total = summary["total_trust"]
+
+        self._low = {key: trust for trust, key in lowest}
+        self._heap = list(lowest)  # sorted, so already a heap
+
+        # edges left out of the list are no lower than its last entry
+        if len(lowest) < summary["edges"]:
+            self._floor = lowest[-1][0]
+        else:
+            self._floor = _EVERY_EDGE
+
+        self._stale = False
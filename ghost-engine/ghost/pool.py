@@ -0,0 +1,194 @@
+"""
+Many isolated Ghost engines in one process.
+
+EnginePool is a registry of GhostEngine instances keyed by world id,
+for hosts that run one world per shard instead of the module-level
+engine behind ghost.init() / ghost.step().
+"""
+
+import copy
+import sys
+from array import array
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from .api import DEFAULT_EVENT_MAP, EventKernels
+from .engine import GhostEngine
+from .relationships import RelationshipGraph
+
+
+class EnginePool:
+    """
+    Hosts many GhostEngine instances keyed by world id.
+
+    - every world has its own context (no state is shared between worlds)
+    - read-only tables (personality presets, the event map) are shared
+    - step_many() advances many worlds in one call
+    - memory_usage() reports the bytes owned by each world
+    """
+
+    def __init__(self, config: dict | None = None, event_map: dict | None = None):
+        # defaults copied into every new world's context
+        self._config = dict(config or {})
+
+        # one event map for all worlds (never copied per world)
+        self.event_map = event_map or DEFAULT_EVENT_MAP
+
+        self._engines = {}
+
+    @property
+    def event_map(self) -> dict:
+        return self._events.event_map
+
+    @event_map.setter
+    def event_map(self, event_map: dict):
+        self._events = EventKernels(event_map)
+
+    # -----------------------------
+    # REGISTRY
+    # -----------------------------
+    def create(self, world_id, context: dict | None = None) -> GhostEngine:
+        """
+        Create a world. `context` overrides the pool defaults.
+        """
+        if world_id in self._engines:
+            raise ValueError(f"World already exists: {world_id}")
+
+        ctx = copy.deepcopy(self._config)
+        ctx.update(context or {})
+
+        engine = self._engines[world_id] = GhostEngine(context=ctx)
+
+        return engine
+
+    def get(self, world_id) -> GhostEngine:
+        engine = self._engines.get(world_id)
+
+        if engine is None:
+            raise KeyError(f"Unknown world: {world_id}")
+
+        return engine
+
+    def remove(self, world_id):
+        """Drop a world and its state."""
+        self.get(world_id)
+        del self._engines[world_id]
+
+    def world_ids(self):
+        return list(self._engines)
+
+    def __contains__(self, world_id):
+        return world_id in self._engines
+
+    def __iter__(self):
+        return iter(self._engines)
+
+    def __len__(self):
+        return len(self._engines)
+
+    # -----------------------------
+    # STEPPING
+    # -----------------------------
+    def step(self, world_id, step_data=None):
+        """Advance one world by one cycle (same as GhostEngine.step)."""
+        return self.get(world_id).step(step_data)
+
+    def step_many(self, batches: dict):
+        """
+        Advance many worlds in one call.
+
+        batches: {world_id: events}, where events is anything
+        GhostEngine.step_many accepts (list of steps or dict of columns).
+        Worlds are advanced in the mapping's order.
+        """
+        engines = [(self.get(world_id), events) for world_id, events in batches.items()]
+
+        for engine, events in engines:
+            engine.step_many(events)
+
+    def tick(self, world_ids=None):
+        """Apply relationship decay in every world (or the given ones)."""
+        for world_id in self._engines if world_ids is None else world_ids:
+            self.get(world_id).relationships.tick()
+
+    def apply_event(self, world_id, source: str, target: str, event: dict):
+        """GhostAPI.apply_event against one world, using the shared event map."""
+        self._events.apply(self.get(world_id).relationships, source, target, event)
+
+    # -----------------------------
+    # READ STATE
+    # -----------------------------
+    def snapshot(self, world_id):
+        return self.get(world_id).snapshot()
+
+    def memory_usage(self, world_id=None):
+        """
+        Approximate bytes owned by each world ({world_id: bytes}),
+        or by one world if `world_id` is given.
+
+        Shared tables (presets, event map) are not charged to any world.
+        """
+        if world_id is not None:
+            return _deep_sizeof(self.get(world_id), self._shared())
+
+        return {
+            world_id: _deep_sizeof(engine, self._shared())
+            for world_id, engine in self._engines.items()
+        }
+
+    def _shared(self) -> set:
+        return {
+            id(self.event_map),
+            id(RelationshipGraph.PERSONALITY_PRESETS),
+            id(None),
+            id(True),
+            id(False),
+        }
+
+
+_OPAQUE = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_LEAVES = (str, bytes, bytearray, int, float, complex, array)
+
+
+def _deep_sizeof(root, seen: set) -> int:
+    """
+    sys.getsizeof summed over everything reachable from `root`
+    (containers, instance __dict__ / __slots__), skipping ids in `seen`.
+    """
+    total = 0
+    stack = [root]
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, _OPAQUE):
+            continue
+
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, _LEAVES):
+            continue
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            continue
+
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None:
+            stack.append(attrs)
+
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+
+            for slot in slots:
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+
+    return total
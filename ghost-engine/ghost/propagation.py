@@ -0,0 +1,107 @@
+"""
+Bounded threat propagation for GhostEngine.step().
+"""
+
+
+class ThreatPropagation:
+    """
+    Who a threat reaches beyond its target, read from ctx:
+
+        threat_fanout       max neighbors unsettled per expanded agent
+                            (None: every neighbor)
+        threat_order        "insertion" (first-interaction order) or
+                            "strength" (most trusted first, ties on id)
+        threat_hops         how far the threat spreads (1: the target's
+                            neighbors only)
+        threat_attenuation  effect multiplier per extra hop
+
+    The defaults (every neighbor, insertion order, one hop) are the
+    engine's historical behavior. With a fan-out cap f and h hops an
+    event unsettles at most f + f**2 + ... + f**h agents; "insertion"
+    order skips at most the agents already visited, "strength" order
+    asks the engine's TrustIndex for exactly f neighbors, passing over
+    the visited ones as it walks the ranking.
+
+    Every agent is unsettled at most once per event (visited set; the
+    actor and the target are never unsettled).
+    """
+
+    ORDERS = ("insertion", "strength")
+
+    def __init__(self, graph, top_trusted, fanout=None, order="insertion",
+                 hops=1, attenuation=0.5):
+        if fanout is not None and fanout < 0:
+            raise ValueError("threat_fanout must be >= 0 (or None)")
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown threat_order: {order}")
+        if hops < 1:
+            raise ValueError("threat_hops must be >= 1")
+
+        self._graph = graph
+        self._top_trusted = top_trusted  # (agent, k, skip) -> [(neighbor, trust)]
+
+        self.fanout = fanout
+        self.order = order
+        self.hops = hops
+        self.attenuation = attenuation
+
+    @classmethod
+    def from_ctx(cls, ctx: dict, graph, top_trusted):
+        return cls(
+            graph,
+            top_trusted,
+            fanout=ctx.get("threat_fanout"),
+            order=ctx.get("threat_order", "insertion"),
+            hops=ctx.get("threat_hops", 1),
+            attenuation=ctx.get("threat_attenuation", 0.5),
+        )
+
+    @property
+    def unbounded(self) -> bool:
+        """True for the historical behavior (every neighbor, one hop)."""
+        return self.fanout is None and self.order == "insertion" and self.hops == 1
+
+    def reach(self, actor, target):
+        """
+        (agent, scale) for every agent the threat unsettles, in order;
+        scale is attenuation ** (hop - 1).
+        """
+        visited = {actor, target}
+        frontier = [target]
+        scale = 1.0
+
+        for hop in range(self.hops):
+            next_frontier = []
+
+            for agent in frontier:
+                for neighbor_id in self._select(agent, visited):
+                    visited.add(neighbor_id)
+                    next_frontier.append(neighbor_id)
+                    yield neighbor_id, scale
+
+            if not next_frontier:
+                return
+
+            frontier = next_frontier
+            scale *= self.attenuation
+
+    def _select(self, agent, visited):
+        fanout = self.fanout
+
+        if fanout == 0:
+            return []
+
+        if self.order == "strength":
+            k = len(self._graph.neighbors(agent)) if fanout is None else fanout
+            return [other for other, _ in self._top_trusted(agent, k, visited)]
+
+        chosen = []
+        for neighbor_id in self._graph.neighbors(agent):
+            if neighbor_id in visited:
+                continue
+
+            chosen.append(neighbor_id)
+            if len(chosen) == fanout:
+                break
+
+        return chosen
@@ -1,3 +1,18 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, MutableMapping
+from heapq import nsmallest
+from itertools import islice, repeat, starmap
+from operator import mul, sub
+
+from ghost.snapshot import GrowthMarks, TouchJournal
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized paths fall back to array('d')
+    np = None
+
+
 class RelationshipGraph:
     """
     Stores pairwise relationships between agents.
@@ -8,6 +23,19 @@ class RelationshipGraph:
         self._rels = ctx.setdefault("relationships", {})
         self._neighbors = ctx.setdefault("neighbors", {})
 
+        self._read_params(ctx)
+
+        # lazy mode: key -> clock of last materialization
+        # (edges without a stamp were materialized at self._synced)
+        self._stamps = {}
+
+        # ends (a <= b) of every edge, parallel to _rels (creation order):
+        # edges are named without parsing their "a|b" keys
+        ends = _adopted_ends(self._rels, self._neighbors)
+        self._lo_names = [a for a, _ in ends]
+        self._hi_names = [b for _, b in ends]
+
+    def _read_params(self, ctx: dict):
         # -----------------------------
         # GLOBAL PARAMETERS
         # -----------------------------
@@ -18,7 +46,40 @@ class RelationshipGraph:
         self.neg_decay = ctx.get("neg_decay", 0.975)
 
         self.max_reservoir = ctx.get("max_reservoir", 5.0)
-        
+
+        # -----------------------------
+        # DECAY MODE
+        # -----------------------------
+        # eager: tick() decays every edge
+        # lazy:  tick() only advances the clock; edges apply
+        #        decay**dt when they are next read or written
+        self.decay_mode = ctx.get("decay_mode", "eager")
+
+        if self.decay_mode not in ("eager", "lazy"):
+            raise ValueError(f"Unknown decay_mode: {self.decay_mode}")
+
+        self._lazy = self.decay_mode == "lazy"
+        self._clock = 0
+        self._synced = 0
+
+        # -----------------------------
+        # CHANGE JOURNALS (incremental snapshots)
+        # -----------------------------
+        # edge / agent -> cycle last touched, plus the cycle of the
+        # last decay tick (which touches every edge at once)
+        self._touched = TouchJournal()
+        self._neighbors_touched = TouchJournal()
+        self._decayed_at = -1
+
+        # container sizes per cycle (snapshot deltas)
+        self._grown = GrowthMarks()
+        self._neighbors_grown = GrowthMarks()
+
+        # -----------------------------
+        # OBSERVERS (derived indexes)
+        # -----------------------------
+        self._observers = []
+
     # -----------------------------
     # PERSONALITY PRESETS
     # -----------------------------
@@ -58,50 +119,93 @@ class RelationshipGraph:
         self.set_params(a, b, **params)
 
     def _key(self, a: str, b: str):
-        a, b = sorted((a, b))
+        if b < a:
+            a, b = b, a
         return f"{a}|{b}"
 
     def ensure_pair(self, a: str, b: str):
         key = self._key(a, b)
 
-        rel = self._rels.setdefault(
-            key,
-            {
-                "pos": 0.0,
-                "neg": 0.0,
-                "attachment": 0.0,
+        rel = self._rels.get(key)
+        stamp = self._ctx.get("cycles", 0)
 
-                # -----------------------------
-                # PER-RELATIONSHIP PARAMETERS
-                # -----------------------------
-                "pos_gain": self.pos_gain,
-                "neg_gain": self.neg_gain,
-                "pos_decay": self.pos_decay,
-                "neg_decay": self.neg_decay,
-            },
-        )
+        self._touched.touch(key, stamp)
+
+        if rel is not None:
+            if self._lazy:
+                self._catch_up(key, rel)
+            return rel
+
+        self._grown.mark(stamp, len(self._rels))
+        self._neighbors_grown.mark(stamp, len(self._neighbors))
+
+        rel = self._rels[key] = self._blank()
+
+        if b < a:
+            self._lo_names.append(b)
+            self._hi_names.append(a)
+        else:
+            self._lo_names.append(a)
+            self._hi_names.append(b)
+
+        if self._lazy:
+            self._stamps[key] = self._clock
 
-        self._neighbors.setdefault(a, [])
-        self._neighbors.setdefault(b, [])
+        # -----------------------------
+        # ADJACENCY
+        # -----------------------------
+        # A new edge is always a new neighbor pair, so the edge map is the
+        # O(1) membership index and the lists only keep insertion order.
+        self._neighbors.setdefault(a, []).append(b)
 
-        if b not in self._neighbors[a]:
-            self._neighbors[a].append(b)
+        if a != b:
+            self._neighbors.setdefault(b, []).append(a)
 
-        if a not in self._neighbors[b]:
-            self._neighbors[b].append(a)
+        self._neighbors_touched.touch(a, stamp)
+        self._neighbors_touched.touch(b, stamp)
+
+        if self._observers:
+            self._notify_create(a, b)
 
         return rel
+
+    def _blank(self) -> dict:
+        """A new edge's record."""
+        return {
+            "pos": 0.0,
+            "neg": 0.0,
+            "attachment": 0.0,
+
+            # -----------------------------
+            # PER-RELATIONSHIP PARAMETERS
+            # -----------------------------
+            "pos_gain": self.pos_gain,
+            "neg_gain": self.neg_gain,
+            "pos_decay": self.pos_decay,
+            "neg_decay": self.neg_decay,
+        }
     
     def set_params(self, a: str, b: str, **params):
         rel = self.ensure_pair(a, b)
 
+        observers = self._observers
+        if observers:
+            old_trust = rel.get("pos", 0.0) - rel.get("neg", 0.0)
+
         for k, v in params.items():
             if k in rel:
                 rel[k] = v
+
+        if observers:
+            self._notify_delta(a, b, old_trust, rel)
     
     def apply_delta(self, a: str, b: str, deltas: dict):
         rel = self.ensure_pair(a, b)
 
+        observers = self._observers
+        if observers:
+            old_trust = rel.get("pos", 0.0) - rel.get("neg", 0.0)
+
         for k, v in deltas.items():
 
             if k == "trust":
@@ -120,22 +224,336 @@ class RelationshipGraph:
 
             rel[k] = rel.get(k, 0.0) + v
 
+        if observers:
+            self._notify_delta(a, b, old_trust, rel)
+
         return rel
 
+    def apply_core_delta(self, a: str, b: str, trust=None, attachment=None):
+        """
+        apply_delta(a, b, {"trust": trust, "attachment": attachment})
+        (None = key absent) as fixed float updates, with no dict walk.
+        Used by compiled event maps.
+        """
+        rel = self.ensure_pair(a, b)
+
+        observers = self._observers
+        if observers:
+            old_trust = rel.get("pos", 0.0) - rel.get("neg", 0.0)
+
+        if trust is not None:
+            rel["trust"] = rel.get("trust", 0.0) + trust
+
+            if trust > 0:
+                rel["pos"] = rel.get("pos", 0.0) + trust
+            elif trust < 0:
+                rel["neg"] = rel.get("neg", 0.0) + abs(trust)
+
+        if attachment is not None:
+            rel["attachment"] = rel.get("attachment", 0.0) + attachment
+
+        if observers:
+            self._notify_delta(a, b, old_trust, rel)
+
+    # delta keys apply_deltas() handles
+    BULK_FIELDS = ("trust", "attachment")
+
+    def apply_deltas(self, sources, targets, columns: dict):
+        """
+        Bulk apply_delta over parallel event columns.
+
+        `columns` maps a BULK_FIELDS key to (mask, values), NumPy arrays
+        over the events: event i adds values[i] to that field where
+        mask[i]. Final state, journals and adjacency order are the same
+        as calling apply_delta(sources[i], targets[i], ...) for every
+        event in order; each edge is resolved once, missing edges are
+        created in one batch and every field is accumulated with
+        np.add.at (sequential, in event order).
+
+        Needs NumPy. With observers attached the events go through
+        apply_delta one by one (observers expect one call per event).
+        """
+        if np is None:
+            raise RuntimeError("apply_deltas requires numpy")
+
+        unknown = set(columns).difference(self.BULK_FIELDS)
+        if unknown:
+            raise ValueError(f"apply_deltas cannot apply: {sorted(unknown)}")
+
+        if self._observers:
+            apply_delta = self.apply_delta
+            fields = [(field, mask.tolist(), values.tolist()) for field, (mask, values) in columns.items()]
+
+            for e, (a, b) in enumerate(zip(sources, targets)):
+                apply_delta(a, b, {field: values[e] for field, mask, values in fields if mask[e]})
+
+            return
+
+        idx, rels = self._bulk_index(sources, targets)
+
+        if "trust" in columns:
+            mask, values = columns["trust"]
+            self._bulk_add(idx, rels, mask, values, "trust")
+            self._bulk_add(idx, rels, mask & (values > 0), values, "pos")
+            self._bulk_add(idx, rels, mask & (values < 0), np.abs(values), "neg")
+
+        if "attachment" in columns:
+            mask, values = columns["attachment"]
+            self._bulk_add(idx, rels, mask, values, "attachment")
+
+    def _bulk_index(self, sources, targets):
+        """
+        Resolve every event to an edge slot, creating the missing edges
+        in one batch, in first-appearance order (what per-event
+        ensure_pair calls would do). Returns (slot per event, edge per slot).
+        """
+        slots, first, names, src, dst = _bulk_slots(sources, targets)
+        a = src[first]
+        b = dst[first]
+
+        lo = list(map(names.__getitem__, np.minimum(a, b).tolist()))
+        hi = list(map(names.__getitem__, np.maximum(a, b).tolist()))
+        keys = [f"{x}|{y}" for x, y in zip(lo, hi)]
+
+        rels = list(map(self._rels.get, keys))
+        new = [j for j, rel in enumerate(rels) if rel is None]
+        stamp = self._ctx.get("cycles", 0)
+
+        if self._lazy:
+            catch_up = self._catch_up
+            for key, rel in zip(keys, rels):
+                if rel is not None:
+                    catch_up(key, rel)
+
+        self._touched.touch_many(keys, stamp)
+
+        if new:
+            self._grown.mark(stamp, len(self._rels))
+            self._neighbors_grown.mark(stamp, len(self._neighbors))
+
+            new_keys = list(map(keys.__getitem__, new))
+            blank = self._blank()
+            made = [blank.copy() for _ in new]
+
+            self._rels.update(zip(new_keys, made))
+            for j, rel in zip(new, made):
+                rels[j] = rel
+
+            self._lo_names.extend(map(lo.__getitem__, new))
+            self._hi_names.extend(map(hi.__getitem__, new))
+
+            if self._lazy:
+                self._stamps.update(dict.fromkeys(new_keys, self._clock))
+
+            self._bulk_neighbors(names, a[new], b[new], stamp)
+
+        return slots, rels
+
+    def _bulk_neighbors(self, names, a, b, stamp):
+        """
+        Adjacency for new edges a[k]-b[k] (indices into `names`), in
+        edge order: the lists and journal entries ensure_pair would add.
+        """
+        owner = np.column_stack((a, b)).ravel()
+        other = np.column_stack((b, a)).ravel()
+
+        self._neighbors_touched.touch_many(map(names.__getitem__, owner.tolist()), stamp)
+
+        # a self-loop is listed once
+        keep = np.ones(len(owner), dtype=bool)
+        keep[1::2] = a != b
+        owner = owner[keep]
+        other = other[keep]
+
+        order = _radix_order(owner, len(names))
+        grouped = owner[order]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        ends = np.r_[starts[1:], len(grouped)].tolist()
+
+        others = list(map(names.__getitem__, other[order].tolist()))
+        group = dict(zip(grouped[starts].tolist(), zip(starts.tolist(), ends)))
+        neighbors = self._neighbors
+
+        # agents enter the neighbor map in first-use order
+        for agent in _first_use(owner, len(names)).tolist():
+            start, end = group[agent]
+            neighbors.setdefault(names[agent], []).extend(others[start:end])
+
+    def _bulk_add(self, idx, rels, mask, values, field):
+        sel = idx[mask]
+        if not len(sel):
+            return
+
+        # only the edges this field touches are read and written back
+        hit = np.zeros(len(rels), dtype=np.intp)
+        hit[sel] = 1
+        touched = np.flatnonzero(hit)
+        hit[touched] = np.arange(len(touched))
+
+        touched = list(map(rels.__getitem__, touched.tolist()))
+        acc = np.array([rel.get(field, 0.0) for rel in touched], dtype=np.float64)
+        np.add.at(acc, hit[sel], values[mask])
+
+        for rel, value in zip(touched, acc.tolist()):
+            rel[field] = value
+
+    # -----------------------------
+    # OBSERVERS
+    # -----------------------------
+    # lowest edges listed in a tick summary
+    SUMMARY_LOWEST = 32
+
+    def add_observer(self, observer):
+        """
+        Register a derived index. After every apply_delta() / set_params():
+            observer.on_delta(a, b, old_trust, new_trust, rel)
+        and after every tick():
+            observer.on_tick(dt)
+        Observers that define on_create(a, b) are also told of every
+        new edge (trust 0.0) as it is created, including by a bare
+        ensure_pair(). Observers that define before_tick(dt) are also
+        called right before a tick decays anything. Observers that define
+        summary_bands = (strong, hostile) also get
+            observer.on_tick_summary(summary)
+        after an eager tick, with trust_summary(strong, hostile,
+        SUMMARY_LOWEST) figures taken in the decay pass itself.
+        Mutations that bypass apply_delta / tick are not reported.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
+
+    def _notify_delta(self, a, b, old_trust, rel):
+        new_trust = rel.get("pos", 0.0) - rel.get("neg", 0.0)
+
+        for observer in self._observers:
+            observer.on_delta(a, b, old_trust, new_trust, rel)
+
+    def _notify_create(self, a, b):
+        for observer in self._observers:
+            on_create = getattr(observer, "on_create", None)
+            if on_create is not None:
+                on_create(a, b)
+
+    def _notify_before_tick(self, dt):
+        for observer in self._observers:
+            before_tick = getattr(observer, "before_tick", None)
+            if before_tick is not None:
+                before_tick(dt)
+
+    def _notify_tick(self, dt, summaries=None):
+        for observer in self._observers:
+            observer.on_tick(dt)
+
+            if summaries is not None:
+                bands = getattr(observer, "summary_bands", None)
+                if bands is not None:
+                    observer.on_tick_summary(summaries[bands])
+
+    def _summary_bands(self):
+        """The (strong, hostile) bands observers want tick summaries for."""
+        return {
+            observer.summary_bands
+            for observer in self._observers
+            if getattr(observer, "summary_bands", None) is not None
+        }
+
     # -----------------------------
     # NEW: TIME DECAY (optional)
     # -----------------------------
-    def tick(self):
-        for rel in self._rels.values():
-            rel["pos"] *= rel["pos_decay"]
-            rel["neg"] *= rel["neg_decay"]
+    def tick(self, dt=1):
+        """
+        Decay every edge by `dt` time units (decay ** dt).
+        """
+        if dt < 0:
+            raise ValueError("dt must be >= 0")
+
+        if self._observers:
+            self._notify_before_tick(dt)
+
+        self._decayed_at = self._ctx.get("cycles", 0)
+        bands = self._summary_bands() if self._observers else None
+        summaries = None
+
+        if self._lazy:
+            self._clock += dt
+        elif dt and bands:
+            # summed up while decaying: no second pass for the observers
+            summaries = self._summarize(self._decay_trusts(dt), bands, self.SUMMARY_LOWEST)
+        elif dt == 1:
+            for rel in self._rels.values():
+                rel["pos"] *= rel["pos_decay"]
+                rel["neg"] *= rel["neg_decay"]
+        elif dt:
+            for rel in self._rels.values():
+                rel["pos"] *= rel["pos_decay"] ** dt
+                rel["neg"] *= rel["neg_decay"] ** dt
+
+        if self._observers:
+            self._notify_tick(dt, summaries)
+
+    def _decay_trusts(self, dt):
+        """Eager decay by `dt`; returns every edge's new trust, in edge order."""
+        trusts = []
+        append = trusts.append
+
+        if dt == 1:
+            for rel in self._rels.values():
+                pos = rel["pos"] = rel["pos"] * rel["pos_decay"]
+                neg = rel["neg"] = rel["neg"] * rel["neg_decay"]
+                append(pos - neg)
+        else:
+            for rel in self._rels.values():
+                pos = rel["pos"] = rel["pos"] * rel["pos_decay"] ** dt
+                neg = rel["neg"] = rel["neg"] * rel["neg_decay"] ** dt
+                append(pos - neg)
+
+        return trusts
+
+    def _catch_up(self, key, rel):
+        """Lazy mode: apply the decay owed since the edge was last touched."""
+        stamps = self._stamps
+        dt = self._clock - stamps.get(key, self._synced)
+
+        if dt:
+            rel["pos"] *= rel["pos_decay"] ** dt
+            rel["neg"] *= rel["neg_decay"] ** dt
+
+        stamps[key] = self._clock
+
+    def materialize(self):
+        """
+        Lazy mode: bring every edge up to the current clock.
+        No-op in eager mode, or when nothing is owed.
+        """
+        if not self._lazy or self._synced == self._clock:
+            return
+
+        stamps = self._stamps
+        clock = self._clock
+        synced = self._synced
+
+        for key, rel in self._rels.items():
+            dt = clock - stamps.get(key, synced)
+
+            if dt:
+                rel["pos"] *= rel["pos_decay"] ** dt
+                rel["neg"] *= rel["neg_decay"] ** dt
+
+        stamps.clear()
+        self._synced = clock
 
     def get(self, a: str, b: str):
-        rel = self._rels.get(self._key(a, b))
+        key = self._key(a, b)
+        rel = self._rels.get(key)
 
         if rel is None:
             return None
 
+        if self._lazy:
+            self._catch_up(key, rel)
+
         pos = rel.get("pos", 0.0)
         neg = rel.get("neg", 0.0)
 
@@ -144,8 +562,1230 @@ class RelationshipGraph:
 
         return out
 
+    def trust(self, a: str, b: str):
+        """Current trust (pos - neg) of a pair, or None. Copies nothing."""
+        key = self._key(a, b)
+        rel = self._rels.get(key)
+
+        if rel is None:
+            return None
+
+        if self._lazy:
+            self._catch_up(key, rel)
+
+        return rel.get("pos", 0.0) - rel.get("neg", 0.0)
+
+    def reservoirs(self, a: str, b: str):
+        """Current (pos, neg) of a pair, or None. Copies nothing."""
+        key = self._key(a, b)
+        rel = self._rels.get(key)
+
+        if rel is None:
+            return None
+
+        if self._lazy:
+            self._catch_up(key, rel)
+
+        return rel.get("pos", 0.0), rel.get("neg", 0.0)
+
+    # -----------------------------
+    # READ-ONLY PEEKS
+    # -----------------------------
+    # Current (trust, attachment) without side effects: lazy decay is
+    # computed on the fly (the same value a catch-up would store) and
+    # no journal is touched.
+    def peek(self, a: str, b: str):
+        """Current (trust, attachment) of a pair, or None. Mutates nothing."""
+        key = self._key(a, b)
+        rel = self._rels.get(key)
+
+        if rel is None:
+            return None
+
+        pos = rel.get("pos", 0.0)
+        neg = rel.get("neg", 0.0)
+
+        if self._lazy:
+            dt = self._clock - self._stamps.get(key, self._synced)
+            if dt:
+                pos *= rel["pos_decay"] ** dt
+                neg *= rel["neg_decay"] ** dt
+
+        return pos - neg, rel.get("attachment", 0.0)
+
+    def peek_many(self, pairs):
+        """peek() for every (a, b) in `pairs`, in order."""
+        return starmap(self.peek, pairs)
+
+    def peek_neighbors(self, agent_id: str):
+        """(neighbor, trust, attachment) for every neighbor, in neighbor order."""
+        peek = self.peek
+
+        for other in self._neighbors.get(agent_id, ()):
+            yield (other, *peek(agent_id, other))
+
+    def reservoir_bounds(self, agent_id: str):
+        """
+        (largest reservoir, fastest decay, slowest decay) over an agent's
+        edges; (0.0, 1.0, 1.0) without neighbors. Reads stored values (a
+        lazy edge owes decay, so its current reservoirs are no larger
+        while decay <= 1). Mutates nothing.
+        """
+        rels = self._rels
+        key = self._key
+        reach = 0.0
+        fastest = slowest = 1.0
+
+        for other in self._neighbors.get(agent_id, ()):
+            rel = rels[key(agent_id, other)]
+            pos_decay = rel["pos_decay"]
+            neg_decay = rel["neg_decay"]
+
+            reach = max(reach, rel.get("pos", 0.0), rel.get("neg", 0.0))
+            fastest = min(fastest, pos_decay, neg_decay)
+            slowest = max(slowest, pos_decay, neg_decay)
+
+        return reach, fastest, slowest
+
+    def trust_summary(self, strong: float, hostile: float, lowest: int = 0) -> dict:
+        """
+        One pass over every edge:
+        count, trust >= strong, trust <= hostile, min / sum of trust,
+        and with `lowest` the lowest edges as (trust, key), lowest first.
+        """
+        self.materialize()
+
+        trusts = [rel.get("pos", 0.0) - rel.get("neg", 0.0) for rel in self._rels.values()]
+        band = (strong, hostile)
+
+        return self._summarize(trusts, (band,), lowest)[band]
+
+    def _summarize(self, trusts, bands, lowest):
+        """_summaries(), with the lowest edges listed by key."""
+        out = _summaries(trusts, bands, lowest)
+
+        if lowest:
+            low = next(iter(out.values()))["lowest"]
+            keys = self._keys_at([i for _, i in low])
+            low[:] = [(trust, key) for (trust, _), key in zip(low, keys)]
+
+        return out
+
+    def _keys_at(self, positions):
+        """Edge keys at `positions` (edge order)."""
+        keys = list(self._rels)
+        return [keys[i] for i in positions]
+
     def all(self):
+        self.materialize()
         return self._rels
 
+    def pairs(self):
+        """Every edge once, as (a, b) in key order (a <= b)."""
+        for a, neighbors in self._neighbors.items():
+            for b in neighbors:
+                if not b < a:
+                    yield a, b
+
+    def trust_bands(self, bounds):
+        """
+        Band of every edge's current trust, in edge order: the number of
+        (ascending) `bounds` strictly below it, so trust <= bounds[0] is
+        band 0. A NumPy array when available, else bytes.
+        Lazy decay is computed on the fly: no edge is caught up.
+        """
+        trusts = self._peek_trusts()
+
+        if np is not None:
+            return np.searchsorted(bounds, trusts, side="left").astype(np.uint8)
+
+        return bytes(bisect_left(bounds, trust) for trust in trusts)
+
+    def _peek_trusts(self):
+        """Current trust of every edge, in edge order. Mutates nothing."""
+        rels = self._rels
+
+        if not self._lazy or self._synced == self._clock:
+            return [rel.get("pos", 0.0) - rel.get("neg", 0.0) for rel in rels.values()]
+
+        stamps = self._stamps
+        clock = self._clock
+        synced = self._synced
+        trusts = []
+        append = trusts.append
+
+        for key, rel in rels.items():
+            pos = rel.get("pos", 0.0)
+            neg = rel.get("neg", 0.0)
+            dt = clock - stamps.get(key, synced)
+
+            if dt:
+                pos *= rel["pos_decay"] ** dt
+                neg *= rel["neg_decay"] ** dt
+
+            append(pos - neg)
+
+        return trusts
+
+    def pairs_at(self, positions):
+        """(a, b) of the edges at the given edge-order positions (a sequence)."""
+        return zip(
+            map(self._lo_names.__getitem__, positions),
+            map(self._hi_names.__getitem__, positions),
+        )
+
+    def edge_rows(self):
+        """
+        Every edge once, materialized, as flat tuples
+        (a, b, trust, pos, neg, attachment, pos_gain, neg_gain,
+        pos_decay, neg_decay), with trust = pos - neg.
+        Streams from storage: nothing is copied up front.
+        """
+        self.materialize()
+
+        defaults = (self.pos_gain, self.neg_gain, self.pos_decay, self.neg_decay)
+
+        for a, b, rel in zip(self._lo_names, self._hi_names, self._rels.values()):
+            get = rel.get
+            pos = get("pos", 0.0)
+            neg = get("neg", 0.0)
+
+            yield (
+                a, b, pos - neg, pos, neg, get("attachment", 0.0),
+                *(get(name, default) for name, default in zip(_PARAM_FIELDS, defaults)),
+            )
+
+    def nodes(self):
+        """Every agent with at least one relationship, in first-interaction order."""
+        return iter(self._neighbors)
+
     def neighbors(self, agent_id: str):
+        """
+        Neighbors of an agent in first-interaction order (stable, replayable).
+        """
         return self._neighbors.get(agent_id, [])
+
+    def has_neighbor(self, a: str, b: str) -> bool:
+        """O(1) adjacency check (backed by the edge map)."""
+        return self._key(a, b) in self._rels
+
+    # -----------------------------
+    # CHANGE JOURNALS
+    # -----------------------------
+    def changed_since(self, stamp):
+        """
+        ("a|b", rel) for edges touched at or after cycle `stamp`,
+        or None when a decay tick touched every edge (or the journal does
+        not reach back to `stamp`).
+        """
+        if self._decayed_at >= stamp or not self._touched.covers(stamp):
+            return None
+
+        rels = self._rels
+        return [(key, rels[key]) for key in self._touched.since(stamp)]
+
+    def created_since(self, stamp):
+        """("a|b", rel) for edges created at or after cycle `stamp`, in order."""
+        rels = self._rels
+        start = self._grown.size_at(stamp, len(rels))
+        return list(islice(rels.items(), start, None))
+
+    def _pairs_created_since(self, stamp):
+        start = self._grown.size_at(stamp, len(self._rels))
+        return list(zip(self._lo_names[start:], self._hi_names[start:]))
+
+    def neighbors_added_since(self, stamp) -> dict:
+        """
+        agent_id -> neighbors appended at or after cycle `stamp`
+        (whole lists for agents that gained their first neighbor).
+        """
+        neighbors = self._neighbors
+
+        # creations not journaled that far back: send every list whole
+        # (apply_snapshot_delta skips neighbors it already has)
+        if not self._touched.covers(stamp):
+            return {agent_id: list(nbrs) for agent_id, nbrs in neighbors.items()}
+
+        start = self._neighbors_grown.size_at(stamp, len(neighbors))
+
+        out = {
+            agent_id: list(nbrs)
+            for agent_id, nbrs in islice(neighbors.items(), start, None)
+        }
+        fresh = set(out)
+
+        # older lists only grow by edge creation, in creation order
+        for a, b in self._pairs_created_since(stamp):
+            if a not in fresh:
+                out.setdefault(a, []).append(b)
+            if a != b and b not in fresh:
+                out.setdefault(b, []).append(a)
+
+        return out
+
+    def neighbors_changed_since(self, stamp):
+        """
+        (agent_id, neighbor list) for lists grown at or after cycle `stamp`,
+        or None when the journal does not reach back to `stamp`.
+        """
+        if not self._neighbors_touched.covers(stamp):
+            return None
+
+        neighbors = self._neighbors
+        return [
+            (agent_id, neighbors[agent_id])
+            for agent_id in self._neighbors_touched.since(stamp)
+        ]
+
+    def journals(self):
+        """Change journals (see ghost.snapshot.TouchJournal)."""
+        return (self._touched, self._neighbors_touched)
+
+    def start_journals(self, stamp):
+        """Start recording changes (the first snapshot was taken at `stamp`)."""
+        for journal in self.journals():
+            journal.start(stamp)
+
+    def trim_journals(self, floor):
+        """Forget changes made before cycle `floor`."""
+        for journal in self.journals():
+            journal.trim(floor)
+
+
+_PARAM_FIELDS = ("pos_gain", "neg_gain", "pos_decay", "neg_decay")
+
+
+def _adopted_ends(rels, neighbors):
+    """
+    (a, b) with a <= b for every edge of an adopted context, in `rels`
+    order, matched through its neighbor lists. Only keys the lists do
+    not cover (a context saved without them) are split on "|".
+    """
+    ends = {}
+    for a, nbrs in neighbors.items():
+        for b in nbrs:
+            if not b < a:
+                ends[f"{a}|{b}"] = (a, b)
+
+    out = []
+    for key in rels:
+        pair = ends.get(key)
+        if pair is None:
+            a, _, b = key.partition("|")
+            pair = (a, b)
+        out.append(pair)
+
+    return out
+
+
+def _summaries(trusts, bands, lowest):
+    """
+    trust_summary() figures for every (strong, hostile) of `bands` over
+    the edge trusts; with `lowest`, "lowest" lists the lowest edges as
+    (trust, position), lowest first (one list shared by every band).
+    """
+    n = len(trusts)
+
+    if np is not None:
+        trusts = np.asarray(trusts, dtype=np.float64)
+        total = float(trusts.sum()) if n else 0.0
+
+        if lowest and n:
+            k = min(lowest, n)
+
+            # a sample's k-th lowest is no lower than the whole column's:
+            # one comparison narrows the partition to the edges under it
+            sample = trusts[:: max(1, n // (64 * k))]
+            picked = np.flatnonzero(trusts <= np.partition(sample, k - 1)[k - 1])
+            if len(picked) > k:
+                picked = picked[np.argpartition(trusts[picked], k - 1)[:k]]
+
+            picked = picked[np.argsort(trusts[picked], kind="stable")].tolist()
+        else:
+            picked = []
+
+        if picked:
+            min_trust = float(trusts[picked[0]])
+        else:
+            min_trust = float(trusts.min()) if n else None
+        counted = [
+            (int(np.count_nonzero(trusts >= strong)), int(np.count_nonzero(trusts <= hostile)))
+            for strong, hostile in bands
+        ]
+    else:
+        total = 0.0
+        for trust in trusts:
+            total += trust
+
+        picked = nsmallest(lowest, range(n), key=trusts.__getitem__)
+        min_trust = min(trusts) if n else None
+        counted = [
+            (sum(trust >= strong for trust in trusts), sum(trust <= hostile for trust in trusts))
+            for strong, hostile in bands
+        ]
+
+    low = [(float(trusts[i]), i) for i in picked]
+    out = {}
+
+    for band, (strong_edges, hostile_edges) in zip(bands, counted):
+        summary = out[band] = {
+            "edges": n,
+            "strong_edges": strong_edges,
+            "hostile_edges": hostile_edges,
+            "min_trust": min_trust,
+            "total_trust": total,
+        }
+        if lowest:
+            summary["lowest"] = low
+
+    return out
+
+
+def _bulk_slots(sources, targets):
+    """
+    Group events by edge (either orientation) without a per-event
+    Python loop: agent ids are interned to index arrays, then pairs are
+    grouped by np.unique on packed keys. Slots are numbered in first-
+    appearance order; returns (slot per event, first event of each
+    slot, agent names, source / target index per event).
+    """
+    n = len(sources)
+
+    # agent ranks in key order, so min/max rank is the (a <= b) key order
+    names = sorted(set(sources).union(targets))
+    rank = {agent: i for i, agent in enumerate(names)}
+
+    src = np.fromiter(map(rank.__getitem__, sources), dtype=np.int64, count=n)
+    dst = np.fromiter(map(rank.__getitem__, targets), dtype=np.int64, count=n)
+    code = np.minimum(src, dst) * len(names) + np.maximum(src, dst)
+
+    order = _radix_order(code, len(names) ** 2)
+    ranked = code[order]
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = ranked[1:] != ranked[:-1]
+
+    # the order is stable: a pair's first entry is its first event
+    first = order[starts]
+
+    # number the pairs by their first event (a running count, no sort)
+    opens = np.zeros(n, dtype=bool)
+    opens[first] = True
+    slot = np.empty(n, dtype=np.intp)
+    slot[order] = (np.cumsum(opens, dtype=np.intp) - 1)[first][np.cumsum(starts) - 1]
+
+    return slot, np.flatnonzero(opens), names, src, dst
+
+
+def _radix_order(keys, bound):
+    """
+    Stable argsort of non-negative int keys below `bound`: a lexsort
+    over 16-bit digits, which NumPy radix-sorts.
+    """
+    digits = [(keys & 0xFFFF).astype(np.uint16)]
+    shift = 16
+
+    while bound > 1 << shift:
+        digits.append(((keys >> shift) & 0xFFFF).astype(np.uint16))
+        shift += 16
+
+    return np.lexsort(digits)
+
+
+def _first_use(values, size):
+    """The distinct values (ints below `size`) in order of first occurrence."""
+    at = np.full(size, len(values), dtype=np.intp)
+    np.minimum.at(at, values, np.arange(len(values)))
+
+    used = np.flatnonzero(at < len(values))
+    return used[np.argsort(at[used])]
+
+
+class CompactRelationshipGraph(RelationshipGraph):
+    """
+    Integer-keyed relationship storage (ctx["relationship_store"] = "compact").
+
+    - agent ids are interned to integer indices
+    - pairs are keyed by a packed int: (lo_index << 32) | hi_index
+    - pos / neg / trust / attachment live in array('d') columns
+    - per-edge parameters are a profile index into a shared table
+      (one entry per personality preset / custom parameter set)
+
+    ctx["relationships"] is a dict-like "a|b" view, so all() and
+    snapshot() keep the same shape as the dict store.
+    """
+
+    def __init__(self, ctx: dict):
+        existing = ctx.get("relationships") or {}
+
+        self._ctx = ctx
+
+        # hold the "relationships" slot before "neighbors", so the ctx
+        # (and snapshot()) keeps the dict store's key order
+        ctx.setdefault("relationships", existing)
+        self._neighbors = ctx.setdefault("neighbors", {})
+
+        self._read_params(ctx)
+
+        # agent interning
+        self._agent_index = {}
+        self._agent_ids = []
+
+        # pair key -> edge index
+        self._edges = {}
+
+        # edge columns
+        self._lo = array("I")
+        self._hi = array("I")
+        self._pos = array("d")
+        self._neg = array("d")
+        self._trust = array("d")
+        self._attachment = array("d")
+        self._has_trust = bytearray()
+        self._profile = array("I")
+        self._stamp = array("d")  # lazy mode: clock of last materialization
+        self._extra = {}  # edge index -> non-standard keys
+
+        # shared parameter profiles: (pos_gain, neg_gain, pos_decay, neg_decay)
+        self._profiles = []
+        self._profile_ids = {}
+        self._profile_for(
+            (self.pos_gain, self.neg_gain, self.pos_decay, self.neg_decay)
+        )
+
+        self._rels = RelationshipTable(self)
+        ctx["relationships"] = self._rels
+
+        # adopt relationships from a provided context
+        # (its neighbor lists may already hold these pairs)
+        self._adopting = True
+        for (a, b), rel in zip(_adopted_ends(existing, self._neighbors), existing.values()):
+            view = self.ensure_pair(a, b)
+            for k, v in rel.items():
+                view[k] = v
+        self._adopting = False
+
+    def _profile_for(self, params: tuple) -> int:
+        p = self._profile_ids.get(params)
+
+        if p is None:
+            p = len(self._profiles)
+            self._profiles.append(params)
+            self._profile_ids[params] = p
+
+        return p
+
+    def _intern(self, agent_id) -> int:
+        i = self._agent_index.get(agent_id)
+
+        if i is None:
+            i = len(self._agent_ids)
+            self._agent_index[agent_id] = i
+            self._agent_ids.append(agent_id)
+
+        return i
+
+    def _edge_index(self, a: str, b: str):
+        """Edge index for a pair, or None (never creates)."""
+        if b < a:
+            a, b = b, a
+
+        index = self._agent_index
+        ia = index.get(a)
+        ib = index.get(b)
+
+        if ia is None or ib is None:
+            return None
+
+        return self._edges.get((ia << 32) | ib)
+
+    def _ensure_index(self, a: str, b: str) -> int:
+        lo, hi = (b, a) if b < a else (a, b)
+
+        index = self._agent_index
+        ia = index.get(lo)
+        if ia is None:
+            ia = self._intern(lo)
+        ib = index.get(hi)
+        if ib is None:
+            ib = self._intern(hi)
+
+        key = (ia << 32) | ib
+        i = self._edges.get(key)
+        stamp = self._ctx.get("cycles", 0)
+
+        if i is not None:
+            self._touched.touch(i, stamp)
+            if self._lazy:
+                self._catch_up(i)
+            return i
+
+        i = len(self._pos)
+        self._edges[key] = i
+
+        self._grown.mark(stamp, i)
+        self._neighbors_grown.mark(stamp, len(self._neighbors))
+
+        self._lo.append(ia)
+        self._hi.append(ib)
+        self._pos.append(0.0)
+        self._neg.append(0.0)
+        self._trust.append(0.0)
+        self._attachment.append(0.0)
+        self._has_trust.append(0)
+        self._profile.append(0)
+        self._stamp.append(self._clock)
+
+        # a new edge is always a new neighbor pair
+        neighbors = self._neighbors
+        a_list = neighbors.setdefault(a, [])
+        b_list = neighbors.setdefault(b, [])
+
+        if not self._adopting or b not in a_list:
+            a_list.append(b)
+
+        if a != b and (not self._adopting or a not in b_list):
+            b_list.append(a)
+
+        self._touched.touch(i, stamp)
+        self._neighbors_touched.touch(a, stamp)
+        self._neighbors_touched.touch(b, stamp)
+
+        if self._observers:
+            self._notify_create(a, b)
+
+        return i
+
+    def ensure_pair(self, a: str, b: str):
+        return RelationView(self, self._ensure_index(a, b))
+
+    def set_params(self, a: str, b: str, **params):
+        i = self._ensure_index(a, b)
+        rel = RelationView(self, i)
+
+        observers = self._observers
+        if observers:
+            old_trust = self._pos[i] - self._neg[i]
+
+        # resolve the parameter profile once (no intermediate profiles)
+        profile = list(self._profiles[self._profile[i]])
+        for k, v in params.items():
+            if k in _PARAM_FIELDS:
+                profile[_PARAM_FIELDS.index(k)] = v
+            elif k in rel:
+                rel[k] = v
+
+        self._profile[i] = self._profile_for(tuple(profile))
+
+        if observers:
+            self._notify_delta(a, b, old_trust, rel)
+
+    def apply_delta(self, a: str, b: str, deltas: dict):
+        i = self._ensure_index(a, b)
+
+        observers = self._observers
+        if observers:
+            old_trust = self._pos[i] - self._neg[i]
+
+        for k, v in deltas.items():
+
+            if k == "trust":
+                # EXACT ACCUMULATION (TEST SAFE)
+                self._trust[i] += v
+                self._has_trust[i] = 1
+
+                if v > 0:
+                    self._pos[i] += v
+                elif v < 0:
+                    self._neg[i] += abs(v)
+
+                continue
+
+            if k == "attachment":
+                self._attachment[i] += v
+            elif k == "pos":
+                self._pos[i] += v
+            elif k == "neg":
+                self._neg[i] += v
+            else:
+                rel = RelationView(self, i)
+                rel[k] = rel.get(k, 0.0) + v
+
+        if observers:
+            self._notify_delta(a, b, old_trust, RelationView(self, i))
+
+        return RelationView(self, i)
+
+    def apply_core_delta(self, a: str, b: str, trust=None, attachment=None):
+        i = self._ensure_index(a, b)
+
+        observers = self._observers
+        if observers:
+            old_trust = self._pos[i] - self._neg[i]
+
+        if trust is not None:
+            self._trust[i] += trust
+            self._has_trust[i] = 1
+
+            if trust > 0:
+                self._pos[i] += trust
+            elif trust < 0:
+                self._neg[i] += abs(trust)
+
+        if attachment is not None:
+            self._attachment[i] += attachment
+
+        if observers:
+            self._notify_delta(a, b, old_trust, RelationView(self, i))
+
+    def _bulk_index(self, sources, targets):
+        # slots map straight to edge indices
+        slots, first, names, src, dst = _bulk_slots(sources, targets)
+        a = src[first]
+        b = dst[first]
+        lo = np.minimum(a, b)
+        hi = np.maximum(a, b)
+
+        index = self._agent_index
+        interned = np.fromiter(map(index.get, names, repeat(-1)), dtype=np.int64, count=len(names))
+
+        edges = np.full(len(first), -1, dtype=np.int64)
+        known = np.flatnonzero((interned[lo] >= 0) & (interned[hi] >= 0))
+        packed = ((interned[lo[known]] << 32) | interned[hi[known]]).tolist()
+        edges[known] = np.fromiter(map(self._edges.get, packed, repeat(-1)), dtype=np.int64, count=len(known))
+
+        new = np.flatnonzero(edges < 0)
+        stamp = self._ctx.get("cycles", 0)
+
+        if self._lazy:
+            catch_up = self._catch_up
+            for i in edges[edges >= 0].tolist():
+                catch_up(i)
+
+        if len(new):
+            start = len(self._pos)
+            m = len(new)
+
+            self._grown.mark(stamp, start)
+            self._neighbors_grown.mark(stamp, len(self._neighbors))
+
+            # intern new agents in first-use order (lo, then hi, edge by edge)
+            used = np.column_stack((lo[new], hi[new])).ravel()
+            used = _first_use(used, len(names))
+            intern = self._intern
+            for r in used[interned[used] < 0].tolist():
+                interned[r] = intern(names[r])
+
+            new_lo = interned[lo[new]]
+            new_hi = interned[hi[new]]
+            edges[new] = np.arange(start, start + m)
+            self._edges.update(zip(((new_lo << 32) | new_hi).tolist(), range(start, start + m)))
+
+            self._lo.frombytes(new_lo.astype(f"u{self._lo.itemsize}").tobytes())
+            self._hi.frombytes(new_hi.astype(f"u{self._hi.itemsize}").tobytes())
+            zeros = bytes(8 * m)
+            for column in (self._pos, self._neg, self._trust, self._attachment):
+                column.frombytes(zeros)
+            self._has_trust.extend(bytes(m))
+            self._profile.frombytes(bytes(self._profile.itemsize * m))
+            self._stamp.frombytes(np.full(m, self._clock, dtype=np.float64).tobytes())
+
+            self._bulk_neighbors(names, a[new], b[new], stamp)
+
+        self._touched.touch_many(edges.tolist(), stamp)
+
+        return edges[slots], None
+
+    def _bulk_add(self, idx, rels, mask, values, field):
+        sel = idx[mask]
+        if not len(sel):
+            return
+
+        if field == "trust":
+            np.frombuffer(self._has_trust, dtype=np.uint8)[sel] = 1
+
+        column = np.frombuffer(getattr(self, "_" + field), dtype=np.float64)
+        np.add.at(column, sel, values[mask])
+
+    def tick(self, dt=1):
+        """
+        Decay every edge by `dt` time units in one vectorized pass.
+
+        Per-edge decays are gathered from the profile table, so the
+        result is bit-for-bit the same as the per-dict loop.
+        In lazy mode only the clock advances.
+        """
+        if dt < 0:
+            raise ValueError("dt must be >= 0")
+
+        if self._observers:
+            self._notify_before_tick(dt)
+
+        self._decayed_at = self._ctx.get("cycles", 0)
+        summaries = None
+
+        if self._lazy:
+            self._clock += dt
+        elif self._pos and dt:
+            bands = self._summary_bands() if self._observers else None
+
+            if np is not None:
+                summaries = self._tick_numpy(dt, bands)
+            else:
+                summaries = self._tick_array(dt, bands)
+
+        if self._observers:
+            self._notify_tick(dt, summaries)
+
+    def _profile_decays(self, dt):
+        """Per-profile (pos, neg) decay factors for one tick of `dt`."""
+        if dt == 1:
+            pos_decay = [params[2] for params in self._profiles]
+            neg_decay = [params[3] for params in self._profiles]
+        else:
+            pos_decay = [params[2] ** dt for params in self._profiles]
+            neg_decay = [params[3] ** dt for params in self._profiles]
+
+        return pos_decay, neg_decay
+
+    def _tick_numpy(self, dt=1, bands=None):
+        # zero-copy views over the array('d') columns
+        # (released on return, so the columns can keep growing)
+        pos = np.frombuffer(self._pos, dtype=np.float64)
+        neg = np.frombuffer(self._neg, dtype=np.float64)
+
+        pos_decay, neg_decay = self._profile_decays(dt)
+
+        if len(self._profiles) == 1:
+            pos_decay = pos_decay[0]
+            neg_decay = neg_decay[0]
+        else:
+            profile = np.frombuffer(self._profile, dtype=f"u{self._profile.itemsize}")
+            pos_decay = np.array(pos_decay, dtype=np.float64)[profile]
+            neg_decay = np.array(neg_decay, dtype=np.float64)[profile]
+
+        pos *= pos_decay
+        neg *= neg_decay
+
+        if bands:
+            return self._summarize(pos - neg, bands, self.SUMMARY_LOWEST)
+
+    def _tick_array(self, dt=1, bands=None):
+        pos_decay, neg_decay = self._profile_decays(dt)
+
+        self._pos[:] = array("d", map(mul, self._pos, map(pos_decay.__getitem__, self._profile)))
+        self._neg[:] = array("d", map(mul, self._neg, map(neg_decay.__getitem__, self._profile)))
+
+        if bands:
+            return self._summarize(list(map(sub, self._pos, self._neg)), bands, self.SUMMARY_LOWEST)
+
+    def _catch_up(self, i: int):
+        """Lazy mode: apply the decay owed since the edge was last touched."""
+        dt = self._clock - self._stamp[i]
+
+        if dt:
+            _, _, pos_decay, neg_decay = self._profiles[self._profile[i]]
+            self._pos[i] *= pos_decay ** dt
+            self._neg[i] *= neg_decay ** dt
+            self._stamp[i] = self._clock
+
+    def materialize(self):
+        """
+        Lazy mode: bring every edge up to the current clock in one pass.
+        """
+        if not self._lazy or self._synced == self._clock:
+            return
+
+        if self._pos:
+            if np is not None:
+                self._materialize_numpy()
+            else:
+                for i in range(len(self._pos)):
+                    self._catch_up(i)
+
+        self._synced = self._clock
+
+    def _materialize_numpy(self):
+        pos = np.frombuffer(self._pos, dtype=np.float64)
+        neg = np.frombuffer(self._neg, dtype=np.float64)
+        pos_owed, neg_owed = self._owed_decay()
+
+        pos *= pos_owed
+        neg *= neg_owed
+        np.frombuffer(self._stamp, dtype=np.float64)[:] = self._clock
+
+    def _owed_decay(self):
+        """Lazy mode: (pos, neg) decay factors every edge owes, as arrays."""
+        table = np.array(self._profiles, dtype=np.float64)
+        profile = np.frombuffer(self._profile, dtype=f"u{self._profile.itemsize}")
+
+        dt = self._clock - np.frombuffer(self._stamp, dtype=np.float64)
+        return table[profile, 2] ** dt, table[profile, 3] ** dt
+
+    def get(self, a: str, b: str):
+        i = self._edge_index(a, b)
+
+        if i is None:
+            return None
+
+        if self._lazy:
+            self._catch_up(i)
+
+        pos = self._pos[i]
+        neg = self._neg[i]
+        pos_gain, neg_gain, pos_decay, neg_decay = self._profiles[self._profile[i]]
+
+        out = {
+            "pos": pos,
+            "neg": neg,
+            "attachment": self._attachment[i],
+            "pos_gain": pos_gain,
+            "neg_gain": neg_gain,
+            "pos_decay": pos_decay,
+            "neg_decay": neg_decay,
+        }
+
+        extra = self._extra.get(i)
+        if extra:
+            out.update(extra)
+
+        out["trust"] = pos - neg
+
+        return out
+
+    def has_neighbor(self, a: str, b: str) -> bool:
+        return self._edge_index(a, b) is not None
+
+    def trust(self, a: str, b: str):
+        i = self._edge_index(a, b)
+
+        if i is None:
+            return None
+
+        if self._lazy:
+            self._catch_up(i)
+
+        return self._pos[i] - self._neg[i]
+
+    def reservoirs(self, a: str, b: str):
+        i = self._edge_index(a, b)
+
+        if i is None:
+            return None
+
+        if self._lazy:
+            self._catch_up(i)
+
+        return self._pos[i], self._neg[i]
+
+    def peek(self, a: str, b: str):
+        i = self._edge_index(a, b)
+
+        if i is None:
+            return None
+
+        return self._peek(i)
+
+    def _peek(self, i: int):
+        pos = self._pos[i]
+        neg = self._neg[i]
+
+        if self._lazy:
+            dt = self._clock - self._stamp[i]
+            if dt:
+                _, _, pos_decay, neg_decay = self._profiles[self._profile[i]]
+                pos *= pos_decay ** dt
+                neg *= neg_decay ** dt
+
+        return pos - neg, self._attachment[i]
+
+    def peek_neighbors(self, agent_id: str):
+        neighbors = self._neighbors.get(agent_id)
+        if not neighbors:
+            return
+
+        index = self._agent_index
+        edges = self._edges
+        peek = self._peek
+        ia = index[agent_id]
+
+        for other in neighbors:
+            ib = index[other]
+            # edge keys are (lo, hi) in agent id order
+            i = edges[(ib << 32) | ia] if other < agent_id else edges[(ia << 32) | ib]
+            yield (other, *peek(i))
+
+    def reservoir_bounds(self, agent_id: str):
+        neighbors = self._neighbors.get(agent_id)
+        if not neighbors:
+            return 0.0, 1.0, 1.0
+
+        index = self._agent_index
+        edges = self._edges
+        ia = index[agent_id]
+        reach = 0.0
+        used = set()
+
+        for other in neighbors:
+            ib = index[other]
+            i = edges[(ib << 32) | ia] if other < agent_id else edges[(ia << 32) | ib]
+            reach = max(reach, self._pos[i], self._neg[i])
+            used.add(self._profile[i])
+
+        decays = [d for p in used for d in self._profiles[p][2:]]
+        return reach, min(1.0, *decays), max(1.0, *decays)
+
+    def trust_summary(self, strong: float, hostile: float, lowest: int = 0) -> dict:
+        if np is None or not self._pos:
+            return super().trust_summary(strong, hostile, lowest)
+
+        self.materialize()
+
+        trust = (
+            np.frombuffer(self._pos, dtype=np.float64)
+            - np.frombuffer(self._neg, dtype=np.float64)
+        )
+        band = (strong, hostile)
+
+        return self._summarize(trust, (band,), lowest)[band]
+
+    def _keys_at(self, positions):
+        return [self._key(*self._pair_names(i)) for i in positions]
+
+    def _pair_names(self, i: int):
+        ids = self._agent_ids
+        return ids[self._lo[i]], ids[self._hi[i]]
+
+    def pairs(self):
+        """Every edge once, as (a, b) in creation order (a <= b)."""
+        ids = self._agent_ids
+        return zip(map(ids.__getitem__, self._lo), map(ids.__getitem__, self._hi))
+
+    def edge_rows(self):
+        self.materialize()
+
+        ids = self._agent_ids
+        profiles = self._profiles
+        attachment = self._attachment
+
+        for i, (lo, hi, pos, neg, p) in enumerate(
+            zip(self._lo, self._hi, self._pos, self._neg, self._profile)
+        ):
+            yield (ids[lo], ids[hi], pos - neg, pos, neg, attachment[i], *profiles[p])
+
+    def trust_bands(self, bounds):
+        if np is None or not self._pos:
+            return super().trust_bands(bounds)
+
+        pos = np.frombuffer(self._pos, dtype=np.float64)
+        neg = np.frombuffer(self._neg, dtype=np.float64)
+
+        if self._lazy and self._synced != self._clock:
+            pos_owed, neg_owed = self._owed_decay()
+            pos = pos * pos_owed
+            neg = neg * neg_owed
+
+        trust = pos - neg
+
+        return np.searchsorted(bounds, trust, side="left").astype(np.uint8)
+
+    def _peek_trusts(self):
+        peek = self._peek
+        return [peek(i)[0] for i in range(len(self._pos))]
+
+    def pairs_at(self, positions):
+        return map(self._pair_names, positions)
+
+    def changed_since(self, stamp):
+        if self._decayed_at >= stamp or not self._touched.covers(stamp):
+            return None
+
+        out = []
+        for i in self._touched.since(stamp):
+            a, b = self._pair_names(i)
+            out.append((f"{a}|{b}", RelationView(self, i)))
+
+        return out
+
+    def created_since(self, stamp):
+        n = len(self._pos)
+        out = []
+
+        for i in range(self._grown.size_at(stamp, n), n):
+            a, b = self._pair_names(i)
+            out.append((f"{a}|{b}", RelationView(self, i)))
+
+        return out
+
+    def _pairs_created_since(self, stamp):
+        n = len(self._pos)
+        return [self._pair_names(i) for i in range(self._grown.size_at(stamp, n), n)]
+
+
+class RelationView(MutableMapping):
+    """
+    Dict-like view of one edge in a CompactRelationshipGraph.
+    """
+
+    __slots__ = ("_graph", "_i")
+
+    _COLUMNS = ("pos", "neg", "attachment")
+
+    def __init__(self, graph: CompactRelationshipGraph, i: int):
+        self._graph = graph
+        self._i = i
+
+    def __getitem__(self, key):
+        g = self._graph
+        i = self._i
+
+        if key == "pos":
+            return g._pos[i]
+        if key == "neg":
+            return g._neg[i]
+        if key == "attachment":
+            return g._attachment[i]
+        if key == "trust" and g._has_trust[i]:
+            return g._trust[i]
+        if key in _PARAM_FIELDS:
+            return g._profiles[g._profile[i]][_PARAM_FIELDS.index(key)]
+
+        extra = g._extra.get(i)
+        if extra is None or key not in extra:
+            raise KeyError(key)
+
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        g = self._graph
+        i = self._i
+
+        if key == "pos":
+            g._pos[i] = value
+        elif key == "neg":
+            g._neg[i] = value
+        elif key == "attachment":
+            g._attachment[i] = value
+        elif key == "trust":
+            g._trust[i] = value
+            g._has_trust[i] = 1
+        elif key in _PARAM_FIELDS:
+            params = list(g._profiles[g._profile[i]])
+            params[_PARAM_FIELDS.index(key)] = value
+            g._profile[i] = g._profile_for(tuple(params))
+        else:
+            g._extra.setdefault(i, {})[key] = value
+
+    def __delitem__(self, key):
+        extra = self._graph._extra.get(self._i)
+        if extra is None or key not in extra:
+            raise TypeError(f"cannot delete core relationship field: {key}")
+
+        del extra[key]
+
+    def __iter__(self):
+        g = self._graph
+
+        yield from self._COLUMNS
+        yield from _PARAM_FIELDS
+
+        if g._has_trust[self._i]:
+            yield "trust"
+
+        yield from g._extra.get(self._i, ())
+
+    def __len__(self):
+        g = self._graph
+        return 7 + g._has_trust[self._i] + len(g._extra.get(self._i, ()))
+
+    def __repr__(self):
+        return repr(self._plain())
+
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(self._plain(), memo)
+
+    def _plain(self) -> dict:
+        """Plain dict copy, same layout as a dict-store relationship."""
+        g = self._graph
+        i = self._i
+        pos_gain, neg_gain, pos_decay, neg_decay = g._profiles[g._profile[i]]
+
+        out = {
+            "pos": g._pos[i],
+            "neg": g._neg[i],
+            "attachment": g._attachment[i],
+            "pos_gain": pos_gain,
+            "neg_gain": neg_gain,
+            "pos_decay": pos_decay,
+            "neg_decay": neg_decay,
+        }
+
+        if g._has_trust[i]:
+            out["trust"] = g._trust[i]
+
+        out.update(g._extra.get(i, ()))
+
+        return out
+
+
+class RelationshipTable(Mapping):
+    """
+    Read-only "a|b" -> RelationView mapping over a CompactRelationshipGraph.
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: CompactRelationshipGraph):
+        self._graph = graph
+
+    def _index_of(self, key):
+        if not isinstance(key, str):
+            return None
+
+        # ids may themselves contain "|": try every split point
+        start = key.find("|")
+        while start != -1:
+            i = self._graph._edge_index(key[:start], key[start + 1:])
+            if i is not None:
+                return i
+            start = key.find("|", start + 1)
+
+        return None
+
+    def __getitem__(self, key):
+        i = self._index_of(key)
+
+        if i is None:
+            raise KeyError(key)
+
+        return RelationView(self._graph, i)
+
+    def __contains__(self, key):
+        return self._index_of(key) is not None
+
+    def __iter__(self):
+        g = self._graph
+        for i in range(len(g._pos)):
+            a, b = g._pair_names(i)
+            yield f"{a}|{b}"
+
+    def __len__(self):
+        return len(self._graph._pos)
+
+    def items(self):
+        g = self._graph
+        for i in range(len(g._pos)):
+            a, b = g._pair_names(i)
+            yield f"{a}|{b}", RelationView(g, i)
+
+    def values(self):
+        g = self._graph
+        for i in range(len(g._pos)):
+            yield RelationView(g, i)
+
+    def __repr__(self):
+        return repr({k: v._plain() for k, v in self.items()})
+
+    def __deepcopy__(self, memo):
+        import copy
+        return {k: copy.deepcopy(v._plain(), memo) for k, v in self.items()}
@@ -0,0 +1,1008 @@
+"""
+Sharded world execution across worker processes.
+
+Agents are partitioned across shards by a stable hash of their id.
+Each shard owns the state of its agents, plus every relationship that
+touches one of them, and replays its part of the input in order:
+
+- direct effects (actor / target mood, tension, relationship deltas)
+  are applied by the shards owning the agents involved
+- threat propagation (step) is applied by the shard owning each
+  *neighbor* (adjacency is symmetric, so that shard already knows the
+  edge)
+- a relationship broken by apply_event cascades to the first of the
+  target's neighbors: the target's shard picks them, the coordinator
+  forwards each to its own shard (a second pass over the batch)
+
+The coordinator validates and splits each batch once: a shard is sent
+only the rows touching its agents (actor, target, or a neighbor of a
+threat's target, tracked with a per-agent mask of the shards holding a
+neighbor); idle shards get no message. A bad row rejects the whole
+batch before any shard sees it. Global state (npc threat level and
+actor memory, runtime summaries) is kept by the coordinator.
+
+Because every agent's updates are applied in the same order as the
+sequential engine, the merged snapshot() is identical to the snapshot
+of a GhostEngine fed the same input.
+"""
+
+import heapq
+import multiprocessing
+import os
+import pickle
+import zlib
+from dataclasses import asdict
+
+from .agents import AgentRegistry
+from .engine import (
+    GhostEngine,
+    _AFFECT_RECOVERY,
+    _CASCADE_FANOUT,
+    _EVENT_KINDS,
+    _HOSTILE_TRUST,
+    _STEP_FIELDS,
+    _SUPPORT_EFFECTS,
+    _THREAT_DELTAS,
+    _clamp01,
+    _clamp_threat,
+    _columns,
+)
+from .propagation import ThreatPropagation
+from .relationships import CompactRelationshipGraph, RelationshipGraph
+from .snapshot import plain
+from .step import GhostStep
+
+
+def shard_of(agent_id, n_shards: int) -> int:
+    """Stable shard index for an agent id (same in every process)."""
+    return zlib.crc32(str(agent_id).encode("utf-8")) % n_shards
+
+
+# apply_event deltas as (trust, attachment, hostile), for apply_core_delta
+_EVENT_CORE = {
+    kind: (deltas["trust"], deltas.get("attachment"), hostile)
+    for kind, (_, _, _, _, deltas, hostile) in _EVENT_KINDS.items()
+}
+
+# keys a runner builds itself (it always starts from an empty world)
+_STATE_KEYS = ("agents", "relationships", "neighbors", "npc", "cycles", "input", "last_step")
+
+
+class ShardedRunner:
+    """
+    Runs one world on `n_shards` shards.
+
+    processes=True runs every shard in its own worker process;
+    processes=False runs them in-process (same results, no parallelism).
+
+    Takes GhostEngine's input: step() / step_many(), and the runtime
+    surface apply_event() / apply_events() / tick(dt). A batch is
+    validated before any shard sees it, so a bad row leaves the world
+    untouched.
+    """
+
+    def __init__(self, n_shards: int | None = None, context: dict | None = None, processes: bool = True):
+        config = dict(context or {})
+
+        for key in _STATE_KEYS:
+            if key in config:
+                raise ValueError(f"ShardedRunner starts from an empty world (got '{key}')")
+
+        relationship_store = config.get("relationship_store", "dict")
+        if relationship_store not in ("dict", "compact"):
+            raise ValueError(f"Unknown relationship_store: {relationship_store}")
+
+        # shards replay full single-hop propagation only
+        if not ThreatPropagation.from_ctx(config, None, None).unbounded:
+            raise ValueError("ShardedRunner does not support bounded threat propagation")
+
+        self.n_shards = n_shards or os.cpu_count() or 1
+        if self.n_shards < 1:
+            raise ValueError("n_shards must be >= 1")
+
+        self._config = config
+
+        # top-level key order of an engine built from the same config
+        self._layout = list(GhostEngine(dict(config)).state())
+
+        # coordinator-owned state
+        self._cycles = 0
+        self._input = None
+        self._npc = {"threat_level": 0.0, "last_intent": None}
+        self._mood = config.get("state", {}).get("mood", 0.5)
+
+        # keys apply_event / tick(dt) add to engine state, in the order
+        # the engine adds them
+        self._summary = {}
+
+        # rows sent so far (shards order what they create by row)
+        self._rows = 0
+
+        # routing: agent id -> shard index, agent id -> bit mask of the
+        # shards owning one of its neighbors, mask -> shard indexes
+        self._owner = {}
+        self._reach = {}
+        self._spread = {}
+
+        if processes:
+            self._shards = [_ShardProcess(i, self.n_shards, config) for i in range(self.n_shards)]
+        else:
+            self._shards = [_LocalShard(i, self.n_shards, config) for i in range(self.n_shards)]
+
+    # -----------------------------
+    # LIFECYCLE
+    # -----------------------------
+    def close(self):
+        for shard in self._shards:
+            shard.close()
+
+        self._shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------------
+    # STEPPING
+    # -----------------------------
+    def step(self, step_data=None):
+        """Advance the world by one cycle (same input as GhostEngine.step)."""
+        self.step_many((step_data,))
+
+    def step_many(self, events):
+        """
+        Advance the world by one cycle per event
+        (same input as GhostEngine.step_many).
+        """
+        (seqs, intents, actors, targets, intensities), picks, n_cycles, last_public = (
+            self._normalize(events)
+        )
+
+        # shards replay their rows in parallel ...
+        rows = self._rows
+        orders = range(rows, rows + len(seqs))
+        busy = self._send("run", (orders, intents, actors, targets, intensities), picks)
+
+        # ... while the coordinator advances the global npc state
+        self._advance_npc(seqs, intents, actors, intensities, n_cycles)
+
+        self._rows = rows + len(seqs)
+        self._cycles += n_cycles
+        if last_public is not None:
+            self._input = last_public
+
+        self._gather(busy)
+
+    # -----------------------------
+    # RUNTIME SURFACE
+    # -----------------------------
+    def apply_event(self, event: dict):
+        """Apply one social interaction (same input as GhostEngine.apply_event)."""
+        self.apply_events((event,))
+
+    def apply_events(self, events):
+        """
+        Apply social interactions in order, each as GhostEngine.apply_event
+        would. A bad event raises ValueError and applies none of them.
+        """
+        (kinds, actors, targets, intensities), picks = self._normalize_events(events)
+
+        rows = self._rows
+        orders = range(rows, rows + len(kinds))
+
+        # first pass: relationship deltas; each target's shard reports
+        # the relationships that broke and the neighbors they reach
+        busy = self._send("events", (orders, kinds, actors, targets, intensities), picks)
+        broken = heapq.merge(*self._gather(busy))
+
+        self._rows = rows + len(kinds)
+
+        # second pass: mood / tension, each cascade sent to the shards
+        # owning the neighbors it reaches
+        owner = self._owner
+        cascades = [[] for _ in self._shards]
+        count = 0
+
+        for order, neighbors in broken:
+            intensity = intensities[order - rows]
+            count += 1
+
+            for neighbor_id in neighbors:
+                cascades[owner[neighbor_id]].append((order, neighbor_id, intensity))
+
+        if count:
+            self._summary["cascade_events"] = self._summary.get("cascade_events", 0) + count
+
+        busy = []
+
+        for shard, pick, reached in zip(self._shards, picks, cascades):
+            if pick or reached:
+                shard.send(pickle.dumps(("settle", reached), pickle.HIGHEST_PROTOCOL))
+                busy.append(shard)
+
+        self._gather(busy)
+
+    def tick(self, dt: float = 1.0):
+        """
+        Advance runtime time by `dt` (same as GhostEngine.tick): every
+        shard decays its relationships and lets its agents recover, the
+        coordinator refreshes the global summaries.
+        """
+        payload = pickle.dumps(("tick", dt), pickle.HIGHEST_PROTOCOL)
+
+        for shard in self._shards:
+            shard.send(payload)
+
+        parts = self._gather()
+
+        # summed in creation order, as the engine sums them
+        tension = 0.0
+        for _, value in heapq.merge(*(zip(orders, tensions) for orders, tensions, _ in parts)):
+            tension += value
+
+        n = sum(len(orders) for orders, _, _ in parts)
+        settled = sum(part[2] for part in parts)
+
+        summary = self._summary
+        summary["global_tension"] = tension / n if n else 0.0
+        summary["stability_index"] = settled / n if n else 1.0
+
+    # -----------------------------
+    # BATCHES
+    # -----------------------------
+    def _normalize(self, events):
+        """
+        Validate and route a batch of steps (one pass).
+
+        Returns the columns (seq, intent, actor, target, intensity; None
+        steps dropped, seq counted in cycles), the rows each shard gets,
+        the number of cycles the batch advances and the public form of
+        the last step.
+        """
+        seqs = []
+        intents = []
+        actors = []
+        targets = []
+        intensities = []
+
+        add_seq = seqs.append
+        add_intent = intents.append
+        add_actor = actors.append
+        add_target = targets.append
+        add_intensity = intensities.append
+        fields = _STEP_FIELDS.issuperset
+
+        # routing (a rejected batch may leave extra bits in `reach`,
+        # which only sends a shard rows it has no effect from)
+        n_shards = self.n_shards
+        owner = self._owner
+        reach = self._reach
+        spread = self._spread
+        picks = [[] for _ in range(n_shards)]
+        adds = [pick.append for pick in picks]
+
+        if isinstance(events, dict):
+            rows, columns = _columns(events)
+            rows = zip(*rows)
+        else:
+            rows = events
+            columns = None
+
+        cycles = self._cycles
+        last_event = None
+        count = 0
+        row = 0
+
+        for event in rows:
+            cycles += 1
+
+            if event is None:
+                continue
+
+            if columns is not None:
+                intent, actor, target, intensity = event
+                count += 1
+            elif isinstance(event, dict):
+                # engine._step_row, inlined
+                if "source" not in event or not fields(event):
+                    GhostStep(**event)  # raises GhostStep's own TypeError
+
+                intent = event.get("intent")
+                actor = event.get("actor", "unknown")
+                target = event.get("target")
+                intensity = event.get("intensity", 0.0)
+            elif isinstance(event, GhostStep):
+                intent, actor, target, intensity = (
+                    event.intent, event.actor, event.target, event.intensity
+                )
+            else:
+                raise TypeError("step_data must be dict or GhostStep")
+
+            last_event = event
+
+            if not target:
+                target = None
+
+            add_seq(cycles)
+            add_intent(intent)
+            add_actor(actor)
+            add_target(target)
+            add_intensity(_clamp01(float(intensity)))
+
+            a = owner.get(actor)
+            if a is None:
+                a = owner[actor] = shard_of(actor, n_shards)
+
+            if target is None:
+                adds[a](row)
+                row += 1
+                continue
+
+            t = owner.get(target)
+            if t is None:
+                t = owner[target] = shard_of(target, n_shards)
+
+            if intent == "threat":
+                # the step creates (or reuses) the actor-target edge, then
+                # reaches the target's neighbors
+                reach[actor] = reach.get(actor, 0) | 1 << t
+                mask = reach[target] = reach.get(target, 0) | 1 << a
+
+                shards = spread.get(mask | 1 << t)
+                if shards is None:
+                    shards = self._shards_in(mask | 1 << t)
+
+                for shard in shards:
+                    adds[shard](row)
+
+            else:
+                if intent == "greet" or intent == "help":
+                    reach[actor] = reach.get(actor, 0) | 1 << t
+                    reach[target] = reach.get(target, 0) | 1 << a
+
+                adds[a](row)
+                if t != a:
+                    adds[t](row)
+
+            row += 1
+
+        last_public = None
+
+        if last_event is not None:
+            if columns is not None:
+                last_public = {name: column[count - 1] for name, column in columns.items()}
+            elif isinstance(last_event, GhostStep):
+                last_public = asdict(last_event)
+            else:
+                last_public = dict(last_event)
+
+        batch = (seqs, intents, actors, targets, intensities)
+
+        return batch, picks, cycles - self._cycles, last_public
+
+    def _normalize_events(self, events):
+        """
+        Validate and route a batch of runtime events (one pass).
+
+        Returns the columns (kind, actor, target, intensity) and the
+        rows each shard gets (the actor's and the target's shard).
+        """
+        kinds = []
+        actors = []
+        targets = []
+        intensities = []
+
+        add_kind = kinds.append
+        add_actor = actors.append
+        add_target = targets.append
+        add_intensity = intensities.append
+
+        n_shards = self.n_shards
+        owner = self._owner
+        reach = self._reach
+        picks = [[] for _ in range(n_shards)]
+        adds = [pick.append for pick in picks]
+
+        for row, event in enumerate(events):
+            # engine.apply_event's checks
+            if not isinstance(event, dict):
+                raise ValueError("Event must be a dict")
+
+            kind = event.get("kind")
+            if kind not in _EVENT_KINDS:
+                raise ValueError(f"Unknown event kind: {kind}")
+
+            actor = event.get("actor_id")
+            target = event.get("target_id")
+            if not actor or not target:
+                raise ValueError("Event requires actor_id and target_id")
+
+            intensity = (event.get("payload") or {}).get("intensity", 1.0)
+            if not isinstance(intensity, (int, float)):
+                raise ValueError("Event intensity must be numeric")
+
+            add_kind(kind)
+            add_actor(actor)
+            add_target(target)
+            add_intensity(_clamp01(float(intensity)))
+
+            a = owner.get(actor)
+            if a is None:
+                a = owner[actor] = shard_of(actor, n_shards)
+
+            t = owner.get(target)
+            if t is None:
+                t = owner[target] = shard_of(target, n_shards)
+
+            # every event creates (or reuses) the actor-target edge
+            reach[actor] = reach.get(actor, 0) | 1 << t
+            reach[target] = reach.get(target, 0) | 1 << a
+
+            adds[a](row)
+            if t != a:
+                adds[t](row)
+
+        return (kinds, actors, targets, intensities), picks
+
+    def _shards_in(self, mask: int) -> tuple:
+        """Shard indexes of a routing mask (cached)."""
+        shards = self._spread[mask] = tuple(
+            shard for shard in range(self.n_shards) if mask >> shard & 1
+        )
+
+        return shards
+
+    def _send(self, command: str, batch: tuple, picks: list) -> list:
+        """Send every shard its rows of the batch; returns the shards sent to."""
+        busy = []
+        n_rows = len(batch[0])
+
+        for shard, pick in zip(self._shards, picks):
+            if not pick:
+                continue
+
+            if len(pick) == n_rows:
+                part = batch
+            else:
+                # column gathers run in C
+                part = tuple(list(map(column.__getitem__, pick)) for column in batch)
+
+            shard.send(pickle.dumps((command, part), pickle.HIGHEST_PROTOCOL))
+            busy.append(shard)
+
+        return busy
+
+    def _gather(self, shards=None) -> list:
+        """
+        The reply of every shard (or of `shards`); a shard's error is
+        raised once all replied.
+        """
+        replies = []
+        error = None
+
+        for shard in self._shards if shards is None else shards:
+            try:
+                replies.append(shard.recv())
+            except Exception as exc:
+                if error is None:
+                    error = exc
+
+        if error is not None:
+            raise error
+
+        return replies
+
+    def _advance_npc(self, seqs, intents, actors, intensities, n_cycles: int):
+        """Global npc state, exactly as GhostEngine._advance computes it."""
+        npc = self._npc
+        threat_level = npc["threat_level"]
+        last_intent = npc["last_intent"]
+
+        cycle = self._cycles
+
+        for seq, intent, actor, intensity in zip(seqs, intents, actors, intensities):
+            # passive decay for the None steps before this event
+            for _ in range(seq - cycle - 1):
+                threat_level = _clamp_threat(threat_level - 0.02)
+
+            cycle = seq
+            last_intent = intent
+
+            if intent == "greet" or intent == "help":
+                threat_delta = _SUPPORT_EFFECTS[intent][5]
+                threat_level = _clamp_threat(threat_level + (threat_delta * intensity))
+
+            elif intent == "threat":
+                actors_mem = npc.setdefault("actors", {})
+                entry = actors_mem.setdefault(actor, {})
+                entry["threat_count"] = entry.get("threat_count", 0) + 1
+
+                gain = 0.50 * intensity * (0.5 + self._mood)
+
+                threat_level = _clamp_threat(threat_level + gain)
+
+            else:
+                threat_level = _clamp_threat(threat_level - 0.01)
+
+        # trailing None steps
+        for _ in range(self._cycles + n_cycles - cycle):
+            threat_level = _clamp_threat(threat_level - 0.02)
+
+        npc["threat_level"] = threat_level
+        npc["last_intent"] = last_intent
+
+    # -----------------------------
+    # READ STATE
+    # -----------------------------
+    def snapshot(self) -> dict:
+        """
+        Merged, JSON-safe snapshot of the whole world.
+        Identical to GhostEngine.snapshot() after the same input.
+        """
+        payload = pickle.dumps(("export",), pickle.HIGHEST_PROTOCOL)
+
+        for shard in self._shards:
+            shard.send(payload)
+
+        agents = []
+        relationships = []
+        neighbors = []
+
+        for part in self._gather():
+            agents.extend(part["agents"])
+            relationships.extend(part["relationships"])
+            neighbors.extend(part["neighbors"])
+
+        # creation order, as the sequential engine would have inserted them
+        agents.sort(key=lambda item: item[0])
+        relationships.sort(key=lambda item: item[0])
+        neighbors.sort(key=lambda item: item[0])
+
+        state = dict(self._config)
+        state["agents"] = {agent_id: record for _, agent_id, record in agents}
+        state["relationships"] = {key: rel for _, key, rel in relationships}
+        state["neighbors"] = {agent_id: nbrs for _, agent_id, nbrs in neighbors}
+        state["cycles"] = self._cycles
+        state["input"] = self._input
+        state["last_step"] = self._input
+        state["npc"] = self._npc
+
+        layout = {key: state[key] for key in self._layout}
+        layout.update(self._summary)
+
+        return plain(layout)
+
+
+# -----------------------------
+# SHARD
+# -----------------------------
+class _Shard:
+    """
+    One partition of the world.
+
+    Holds the agents it owns and every relationship touching them
+    (cross-shard edges are kept by both endpoint shards; the shard
+    owning the lower id reports them).
+    """
+
+    def __init__(self, index: int, n_shards: int, config: dict):
+        self.index = index
+        self.n_shards = n_shards
+
+        ctx = dict(config)
+        self._agents = AgentRegistry(ctx)
+
+        if ctx.get("relationship_store", "dict") == "compact":
+            self._graph = CompactRelationshipGraph(ctx)
+        else:
+            self._graph = RelationshipGraph(ctx)
+
+        self._owner = {}  # agent id -> shard index (cache)
+
+        # creation order of owned records: (row, position in the row)
+        self._agent_order = {}
+        self._neighbor_order = {}
+        self._edge_order = []  # (row, "a|b") for reported edges
+
+        # owned agent -> its owned neighbors (propagation from owned targets;
+        # for other targets the graph's own list holds exactly our agents)
+        self._owned_adj = {}
+
+        # runtime events between their two passes
+        self._pending = None
+
+    def _owns(self, agent_id) -> bool:
+        owner = self._owner.get(agent_id)
+
+        if owner is None:
+            owner = self._owner[agent_id] = shard_of(agent_id, self.n_shards)
+
+        return owner == self.index
+
+    def handle(self, message):
+        command = message[0]
+
+        if command == "run":
+            return self.run(*message[1])
+
+        if command == "events":
+            return self.events(*message[1])
+
+        if command == "settle":
+            return self.settle(message[1])
+
+        if command == "tick":
+            return self.tick(message[1])
+
+        if command == "export":
+            return self.export()
+
+        raise ValueError(f"Unknown shard command: {command}")
+
+    # -----------------------------
+    # STEPS
+    # -----------------------------
+    def run(self, orders, intents, actors, targets, intensities):
+        """Replay our rows of a batch of steps (validated by the coordinator)."""
+        owner = self._owner
+        index = self.index
+        n_shards = self.n_shards
+        agents = self._agents._agents
+        ensure = self._agents.ensure
+        agent_order = self._agent_order
+        graph = self._graph
+
+        for order, intent, actor, target, intensity in zip(orders, intents, actors, targets, intensities):
+            # _owns, inlined
+            shard = owner.get(actor)
+            if shard is None:
+                shard = owner[actor] = shard_of(actor, n_shards)
+            actor_owned = shard == index
+
+            target_owned = False
+            if target is not None:
+                shard = owner.get(target)
+                if shard is None:
+                    shard = owner[target] = shard_of(target, n_shards)
+                target_owned = shard == index
+
+            if not actor_owned and not target_owned:
+                # only propagation can reach our agents
+                if intent == "threat" and target is not None:
+                    self._propagate(actor, target, intensity)
+                continue
+
+            actor_state = None
+            if actor_owned:
+                if actor not in agents:
+                    agent_order[actor] = (order, 0)
+                actor_state = ensure(actor)
+                actor_state["last_intent"] = intent
+
+            target_state = None
+            if target_owned:
+                if target not in agents:
+                    agent_order[target] = (order, 1)
+                target_state = ensure(target)
+                target_state["last_intent"] = intent
+
+            if intent == "greet" or intent == "help":
+                (
+                    actor_mood, actor_tension,
+                    target_mood, target_tension,
+                    deltas, _,
+                ) = _SUPPORT_EFFECTS[intent]
+
+                if actor_state is not None:
+                    actor_state["mood"] = _clamp01(actor_state["mood"] + (actor_mood * intensity))
+                    actor_state["tension"] = _clamp01(actor_state["tension"] + (actor_tension * intensity))
+
+                if target is not None:
+                    if target_state is not None:
+                        target_state["mood"] = _clamp01(target_state["mood"] + (target_mood * intensity))
+                        target_state["tension"] = _clamp01(target_state["tension"] + (target_tension * intensity))
+
+                    if not graph.has_neighbor(actor, target):
+                        self._link(order, actor, target, actor_owned, target_owned)
+                    graph.apply_delta(actor, target, deltas)
+
+            elif intent == "threat":
+                if actor_state is not None:
+                    actor_state["mood"] = _clamp01(actor_state["mood"] - (0.05 * intensity))
+                    actor_state["tension"] = _clamp01(actor_state["tension"] + (0.06 * intensity))
+
+                if target is not None:
+                    if target_state is not None:
+                        target_state["mood"] = _clamp01(target_state["mood"] - (0.12 * intensity))
+                        target_state["tension"] = _clamp01(target_state["tension"] + (0.18 * intensity))
+
+                    if not graph.has_neighbor(actor, target):
+                        self._link(order, actor, target, actor_owned, target_owned)
+                    graph.apply_delta(actor, target, _THREAT_DELTAS)
+                    self._propagate(actor, target, intensity)
+
+    def _link(self, order, actor, target, actor_owned, target_owned):
+        """Record the creation order of a new actor-target edge (before creating it)."""
+        lo = target if target < actor else actor
+        if self._owns(lo):
+            self._edge_order.append((order, self._graph._key(actor, target)))
+
+        neighbor_order = self._neighbor_order
+
+        if actor_owned and actor not in neighbor_order:
+            neighbor_order[actor] = (order, 0)
+        if target_owned and target not in neighbor_order:
+            neighbor_order[target] = (order, 1)
+
+        if actor_owned and target_owned:
+            self._owned_adj.setdefault(target, []).append(actor)
+            if actor != target:
+                self._owned_adj.setdefault(actor, []).append(target)
+
+    def _propagate(self, actor, target, intensity):
+        if self._owns(target):
+            neighbors = self._owned_adj.get(target, ())
+        else:
+            neighbors = self._graph.neighbors(target)
+
+        if not neighbors:
+            return
+
+        spread = 0.25 * intensity
+        mood_drop = 0.03 * spread
+        tension_rise = 0.08 * spread
+
+        agents = self._agents._agents
+
+        for neighbor_id in neighbors:
+            if neighbor_id == actor or neighbor_id == target:
+                continue
+
+            neighbor_state = agents[neighbor_id]
+            neighbor_state["mood"] = _clamp01(neighbor_state["mood"] - mood_drop)
+            neighbor_state["tension"] = _clamp01(neighbor_state["tension"] + tension_rise)
+
+    # -----------------------------
+    # RUNTIME EVENTS
+    # -----------------------------
+    def events(self, orders, kinds, actors, targets, intensities):
+        """
+        First pass over our rows of runtime events: create our agents and
+        apply the relationship deltas. Returns the relationships of our
+        targets that broke, as (row, neighbors the cascade reaches), in
+        row order. Mood and tension wait for settle().
+        """
+        self._pending = (orders, kinds, actors, targets, intensities)
+
+        owner = self._owner
+        index = self.index
+        n_shards = self.n_shards
+        agents = self._agents._agents
+        ensure = self._agents.ensure
+        agent_order = self._agent_order
+        graph = self._graph
+        has_neighbor = graph.has_neighbor
+        apply_core_delta = graph.apply_core_delta
+        trust_of = graph.trust
+
+        broken = []
+
+        for order, kind, actor, target, intensity in zip(orders, kinds, actors, targets, intensities):
+            # _owns, inlined
+            shard = owner.get(actor)
+            if shard is None:
+                shard = owner[actor] = shard_of(actor, n_shards)
+            actor_owned = shard == index
+
+            shard = owner.get(target)
+            if shard is None:
+                shard = owner[target] = shard_of(target, n_shards)
+            target_owned = shard == index
+
+            if actor_owned and actor not in agents:
+                agent_order[actor] = (order, 0)
+                ensure(actor)
+
+            if target_owned and target not in agents:
+                agent_order[target] = (order, 1)
+                ensure(target)
+
+            trust, attachment, hostile = _EVENT_CORE[kind]
+
+            # the target's shard holds all of its neighbors
+            hostile = hostile and target_owned
+            before = trust_of(actor, target) if hostile else None
+
+            if before is None and not has_neighbor(actor, target):
+                self._link(order, actor, target, actor_owned, target_owned)
+
+            apply_core_delta(
+                actor, target,
+                trust * intensity,
+                None if attachment is None else attachment * intensity,
+            )
+
+            if hostile and (before is None or before > _HOSTILE_TRUST):
+                if trust_of(actor, target) <= _HOSTILE_TRUST:
+                    broken.append((order, self._cascade_reach(actor, target)))
+
+        return broken
+
+    def _cascade_reach(self, actor, target) -> list:
+        """The neighbors of our `target` a cascade unsettles (as engine._cascade walks them)."""
+        reached = []
+
+        for neighbor_id in self._graph.neighbors(target):
+            if neighbor_id == actor or neighbor_id == target:
+                continue
+
+            reached.append(neighbor_id)
+            if len(reached) == _CASCADE_FANOUT:
+                break
+
+        return reached
+
+    def settle(self, cascades):
+        """
+        Second pass: mood and tension of our agents, row by row: the
+        row's direct effects, then the cascades (row, neighbor id,
+        intensity) reaching our agents from it.
+        """
+        batch, self._pending = self._pending, None
+        agents = self._agents._agents
+
+        rows = zip(*batch) if batch is not None else ()
+
+        cascades = iter(cascades)
+        cascade = next(cascades, None)
+
+        for order, kind, actor, target, intensity in rows:
+            while cascade is not None and cascade[0] < order:
+                self._unsettle(cascade[1], cascade[2])
+                cascade = next(cascades, None)
+
+            (
+                actor_mood, actor_tension,
+                target_mood, target_tension,
+                _, _,
+            ) = _EVENT_KINDS[kind]
+
+            actor_state = agents.get(actor)
+            if actor_state is not None:
+                actor_state["mood"] = _clamp01(actor_state["mood"] + (actor_mood * intensity))
+                actor_state["tension"] = _clamp01(actor_state["tension"] + (actor_tension * intensity))
+
+            target_state = agents.get(target)
+            if target_state is not None:
+                target_state["mood"] = _clamp01(target_state["mood"] + (target_mood * intensity))
+                target_state["tension"] = _clamp01(target_state["tension"] + (target_tension * intensity))
+
+        while cascade is not None:
+            self._unsettle(cascade[1], cascade[2])
+            cascade = next(cascades, None)
+
+    def _unsettle(self, neighbor_id, intensity):
+        neighbor_state = self._agents._agents[neighbor_id]
+        neighbor_state["mood"] = _clamp01(neighbor_state["mood"] - (0.01 * intensity))
+        neighbor_state["tension"] = _clamp01(neighbor_state["tension"] + (0.03 * intensity))
+
+    def tick(self, dt):
+        """
+        Relationship decay and agent recovery (GhostEngine.tick). Returns
+        our agents' creation orders and tensions, and how many are
+        settled (mood >= 0.5).
+        """
+        self._graph.tick(dt)
+
+        recovery = _AFFECT_RECOVERY ** dt
+        tensions = []
+        settled = 0
+
+        for agent in self._agents._agents.values():
+            agent["mood"] = 0.5 + (agent["mood"] - 0.5) * recovery
+            agent["tension"] = agent["tension"] * recovery
+
+            tensions.append(agent["tension"])
+            settled += agent["mood"] >= 0.5
+
+        return list(self._agent_order.values()), tensions, settled
+
+    def export(self) -> dict:
+        graph = self._graph
+        graph.materialize()
+
+        agents = self._agents._agents
+        rels = graph._rels
+        neighbors = graph._neighbors
+
+        return {
+            "agents": [
+                (order, agent_id, plain(agents[agent_id]))
+                for agent_id, order in self._agent_order.items()
+            ],
+            "relationships": [
+                (order, key, plain(rels[key]))
+                for order, key in self._edge_order
+            ],
+            "neighbors": [
+                (order, agent_id, list(neighbors[agent_id]))
+                for agent_id, order in self._neighbor_order.items()
+            ],
+        }
+
+
+class _LocalShard:
+    """In-process shard with the worker-process interface."""
+
+    def __init__(self, index: int, n_shards: int, config: dict):
+        self._shard = _Shard(index, n_shards, config)
+        self._reply = None
+
+    def send(self, payload: bytes):
+        try:
+            self._reply = (True, self._shard.handle(pickle.loads(payload)))
+        except Exception as exc:  # raised by recv(), like a worker's
+            self._reply = (False, exc)
+
+    def recv(self):
+        (ok, reply), self._reply = self._reply, None
+
+        if not ok:
+            raise reply
+
+        return reply
+
+    def close(self):
+        self._shard = None
+
+
+class _ShardProcess:
+    """Shard running in a persistent worker process."""
+
+    def __init__(self, index: int, n_shards: int, config: dict):
+        self._conn, child = multiprocessing.Pipe()
+
+        self._process = multiprocessing.Process(
+            target=_serve,
+            args=(child, index, n_shards, config),
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+
+    def send(self, payload: bytes):
+        self._conn.send_bytes(payload)
+
+    def recv(self):
+        ok, reply = self._conn.recv()
+
+        if not ok:
+            raise reply
+
+        return reply
+
+    def close(self):
+        if self._process.is_alive():
+            self._conn.send_bytes(pickle.dumps(("close",)))
+            self._process.join()
+
+        self._conn.close()
+
+
+def _serve(conn, index: int, n_shards: int, config: dict):
+    shard = _Shard(index, n_shards, config)
+
+    while True:
+        message = pickle.loads(conn.recv_bytes())
+
+        if message[0] == "close":
+            break
+
+        try:
+            conn.send((True, shard.handle(message)))
+        except Exception as exc:  # report to the coordinator, keep serving
+            conn.send((False, exc))
+
+    conn.close()
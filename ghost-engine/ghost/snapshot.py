@@ -0,0 +1,415 @@
+"""
+Incremental snapshots and snapshot deltas.
+
+Consecutive snapshots share the records of agents / relationships /
+neighbor lists that were not touched in between. The containers holding
+them are plain dicts owned by the caller; the shared records themselves
+are read-only (FrozenDict / FrozenList) so one caller cannot corrupt
+another snapshot. They are plain dict / list subclasses, so they stay
+JSON-safe and compare equal to ordinary dicts and lists.
+
+Deltas (GhostEngine.snapshot_delta) carry only what changed since a
+given cycle; apply_snapshot_delta() replays them onto an old snapshot.
+"""
+
+import copy
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import islice
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("snapshot records are read-only")
+
+
+class FrozenDict(dict):
+    """Read-only dict shared between snapshots."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        # copies are ordinary, mutable containers
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list shared between snapshots."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(x):
+    """
+    JSON-safe, read-only copy of x.
+    Same conversions as engine._json_safe (str keys, tuples/sets -> lists).
+    """
+    return _convert(x, FrozenDict, FrozenList)
+
+
+def plain(x):
+    """JSON-safe, caller-owned copy of x (plain dicts / lists)."""
+    return _convert(x, dict, list)
+
+
+def _convert(x, dict_type, list_type):
+    if isinstance(x, (str, int, float, bool)) or x is None:
+        return x
+
+    if isinstance(x, Mapping):
+        if hasattr(x, "_plain"):
+            # compact-store view: read its columns without side effects
+            x = x._plain()
+        return dict_type({str(k): _convert(v, dict_type, list_type) for k, v in x.items()})
+
+    if isinstance(x, (list, tuple)):
+        return list_type([_convert(v, dict_type, list_type) for v in x])
+
+    if isinstance(x, set):
+        return list_type(sorted(_convert(v, dict_type, list_type) for v in x))
+
+    # unknown leaf: detach it from live state
+    return copy.deepcopy(x)
+
+
+class TouchJournal:
+    """
+    Keys changed per cycle, in touch order (so stamps are non-decreasing).
+
+    Nothing is recorded before start(): until the first snapshot there
+    is no earlier state to diff against, so touches are free. trim()
+    forgets the touches older than the oldest snapshot mark still kept;
+    covers() tells whether "changed since cycle N" can be answered.
+    """
+
+    __slots__ = ("_stamps", "start_stamp")
+
+    def __init__(self):
+        self._stamps = {}
+        self.start_stamp = None
+
+    def touch(self, key, stamp):
+        """Record that key changed at cycle `stamp`."""
+        if self.start_stamp is not None:
+            stamps = self._stamps
+            if stamps.get(key, _MISSING) != stamp:
+                stamps.pop(key, None)
+                stamps[key] = stamp
+
+    def touch_many(self, keys, stamp):
+        """touch() every key of `keys`, in order."""
+        if self.start_stamp is not None:
+            stamps = self._stamps
+            moved = [key for key in keys if stamps.get(key, _MISSING) != stamp]
+
+            for key in moved:
+                stamps.pop(key, None)
+
+            stamps.update(dict.fromkeys(moved, stamp))
+
+    def since(self, stamp):
+        """Keys touched at or after cycle `stamp` (newest first)."""
+        for key, when in reversed(self._stamps.items()):
+            if when < stamp:
+                break
+            yield key
+
+    def items(self):
+        """(key, stamp) in touch order."""
+        return self._stamps.items()
+
+    def covers(self, stamp) -> bool:
+        return self.start_stamp is not None and stamp >= self.start_stamp
+
+    def start(self, stamp):
+        """Start recording (no-op if already recording)."""
+        if self.start_stamp is None:
+            self.start_stamp = stamp
+
+    def trim(self, floor):
+        """Forget touches made before cycle `floor`."""
+        if self.start_stamp is None or floor <= self.start_stamp:
+            return
+
+        self.start_stamp = floor
+
+        old = 0
+        for when in self._stamps.values():
+            if when >= floor:
+                break
+            old += 1
+
+        if old:
+            self._stamps = dict(islice(self._stamps.items(), old, None))
+
+
+_MISSING = object()
+
+
+class GrowthMarks:
+    """
+    Size of an append-only container at the first change of each cycle.
+    Lets "entries created since cycle N" be read as a slice.
+    """
+
+    __slots__ = ("_stamps", "_sizes")
+
+    def __init__(self):
+        self._stamps = []
+        self._sizes = []
+
+    def mark(self, stamp, size: int):
+        """Call before every insertion, with the size before it."""
+        if not self._stamps or self._stamps[-1] != stamp:
+            self._stamps.append(stamp)
+            self._sizes.append(size)
+
+    def size_at(self, stamp, current: int) -> int:
+        """Container size when cycle `stamp` began (`current` if unchanged since)."""
+        i = bisect_left(self._stamps, stamp)
+        return self._sizes[i] if i < len(self._sizes) else current
+
+
+class SnapshotCache:
+    """
+    Builds engine snapshots, reusing frozen subtrees from the previous one.
+
+    Dirty keys come from the subsystems' change journals
+    (agents, relationships, neighbors, npc actors), all stamped with
+    ctx["cycles"]. Everything else in ctx is small and rebuilt each time.
+
+    Only mutations made through the engine API are journaled; after
+    editing state() by hand, call GhostEngine.invalidate_snapshot().
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop cached subtrees; the next snapshot is a full rebuild."""
+        self._since = None
+        self._trees = {}
+
+    @property
+    def stamp(self):
+        """Cycle of the last snapshot built (None: the next is a full rebuild)."""
+        return self._since
+
+    def build(self, engine) -> dict:
+        ctx = engine._ctx
+        since = self._since
+
+        sections = {
+            "agents": engine.agents.changed_since,
+            "relationships": engine.relationships.changed_since,
+            "neighbors": engine.relationships.neighbors_changed_since,
+        }
+
+        trees = {}
+        out = {}
+
+        for k, v in ctx.items():
+            if k in sections:
+                trees[k] = self._section(k, v, sections[k], since)
+                out[str(k)] = dict(trees[k])
+
+            elif k == "npc" and isinstance(v, dict):
+                npc = {}
+                for nk, nv in v.items():
+                    if nk == "actors":
+                        trees[nk] = self._section(nk, nv, engine.actors_changed_since, since)
+                        npc[nk] = dict(trees[nk])
+                    else:
+                        npc[str(nk)] = plain(nv)
+                out[str(k)] = npc
+
+            else:
+                out[str(k)] = plain(v)
+
+        self._trees = trees
+        self._since = ctx.get("cycles", 0)
+
+        return out
+
+    def _section(self, name, live, changed_since, since):
+        prev = self._trees.get(name)
+
+        changed = None
+        if prev is not None and since is not None:
+            changed = changed_since(since)
+
+        # first snapshot or bulk change (e.g. decay tick): full rebuild
+        if changed is None:
+            return freeze(live)
+
+        n_prev = len(prev)
+
+        if not changed and n_prev == len(live):
+            return prev
+
+        tree = FrozenDict(prev)
+        set_record = dict.__setitem__
+
+        # touched records keep their position ...
+        for key, record in changed:
+            key = str(key)
+            if key in prev:
+                set_record(tree, key, freeze(record))
+
+        # ... new ones are appended in live order (containers are append-only)
+        for key, record in islice(live.items(), n_prev, None):
+            set_record(tree, str(key), freeze(record))
+
+        # live container changed outside the engine API: full rebuild
+        if len(tree) != len(live):
+            return freeze(live)
+
+        return tree
+
+
+# -----------------------------
+# DELTAS
+# -----------------------------
+def build_delta(engine, since) -> dict:
+    """
+    Plain, JSON-safe delta of everything changed at or after cycle `since`.
+
+    - agents / relationships / npc actors: full records of touched entries
+      (touched-but-existing first, then new ones in creation order)
+    - neighbors: entries appended to each neighbor list
+    - npc (other fields) and all remaining ctx keys ("state"): sent whole
+    """
+    ctx = engine._ctx
+    rels = engine.relationships
+
+    sections = {
+        "agents": (engine.agents.changed_since, engine.agents.created_since),
+        "relationships": (rels.changed_since, rels.created_since),
+    }
+
+    delta = {"since": since, "cycles": ctx.get("cycles", 0)}
+    state = {}
+
+    for k, v in ctx.items():
+        if k in sections:
+            delta[k] = _section_delta(v, *sections[k], since)
+
+        elif k == "neighbors":
+            delta[k] = plain(rels.neighbors_added_since(since))
+
+        elif k == "npc" and isinstance(v, dict):
+            npc = {}
+            for nk, nv in v.items():
+                if nk == "actors":
+                    npc[nk] = _section_delta(
+                        nv,
+                        engine.actors_changed_since,
+                        engine.actors_created_since,
+                        since,
+                    )
+                else:
+                    npc[str(nk)] = plain(nv)
+            delta[k] = npc
+
+        else:
+            state[str(k)] = plain(v)
+
+    delta["state"] = state
+
+    return delta
+
+
+def _section_delta(live, changed_since, created_since, since) -> dict:
+    changed = changed_since(since)
+
+    # bulk change (e.g. decay tick): resend the section in live order
+    if changed is None:
+        return plain(live)
+
+    created = [(str(k), record) for k, record in created_since(since)]
+    fresh = {k for k, _ in created}
+
+    out = {}
+
+    for key, record in changed:
+        key = str(key)
+        if key not in fresh:
+            out[key] = plain(record)
+
+    for key, record in created:
+        out[key] = plain(record)
+
+    return out
+
+
+def apply_snapshot_delta(snapshot: dict, delta: dict) -> dict:
+    """
+    Return snapshot + delta as a new snapshot (the input is not modified).
+
+    Applying every delta since a snapshot's "cycles", in order,
+    reproduces GhostEngine.snapshot() exactly (content and key order).
+    """
+    out = dict(snapshot)
+
+    for k in ("agents", "relationships"):
+        if k in delta:
+            section = dict(out.get(k, {}))
+            section.update(delta[k])
+            out[k] = section
+
+    if "neighbors" in delta:
+        neighbors = dict(out.get("neighbors", {}))
+
+        for agent_id, added in delta["neighbors"].items():
+            current = neighbors.get(agent_id)
+
+            if current is None:
+                neighbors[agent_id] = list(added)
+                continue
+
+            # deltas are inclusive of their start cycle, so an addition
+            # may already be present (neighbor lists never repeat an id)
+            seen = set(current)
+            extra = [n for n in added if n not in seen]
+
+            if extra:
+                neighbors[agent_id] = list(current) + extra
+
+        out["neighbors"] = neighbors
+
+    if "npc" in delta:
+        npc = dict(out.get("npc", {}))
+
+        for nk, nv in delta["npc"].items():
+            if nk == "actors":
+                actors = dict(npc.get("actors", {}))
+                actors.update(nv)
+                npc[nk] = actors
+            else:
+                npc[nk] = nv
+
+        out["npc"] = npc
+
+    out.update(delta.get("state", {}))
+
+    return out
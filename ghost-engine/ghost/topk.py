@@ -0,0 +1,227 @@
+"""
+Per-agent trust ranking (who an agent trusts most / least).
+"""
+
+from heapq import heapify, heappop, heappush, heappushpop, nsmallest
+
+_UNBOUNDED = float("inf")
+_ROUNDING = 1.0 + 1e-9
+
+
+class TrustIndex:
+    """
+    Per-agent max / min heaps of neighbor trust, kept up to date as a
+    RelationshipGraph observer.
+
+    - only agents with at least `min_degree` neighbors are indexed
+      (memory is O(indexed edges)); others are answered by a scan
+    - apply_delta: O(log n) per indexed endpoint (heap push; replaced
+      entries are dropped lazily and the heaps compacted when they
+      double)
+    - tick: O(1); the heaps keep their (now stale) trusts. Over `dt`
+      no trust of an agent drifts by more than
+      reach * (1 - fastest ** dt), with reach its largest reservoir and
+      fastest its fastest decay (RelationshipGraph.reservoir_bounds)
+    - top_trusted / top_hostile: O((k + skipped) log n) until the
+      first tick, then candidates are popped in stale order and read
+      exactly (peek) until the next stale trust is more than the drift
+      away from the k-th; an agent is rebuilt (O(degree)) once a query
+      reads a quarter of its neighbors
+
+    Rankings are (neighbor, trust) lists; ties break on neighbor id.
+    """
+
+    def __init__(self, graph, min_degree: int = 0):
+        if min_degree < 0:
+            raise ValueError("min_degree must be >= 0")
+
+        self._graph = graph
+        self.min_degree = min_degree
+
+        # indexed agent -> {neighbor: trust}, heaps, clock built at,
+        # [reach, fastest decay, slowest decay] of its edges since then
+        self._trust = {}
+        self._high = {}  # (-trust, neighbor)
+        self._low = {}  # (trust, neighbor)
+        self._built = {}
+        self._bounds = {}
+
+        # total decay time ticked
+        self._clock = 0.0
+
+        for agent in list(graph.nodes()):
+            if len(graph.neighbors(agent)) >= min_degree:
+                self._build(agent)
+
+        graph.add_observer(self)
+
+    def close(self):
+        """Stop tracking the graph."""
+        self._graph.remove_observer(self)
+
+    # -----------------------------
+    # OBSERVER HOOKS
+    # -----------------------------
+    def on_delta(self, a, b, old_trust, new_trust, rel):
+        self._update(a, b, new_trust, rel)
+
+        if a != b:
+            self._update(b, a, new_trust, rel)
+
+    def on_tick(self, dt):
+        self._clock += dt
+
+    def _update(self, agent, other, trust, rel):
+        trusts = self._trust.get(agent)
+
+        if trusts is None:
+            # degree only grows: index agents as they reach min_degree
+            if len(self._graph.neighbors(agent)) >= self.min_degree:
+                self._build(agent)
+            return
+
+        trusts[other] = trust
+
+        bounds = self._bounds[agent]
+        pos_decay = rel["pos_decay"]
+        neg_decay = rel["neg_decay"]
+        bounds[0] = max(bounds[0], rel["pos"], rel["neg"])
+        bounds[1] = min(bounds[1], pos_decay, neg_decay)
+        bounds[2] = max(bounds[2], pos_decay, neg_decay)
+
+        high = self._high[agent]
+        low = self._low[agent]
+
+        if len(high) > 2 * len(trusts) + 16:
+            self._heapify(agent)
+        else:
+            heappush(high, (-trust, other))
+            heappush(low, (trust, other))
+
+    def _build(self, agent):
+        self._trust[agent] = {
+            other: trust for other, trust, _ in self._graph.peek_neighbors(agent)
+        }
+        self._built[agent] = self._clock
+        self._bounds[agent] = list(self._graph.reservoir_bounds(agent))
+        self._heapify(agent)
+
+    def _heapify(self, agent):
+        trusts = self._trust[agent]
+
+        high = [(-trust, other) for other, trust in trusts.items()]
+        low = [(trust, other) for other, trust in trusts.items()]
+        heapify(high)
+        heapify(low)
+
+        self._high[agent] = high
+        self._low[agent] = low
+
+    # -----------------------------
+    # QUERIES
+    # -----------------------------
+    def is_indexed(self, agent) -> bool:
+        return agent in self._trust
+
+    def _drift(self, agent) -> float:
+        """How far any trust of `agent` can be from its heap entry."""
+        elapsed = self._clock - self._built[agent]
+        if not elapsed:
+            return 0.0
+
+        reach, fastest, slowest = self._bounds[agent]
+        if slowest > 1.0:
+            return _UNBOUNDED  # growing reservoirs: no bound
+
+        # (with room for rounding: decay ** dt is applied tick by tick)
+        return reach * (1.0 - fastest ** elapsed) * _ROUNDING
+
+    def top_trusted(self, agent, k: int, skip=()):
+        """
+        The k neighbors `agent` trusts most, as (neighbor, trust), highest
+        first; neighbors in `skip` are passed over, not counted.
+        """
+        return self._top(agent, k, self._high, -1.0, skip)
+
+    def top_hostile(self, agent, k: int, skip=()):
+        """
+        The k neighbors `agent` trusts least, as (neighbor, trust), lowest
+        first; neighbors in `skip` are passed over, not counted.
+        """
+        return self._top(agent, k, self._low, 1.0, skip)
+
+    def _top(self, agent, k, heaps, sign, skip=()):
+        if k <= 0:
+            return []
+
+        trusts = self._trust.get(agent)
+
+        if trusts is None:
+            ranked = nsmallest(
+                k,
+                (
+                    (sign * trust, other)
+                    for other, trust, _ in self._graph.peek_neighbors(agent)
+                    if other not in skip
+                ),
+            )
+            return [(other, sign * key) for key, other in ranked]
+
+        drift = self._drift(agent)
+
+        # (ensure_pair alone adds a neighbor without a delta)
+        if drift == _UNBOUNDED or len(trusts) != len(self._graph.neighbors(agent)):
+            self._build(agent)
+            trusts = self._trust[agent]
+            drift = 0.0
+
+        heap = heaps[agent]
+        peek = self._graph.peek
+        found = []
+        kept = []
+        seen = set()
+        kth = []  # the k best current keys, negated (max-heap)
+
+        # pop valid entries (dropping replaced ones for good), then restore;
+        # after a tick, entries are read exactly until no later one can
+        # reach the k-th best
+        while heap:
+            entry = heap[0]
+            key, other = entry
+
+            if other in seen or trusts.get(other) != sign * key:
+                heappop(heap)
+                continue
+
+            if drift:
+                if len(kth) == k and key - drift > -kth[0]:
+                    break
+            elif len(found) == k:
+                break
+
+            heappop(heap)
+            seen.add(other)
+            kept.append(entry)
+
+            if other in skip:
+                continue
+
+            current = sign * peek(agent, other)[0] if drift else key
+            found.append((current, other))
+
+            if len(kth) < k:
+                heappush(kth, -current)
+            else:
+                heappushpop(kth, -current)
+
+        for entry in kept:
+            heappush(heap, entry)
+
+        # a wide scan costs as much as a rebuild, which resets the drift
+        if len(kept) > k + len(trusts) // 4:
+            self._build(agent)
+
+        if drift:
+            found = nsmallest(k, found)
+
+        return [(other, sign * key) for key, other in found]
@@ -0,0 +1,105 @@
+"""
+Push-based relationship state transitions.
+"""
+
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # optional: band comparison falls back to bytes
+    np = None
+
+
+class TransitionWatch:
+    """
+    Reports edges whose trust crosses a band boundary, as a
+    RelationshipGraph observer.
+
+    Bands are numbered by the ascending `bounds` strictly below trust
+    (trust <= bounds[0] is band 0); `names` labels them. Every crossing
+    is passed to emit(a, b, from_name, to_name, trust).
+
+    - apply_delta: one band comparison (old vs new trust) per mutated edge
+    - tick: one pass over the bands of every edge (vectorized on the
+      compact store), compared with the bands after the previous tick;
+      edges changed in between are compared with the band on_delta last
+      saw. In lazy decay mode the owed decay is computed on the fly, and
+      only the edges that crossed a boundary are caught up (when their
+      trust is read)
+    """
+
+    def __init__(self, graph, bounds, names, emit):
+        if len(names) != len(bounds) + 1:
+            raise ValueError("one band name per interval between bounds")
+
+        self._graph = graph
+        self.bounds = tuple(bounds)
+        self.names = tuple(names)
+        self._emit = emit
+
+        self._bands = None  # every edge's band after the last tick
+        self._moved = {}  # (a, b) -> band, edges changed since that tick
+
+        graph.add_observer(self)
+
+    def close(self):
+        """Stop watching the graph."""
+        self._graph.remove_observer(self)
+
+    # -----------------------------
+    # OBSERVER HOOKS
+    # -----------------------------
+    def on_delta(self, a, b, old_trust, new_trust, rel):
+        bounds = self.bounds
+        old = bisect_left(bounds, old_trust)
+        new = bisect_left(bounds, new_trust)
+
+        if self._bands is not None:
+            self._moved[(b, a) if b < a else (a, b)] = new
+
+        if old != new:
+            self._emit(a, b, self.names[old], self.names[new], new_trust)
+
+    def before_tick(self, dt):
+        # no earlier tick to start from
+        if self._bands is None:
+            self._bands = self._graph.trust_bands(self.bounds)
+
+    def on_tick(self, dt):
+        graph = self._graph
+        bounds = self.bounds
+        names = self.names
+        emit = self._emit
+
+        before = self._bands
+        after = graph.trust_bands(bounds)
+        moved = self._moved
+
+        self._bands = after
+        self._moved = {}
+
+        # edges created since then that no delta reached still hold 0.0
+        grown = len(after) - len(before)
+        if grown:
+            band = bisect_left(bounds, 0.0)
+
+            if isinstance(before, bytes):
+                before += bytes((band,)) * grown
+            else:
+                before = np.concatenate((before, np.full(grown, band, dtype=np.uint8)))
+
+        if isinstance(after, bytes):
+            changed = [i for i, (old, new) in enumerate(zip(before, after)) if old != new]
+        else:
+            changed = np.flatnonzero(before != after).tolist()
+
+        for i, pair in zip(changed, graph.pairs_at(changed)):
+            if pair not in moved:
+                a, b = pair
+                emit(a, b, names[before[i]], names[after[i]], graph.trust(a, b))
+
+        for (a, b), old in moved.items():
+            new = bisect_left(bounds, graph.peek(a, b)[0])
+
+            if old != new:
+                emit(a, b, names[old], names[new], graph.trust(a, b))
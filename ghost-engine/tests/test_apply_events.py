@@ -0,0 +1,199 @@
+import json
+import random
+
+import pytest
+
+import ghost.api as api_mod
+from ghost.api import GhostAPI
+from ghost.engine import _json_safe
+
+
+def _columns(seed, n=600):
+    rng = random.Random(seed)
+    agents = [f"A{i}" for i in range(25)]
+
+    sources = [rng.choice(agents) for _ in range(n)]
+    targets = [rng.choice(agents) for _ in range(n)]
+    types = [rng.choice(["help", "insult", "betrayal"]) for _ in range(n)]
+    intensities = [rng.choice([1, True, 0, 0.0, 2.5, rng.random()]) for _ in range(n)]
+
+    return sources, targets, types, intensities
+
+
+def _dump(api):
+    return json.dumps(_json_safe(api.engine.snapshot()))
+
+
+@pytest.mark.parametrize("config", [
+    {},
+    {"relationship_store": "compact"},
+    {"decay_mode": "lazy"},
+    {"relationship_store": "compact", "decay_mode": "lazy"},
+])
+def test_apply_events_matches_sequential(config):
+    seq = GhostAPI(dict(config))
+    bulk = GhostAPI(dict(config))
+
+    # journals record from the first snapshot on
+    seq.engine.snapshot()
+    bulk.engine.snapshot()
+
+    for batch in range(4):
+        sources, targets, types, intensities = _columns(batch)
+
+        for s, t, kind, x in zip(sources, targets, types, intensities):
+            seq.apply_event(s, t, {"type": kind, "intensity": x})
+
+        if batch % 2 and api_mod.np is not None:
+            np = api_mod.np
+            bulk.apply_events(np.array(sources), np.array(targets), types, intensities)
+        else:
+            bulk.apply_events(sources, targets, types, intensities)
+
+        seq.tick()
+        bulk.tick()
+
+    assert _dump(bulk) == _dump(seq)
+
+    # journals (incremental snapshots) line up too
+    a, b = seq.engine.relationships, bulk.engine.relationships
+    assert list(a._touched.items()) == list(b._touched.items())
+    assert list(a._neighbors_touched.items()) == list(b._neighbors_touched.items())
+
+
+def test_numpy_intensities_and_default():
+    np = api_mod.np
+    if np is None:
+        pytest.skip("numpy not installed")
+
+    seq = GhostAPI()
+    bulk = GhostAPI()
+
+    for s, t in [("A", "B"), ("B", "A"), ("A", "C")]:
+        seq.apply_event(s, t, {"type": "help"})
+
+    bulk.apply_events(["A", "B", "A"], ["B", "A", "C"], ["help"] * 3)
+    assert _dump(bulk) == _dump(seq)
+
+    seq.apply_event("A", "B", {"type": "insult", "intensity": 0.5})
+    bulk.apply_events(["A"], ["B"], ["insult"], np.array([0.5]))
+    assert _dump(bulk) == _dump(seq)
+
+
+# the intensity types apply_event takes, as Python lists and NumPy arrays
+LIST_INTENSITIES = {
+    "bool": [True, False, True, True],
+    "int": [1, 0, 3, -2],
+    "float": [0.5, 0.0, 2.5, -1.25],
+}
+
+ARRAY_DTYPES = ["bool", "int8", "int32", "int64", "uint8", "uint64", "float16", "float32", "float64"]
+
+
+def _check_dtype(intensities, store):
+    seq = GhostAPI({"relationship_store": store})
+    bulk = GhostAPI({"relationship_store": store})
+    values = intensities.tolist() if hasattr(intensities, "tolist") else intensities
+
+    for x, kind in zip(values, ["help", "insult", "betrayal", "help"]):
+        seq.apply_event("A", "B", {"type": kind, "intensity": x})
+
+    bulk.apply_events(["A"] * 4, ["B"] * 4, ["help", "insult", "betrayal", "help"], intensities)
+    assert _dump(bulk) == _dump(seq)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("kind", sorted(LIST_INTENSITIES))
+def test_list_intensities(kind, store):
+    _check_dtype(LIST_INTENSITIES[kind], store)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("dtype", ARRAY_DTYPES)
+def test_array_intensities(dtype, store):
+    np = api_mod.np
+    if np is None:
+        pytest.skip("numpy not installed")
+
+    values = [1, 0, 3, 1] if dtype.startswith("u") or dtype == "bool" else [1.5, 0, -2, 3]
+    _check_dtype(np.array(values).astype(dtype), store)
+
+
+@pytest.mark.parametrize("columns", [
+    (["A", "B"], ["B", "C"], ["help", "hug"], [1.0, 1.0]),
+    (["A", "B"], ["B", "C"], ["help", "help"], [1.0, "x"]),
+    (["A", "B"], ["B"], ["help", "help"], [1.0, 1.0]),
+])
+def test_bad_batch_applies_nothing(columns):
+    api = GhostAPI()
+    api.apply_event("A", "B", {"type": "help"})
+    before = _dump(api)
+
+    with pytest.raises(ValueError):
+        api.apply_events(*columns)
+
+    assert _dump(api) == before
+
+    if api_mod.np is not None:
+        for intensities in (["1"], [1j], api_mod.np.array([1.0], dtype=object)):
+            with pytest.raises(ValueError):
+                api.apply_events(["A"], ["B"], ["help"], api_mod.np.array(intensities))
+
+            assert _dump(api) == before
+
+
+def test_observers_and_custom_fields_take_the_exact_path():
+    event_map = {"praise": {"respect": 0.1, "trust": 0.05}, "help": {"trust": 0.2}}
+
+    seq = GhostAPI(event_map=event_map)
+    bulk = GhostAPI(event_map=event_map)
+    factions = bulk.engine.faction_index()
+
+    sources, targets, _, intensities = _columns(7, n=200)
+    types = [random.Random(i).choice(["praise", "help"]) for i in range(200)]
+
+    for s, t, kind, x in zip(sources, targets, types, intensities):
+        seq.apply_event(s, t, {"type": kind, "intensity": x})
+    bulk.apply_events(sources, targets, types, intensities)
+
+    assert _dump(bulk) == _dump(seq)
+    assert sorted(map(sorted, factions.factions())) == sorted(map(sorted, seq.engine.factions()))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_observed_graph_gets_one_delta_per_event(store):
+    seq = GhostAPI({"relationship_store": store})
+    bulk = GhostAPI({"relationship_store": store})
+    seen = []
+
+    class Recorder:
+        def on_delta(self, a, b, old_trust, new_trust, rel):
+            seen.append((a, b, new_trust))
+
+        def on_tick(self, dt):
+            pass
+
+    bulk.engine.relationships.add_observer(Recorder())
+
+    sources, targets, types, intensities = _columns(5, n=200)
+    for s, t, kind, x in zip(sources, targets, types, intensities):
+        seq.apply_event(s, t, {"type": kind, "intensity": x})
+    bulk.apply_events(sources, targets, types, intensities)
+
+    assert _dump(bulk) == _dump(seq)
+    assert [(a, b) for a, b, _ in seen] == list(zip(sources, targets))
+
+
+def test_apply_events_without_numpy(monkeypatch):
+    monkeypatch.setattr(api_mod, "np", None)
+
+    seq = GhostAPI()
+    bulk = GhostAPI()
+
+    sources, targets, types, intensities = _columns(3)
+
+    for s, t, kind, x in zip(sources, targets, types, intensities):
+        seq.apply_event(s, t, {"type": kind, "intensity": x})
+    bulk.apply_events(sources, targets, types, intensities)
+
+    assert _dump(bulk) == _dump(seq)
@@ -0,0 +1,81 @@
+import copy
+import random
+
+import pytest
+
+import ghost.api as api_mod
+from ghost.api import GhostAPI
+
+
+def _api(store, decay_mode, seed=18):
+    rng = random.Random(seed)
+    api = GhostAPI({"relationship_store": store, "decay_mode": decay_mode})
+    api.engine.snapshot()  # journals record from the first snapshot on
+
+    agents = [f"A{i}" for i in range(10)]
+    for step in range(300):
+        a, b = rng.sample(agents, 2)
+        api.apply_event(a, b, {"type": rng.choice(["help", "insult", "betrayal"]), "intensity": rng.random()})
+        if step % 50 == 49:
+            api.tick()
+
+    return api, agents
+
+
+def _internal_state(api):
+    """Raw storage, read without any lazy catch-up."""
+    graph = api.engine.relationships
+
+    if hasattr(graph, "_pos"):
+        edges = [list(graph._pos), list(graph._neg), list(graph._stamp), list(graph._has_trust)]
+    else:
+        edges = [graph._rels, graph._stamps]
+
+    return copy.deepcopy((edges, api._transitions, list(graph._touched.items())))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_bulk_reads_match_get_relationship(store, decay_mode):
+    api, agents = _api(store, decay_mode)
+    pairs = [(a, b) for a in agents for b in agents if a != b] + [("A0", "nobody")]
+
+    before = _internal_state(api)
+    rows = api.get_relationships(pairs)
+    by_agent = {a: api.get_relationships_for(a) for a in agents}
+
+    # reads are side-effect free
+    assert _internal_state(api) == before
+
+    # a separate instance, so get_relationship's transition tracking is not shared
+    reference, _ = _api(store, decay_mode)
+
+    for (a, b), row in zip(pairs, rows):
+        rel = reference.get_relationship(a, b)
+        assert row == (rel["trust"], rel["attachment"], rel["stability"], rel["state"])
+
+    for a in agents:
+        neighbors = reference.engine.relationships.neighbors(a)
+        assert [row[0] for row in by_agent[a]] == list(neighbors)
+
+        for other, *values in by_agent[a]:
+            assert tuple(values) == api.get_relationships([(a, other)])[0]
+
+
+def test_structured_arrays():
+    if api_mod.np is None:
+        pytest.skip("numpy not installed")
+
+    api, agents = _api("compact", "lazy")
+    pairs = [("A0", b) for b in agents[1:]]
+
+    rows = api.get_relationships(pairs)
+    array = api.get_relationships(pairs, as_array=True)
+
+    assert array.dtype.names == ("trust", "attachment", "stability", "band")
+    assert array["trust"].tolist() == [row[0] for row in rows]
+    assert [api.STATES[band] for band in array["band"]] == [row[3] for row in rows]
+
+    per_agent = api.get_relationships_for("A0", as_array=True)
+    assert per_agent["agent"].tolist() == list(api.engine.relationships.neighbors("A0"))
+    assert len(api.get_relationships_for("nobody", as_array=True)) == 0
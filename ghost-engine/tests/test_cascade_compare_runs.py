@@ -0,0 +1,95 @@
+import json
+import os
+import runpy
+import subprocess
+import sys
+
+import pytest
+
+CASCADE = os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments")
+sys.path.insert(0, CASCADE)
+
+# compare_runs' timelines and final snapshots from the baseline models
+BASELINE = os.path.join(os.path.dirname(__file__), "data", "compare_runs_baseline.json")
+
+RUNS = {
+    "control": "control_run",
+    "ghost_full": "ghost_full",
+    "ghost_no_memory": "ghost_no_memory",
+    "ghost_no_nonlinear": "ghost_no_nonlinear",
+    "ghost_no_topology": "ghost_no_topology",
+}
+
+
+# the control model reproduces the baseline to the last bit; run_ghost
+# sums memories in another order, so its floats only match to rounding
+TOLERANCE = 1e-9
+
+
+def _assert_matches(run, expected):
+    assert run["collapse_timeline"] == expected["collapse_timeline"]
+    assert run["final_snapshot"].keys() == expected["final_snapshot"].keys()
+
+    for city, fields in expected["final_snapshot"].items():
+        assert run["final_snapshot"][city] == pytest.approx(fields, rel=0.0, abs=TOLERANCE)
+
+
+@pytest.fixture(scope="module")
+def compare_runs():
+    return runpy.run_path(os.path.join(CASCADE, "compare_runs.py"))
+
+
+@pytest.mark.parametrize("name", sorted(RUNS))
+def test_compare_runs_reproduce_the_baseline(compare_runs, name):
+    with open(BASELINE) as f:
+        expected = json.load(f)[name]
+
+    run = compare_runs[RUNS[name]]
+    result = {
+        # in collapse order
+        "collapse_timeline": [list(item) for item in compare_runs["collapse_timeline"](run).items()],
+        "final_snapshot": compare_runs["final_snapshot"](run),
+    }
+
+    if name == "control":
+        assert result == expected
+    else:
+        _assert_matches(result, expected)
+
+
+# compare_runs with `import numpy` failing, results as JSON on stdout
+NO_NUMPY = """
+import contextlib, io, json, runpy, sys
+
+sys.modules["numpy"] = None
+sys.path.insert(0, {cascade!r})
+
+with contextlib.redirect_stdout(io.StringIO()):
+    ns = runpy.run_path({script!r})
+
+print(json.dumps({{
+    name: {{
+        "collapse_timeline": [list(item) for item in ns["collapse_timeline"](ns[var]).items()],
+        "final_snapshot": ns["final_snapshot"](ns[var]),
+    }}
+    for name, var in {runs!r}.items()
+}}))
+"""
+
+
+def test_compare_runs_without_numpy():
+    code = NO_NUMPY.format(
+        cascade=CASCADE,
+        script=os.path.join(CASCADE, "compare_runs.py"),
+        runs=RUNS,
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    with open(BASELINE) as f:
+        expected = json.load(f)
+
+    result = json.loads(out.stdout)
+
+    assert result.keys() == RUNS.keys()
+    for name in RUNS:
+        _assert_matches(result[name], expected[name])
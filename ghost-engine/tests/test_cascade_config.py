@@ -0,0 +1,95 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments"))
+
+import pytest  # noqa: E402
+
+import config  # noqa: E402
+from control_model import run_control  # noqa: E402
+from ghost_model import run_ghost  # noqa: E402
+from topology import grid  # noqa: E402
+
+# the constants config.py defined before CascadeConfig
+OLD_CONSTANTS = {
+    "alpha": 0.025,
+    "beta": 0.03,
+    "gamma": 0.85,
+    "k1": 0.02,
+    "k2": 0.015,
+    "lambda_": 1.2,
+    "delta": 0.08,
+    "mu": 0.50,
+    "collapse_threshold": 0.3,
+    "initial_stability": 1.0,
+    "initial_tension": 0.05,
+    "initial_memory": 0.0,
+    "ticks": 250,
+}
+
+
+def _old_weights():
+    """INITIAL_WEIGHTS as the old config.py drew them (random.seed(7))."""
+    rng = random.Random(7)
+    cities = [f"C{i}" for i in range(12)]
+    weights = {}
+
+    for i in cities:
+        for j in cities:
+            if i != j and rng.random() < 0.35:
+                weights[(i, j)] = round(rng.uniform(0.3, 1.0), 2)
+
+    return cities, weights
+
+
+def test_defaults_match_the_old_constants():
+    default = config.DEFAULT_CONFIG
+
+    for name, value in OLD_CONSTANTS.items():
+        assert getattr(default, name) == value, name
+
+    cities, weights = _old_weights()
+
+    assert list(default.cities) == cities == config.CITIES
+    assert dict(default.weights) == weights == config.INITIAL_WEIGHTS
+    assert list(default.weights) == list(weights)
+
+    # one draw of the default graph, shared by every default config
+    assert config.CascadeConfig().topology is default.topology is config.default_topology()
+
+
+def test_default_state_matches_init_state():
+    assert config.DEFAULT_CONFIG.init_state() == config.init_state()
+
+
+def test_key_follows_the_content():
+    default = config.DEFAULT_CONFIG
+
+    assert config.CascadeConfig().key == default.key
+    assert default.replace(alpha=0.03).key != default.key
+    assert default.replace(alpha=0.03).replace(alpha=config.ALPHA).key == default.key
+
+
+def test_sabotaged_cities_default_to_the_first_two():
+    assert config.DEFAULT_CONFIG.sabotaged_cities == ("C0", "C1")
+
+    # a smaller topology keeps the default, whatever its size
+    single = config.DEFAULT_CONFIG.replace(topology=grid(1, 1, 7), ticks=5)
+    assert single.sabotaged_cities == ("C0",)
+
+    run_control(0.7, config=single)
+    run_ghost(0.7, config=single)
+
+
+def test_sabotaged_cities_are_validated():
+    assert config.CascadeConfig(sabotaged=["C3"]).sabotaged == ("C3",)
+
+    with pytest.raises(ValueError):
+        config.CascadeConfig(sabotaged=("C0", "C99"))
+
+    with pytest.raises(ValueError):
+        config.CascadeConfig(sabotaged=("C2", "C2"))
+
+    with pytest.raises(ValueError):
+        config.CascadeConfig(topology=grid(1, 1, 7), sabotaged=("C0", "C1"))
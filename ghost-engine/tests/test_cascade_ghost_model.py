@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments"))
+
+import config  # noqa: E402
+from ghost_model import run_ghost, run_ghost_reference  # noqa: E402
+from recorder import TrajectoryRecorder  # noqa: E402
+from topology import erdos_renyi  # noqa: E402
+
+
+def _run(run, run_config, sabotage=0.7, **flags):
+    recorder = TrajectoryRecorder(run_config.cities, run_config.ticks)
+    return run(sabotage, recorder=recorder, config=run_config, **flags)
+
+
+# delta < 0 moves capped cities back down, delta == 0 never moves them,
+# delta 0.3 caps cities within a few collapses
+@pytest.mark.parametrize("delta", [config.DELTA, 0.3, 0.0, -0.05])
+@pytest.mark.parametrize("seed", [7, 8])
+@pytest.mark.parametrize("flags", [{}, {"use_memory": False}, {"use_topology": False}])
+def test_fast_path_follows_the_reference(delta, seed, flags):
+    run_config = config.CascadeConfig(topology=erdos_renyi(60, 0.08, seed), delta=delta)
+
+    exact = _run(run_ghost_reference, run_config, **flags)
+    running = _run(run_ghost, run_config, **flags)
+
+    assert np.allclose(exact.frames, running.frames, rtol=0.0, atol=1e-9)
+    assert exact.collapse_timeline() == running.collapse_timeline()
+
+
+# sabotage > 1: memory starts above the cap, so the first bump lowers it
+@pytest.mark.parametrize("delta", [config.DELTA, 0.0, -0.05])
+def test_fast_path_follows_the_reference_above_the_cap(delta):
+    run_config = config.CascadeConfig(topology=erdos_renyi(80, 0.05, 9), delta=delta, gamma=0.99)
+
+    exact = _run(run_ghost_reference, run_config, sabotage=1.6)
+    running = _run(run_ghost, run_config, sabotage=1.6)
+
+    assert exact.frames[0].max() > 1.0
+    assert np.allclose(exact.frames, running.frames, rtol=0.0, atol=1e-9)
+    assert exact.collapse_timeline() == running.collapse_timeline()
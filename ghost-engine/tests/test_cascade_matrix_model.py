@@ -0,0 +1,99 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments"))
+
+import config  # noqa: E402
+import matrix_model  # noqa: E402
+from control_model import run_control  # noqa: E402
+from ghost_model import run_ghost, run_ghost_reference  # noqa: E402
+from recorder import TrajectoryRecorder  # noqa: E402
+from topology import erdos_renyi  # noqa: E402
+
+
+def _config(seed):
+    return config.CascadeConfig(topology=erdos_renyi(len(config.CITIES), config.EDGE_PROBABILITY, seed))
+
+
+def _recorder(run_config):
+    return TrajectoryRecorder(run_config.cities, run_config.ticks)
+
+
+def _assert_same_run(by_dict, by_csr, cities):
+    result = by_csr["result"]
+
+    assert np.array_equal(by_dict.frames, by_csr["recorder"].frames)
+    assert by_dict.collapse_timeline() == matrix_model.timeline(result, cities)
+    assert by_dict.snapshot() == matrix_model.snapshot(result, cities)
+
+
+@pytest.mark.parametrize("seed", [7, 8, 11])
+@pytest.mark.parametrize("sabotage", [0.3, 0.7])
+def test_control_csr_matches_dict_model(seed, sabotage):
+    run_config = _config(seed)
+
+    by_dict = run_control(sabotage, recorder=_recorder(run_config), config=run_config)
+
+    recorder = _recorder(run_config)
+    result = matrix_model.run_control_csr(sabotage_level=sabotage, recorder=recorder, config=run_config)
+
+    _assert_same_run(by_dict, {"result": result, "recorder": recorder}, run_config.cities)
+
+
+@pytest.mark.parametrize("seed", [7, 8, 11])
+@pytest.mark.parametrize(
+    "flags",
+    [
+        {},
+        {"use_memory": False},
+        {"use_nonlinear": False},
+        {"use_topology": False},
+    ],
+)
+def test_ghost_csr_matches_dict_model(seed, flags):
+    run_config = _config(seed)
+
+    by_dict = run_ghost_reference(0.7, recorder=_recorder(run_config), config=run_config, **flags)
+
+    recorder = _recorder(run_config)
+    result = matrix_model.run_ghost_csr(
+        sabotage_level=0.7, recorder=recorder, config=run_config, memory_sums="exact", **flags
+    )
+
+    _assert_same_run(by_dict, {"result": result, "recorder": recorder}, run_config.cities)
+
+
+@pytest.mark.parametrize("sabotaged", [(), ("C5",), ("C11", "C3", "C7")])
+def test_csr_models_sabotage_the_configured_cities(sabotaged):
+    run_config = _config(7).replace(sabotaged=sabotaged)
+
+    by_dict = run_control(0.7, recorder=_recorder(run_config), config=run_config)
+    recorder = _recorder(run_config)
+    result = matrix_model.run_control_csr(sabotage_level=0.7, recorder=recorder, config=run_config)
+
+    _assert_same_run(by_dict, {"result": result, "recorder": recorder}, run_config.cities)
+
+    by_dict = run_ghost_reference(0.7, recorder=_recorder(run_config), config=run_config)
+    recorder = _recorder(run_config)
+    result = matrix_model.run_ghost_csr(sabotage_level=0.7, recorder=recorder, config=run_config)
+
+    _assert_same_run(by_dict, {"result": result, "recorder": recorder}, run_config.cities)
+
+
+@pytest.mark.parametrize("seed", [7, 8])
+def test_running_memory_sums_stay_close(seed):
+    run_config = _config(seed)
+
+    by_dict = run_ghost(0.7, recorder=_recorder(run_config), config=run_config)
+
+    recorder = _recorder(run_config)
+    result = matrix_model.run_ghost_csr(
+        sabotage_level=0.7, recorder=recorder, config=run_config, memory_sums="running"
+    )
+
+    assert np.allclose(by_dict.frames, recorder.frames, rtol=0.0, atol=1e-9)
+    assert by_dict.collapse_timeline() == matrix_model.timeline(result, run_config.cities)
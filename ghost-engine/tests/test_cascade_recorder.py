@@ -0,0 +1,132 @@
+import os
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments"))
+
+import recorder as recorder_module  # noqa: E402
+from recorder import TrajectoryRecorder  # noqa: E402
+
+CITIES = ["C0", "C1", "C2", "C3"]
+
+
+def _states(ticks, seed=5):
+    """A state dict per tick; cities collapse for good, one after another."""
+    rng = random.Random(seed)
+    collapsed = set()
+    out = []
+
+    for tick in range(ticks):
+        if tick % 4 == 3:
+            collapsed.add(rng.choice(CITIES))
+
+        out.append({
+            city: {
+                "stability": rng.random(),
+                "tension": rng.random(),
+                "memory": rng.random(),
+                "collapsed": city in collapsed,
+            }
+            for city in CITIES
+        })
+
+    return out
+
+
+@pytest.mark.parametrize("every", [1, 3])
+def test_snapshots_round_trip(every):
+    states = _states(12)
+    recorder = TrajectoryRecorder(CITIES, 12, every=every)
+
+    for tick, state in enumerate(states):
+        recorder.record(tick, state)
+
+    assert recorder.frame_ticks.tolist() == list(range(0, 12, every))
+
+    for tick in recorder.frame_ticks.tolist():
+        assert recorder.snapshot(tick) == states[tick]
+
+    assert recorder.snapshot() == states[-1]
+
+    first = {}
+    for tick, state in enumerate(states):
+        for city in CITIES:
+            if state[city]["collapsed"]:
+                first.setdefault(city, tick)
+
+    assert recorder.collapse_timeline() == first
+
+    if every > 1:
+        with pytest.raises(KeyError):
+            recorder.snapshot(1)
+
+
+def test_array_records_match_dict_records():
+    states = _states(8)
+    from_dicts = TrajectoryRecorder(CITIES, 8)
+    from_arrays = TrajectoryRecorder(CITIES, 8)
+
+    for tick, state in enumerate(states):
+        from_dicts.record(tick, state)
+
+        rows = [state[city] for city in CITIES]
+        from_arrays.record_arrays(
+            tick,
+            np.array([row["stability"] for row in rows]),
+            np.array([row["tension"] for row in rows]),
+            np.array([row["memory"] for row in rows]),
+            np.array([row["collapsed"] for row in rows]),
+        )
+
+    assert np.array_equal(from_dicts.frames, from_arrays.frames)
+    assert np.array_equal(from_dicts.collapse_tick, from_arrays.collapse_tick)
+
+
+def test_a_stopped_run_lists_only_recorded_frames():
+    states = _states(5)
+    recorder = TrajectoryRecorder(CITIES, 20, every=2)
+
+    for tick, state in enumerate(states):
+        recorder.record(tick, state)
+
+    assert recorder.frame_ticks.tolist() == [0, 2, 4]
+    assert recorder.frames.shape == (3, len(CITIES), 3)
+    assert recorder.snapshot(4) == states[4]
+
+    with pytest.raises(KeyError):
+        recorder.snapshot(6)
+
+
+def test_events_only_keeps_the_last_state():
+    states = _states(6)
+    recorder = TrajectoryRecorder(CITIES, 6, events_only=True)
+
+    for tick, state in enumerate(states):
+        recorder.record(tick, state)
+
+    assert len(recorder.frames) == 0
+    assert recorder.snapshot() == states[-1]
+
+
+def test_readers_return_lists_without_numpy(monkeypatch):
+    monkeypatch.setattr(recorder_module, "_numpy", lambda: None)
+
+    states = _states(6)
+    recorder = TrajectoryRecorder(CITIES, 6, every=2)
+
+    for tick, state in enumerate(states):
+        recorder.record(tick, state)
+
+    assert recorder.frame_ticks == [0, 2, 4]
+    frame = [[[state[city][field] for field in ("stability", "tension", "memory")] for city in CITIES]
+             for state in states]
+
+    assert recorder.frames == [frame[0], frame[2], frame[4]]
+    assert recorder.last_frame == frame[5]
+    assert recorder.snapshot(2) == states[2]
+    assert recorder.snapshot() == states[-1]
+    assert isinstance(recorder.collapse_tick, list)
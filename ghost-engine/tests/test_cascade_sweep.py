@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "cascade_experiments"))
+
+import sweep  # noqa: E402
+
+GRID = {"model": ["ghost", "control"], "sabotage": [0.3, 0.7], "seed": [7, 8]}
+
+
+def _by_key(results):
+    order = np.argsort(results["key"])
+    return {column: values[order] for column, values in results.items()}
+
+
+def _assert_same_results(a, b):
+    a = _by_key(a)
+    b = _by_key(b)
+
+    assert sorted(a) == sorted(b)
+    for column in a:
+        assert np.array_equal(a[column], b[column]), column
+
+
+def test_interrupted_sweep_resumes_from_its_chunks(tmp_path, monkeypatch):
+    runs = len(list(sweep.expand(GRID)))
+    assert runs == 8
+
+    run_one = sweep.run_one
+    calls = []
+
+    def failing(item):
+        calls.append(item[0])
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+        return run_one(item)
+
+    monkeypatch.setattr(sweep, "run_one", failing)
+
+    with pytest.raises(KeyboardInterrupt):
+        sweep.sweep(GRID, str(tmp_path / "resumed"), processes=1, flush_every=2)
+
+    # the flushed chunk plus the rows finished before the interrupt
+    partial = sweep.load_results(str(tmp_path / "resumed"))
+    assert partial["key"].tolist() == calls[:3]
+    assert sorted(os.listdir(tmp_path / "resumed")) == ["part-00000.npz", "part-00001.npz"]
+
+    monkeypatch.setattr(sweep, "run_one", run_one)
+
+    assert sweep.sweep(GRID, str(tmp_path / "resumed"), processes=1, flush_every=2) == runs - 3
+    assert sweep.sweep(GRID, str(tmp_path / "resumed"), processes=1) == 0
+
+    resumed = sweep.load_results(str(tmp_path / "resumed"))
+    assert len(set(resumed["key"].tolist())) == runs
+
+    sweep.sweep(GRID, str(tmp_path / "fresh"), processes=1)
+    _assert_same_results(resumed, sweep.load_results(str(tmp_path / "fresh")))
+
+
+def test_unfinished_chunk_files_are_ignored(tmp_path):
+    path = str(tmp_path)
+    sweep.sweep({"sabotage": [0.3]}, path, processes=1)
+
+    # a write cut short before its rename
+    with open(os.path.join(path, "part-00001.npz.tmp"), "wb") as f:
+        f.write(b"partial")
+
+    assert len(sweep.load_results(path)["key"]) == 1
+    assert sweep.sweep({"sabotage": [0.3, 0.7]}, path, processes=1) == 1
+
+
+def test_memory_sums_are_part_of_the_key():
+    keys = {params["memory_sums"]: key for key, params in sweep.expand({"memory_sums": ["exact", "running"]})}
+
+    assert sorted(keys) == ["exact", "running"]
+    assert keys["exact"] != keys["running"]
+
+    # control runs do not read it
+    assert len(list(sweep.expand({"model": ["control"], "memory_sums": ["exact", "running"]}))) == 1
+
+    with pytest.raises(ValueError):
+        list(sweep.expand({"memory_sums": ["approximate"]}))
@@ -0,0 +1,66 @@
+import json
+import random
+
+from ghost.engine import GhostEngine
+
+
+def _events(seed=5, n=1500):
+    rng = random.Random(seed)
+    actors = [f"a{i}" for i in range(10)]
+
+    return [
+        {
+            "source": "npc_engine",
+            "intent": rng.choice(["greet", "help", "threat", "observe"]),
+            "actor": rng.choice(actors),
+            "target": rng.choice(actors + [None]),
+            "intensity": rng.random(),
+        }
+        for _ in range(n)
+    ]
+
+
+def test_compact_agents_match_dict_agents():
+    events = _events()
+
+    plain = GhostEngine()
+    compact = GhostEngine({"agent_store": "compact"})
+
+    plain.step_many(events)
+    compact.step_many(events)
+
+    snap = compact.snapshot()
+    snap.pop("agent_store")
+
+    assert snap == plain.snapshot()
+    json.dumps(snap)
+
+
+def test_compact_agent_view_is_dict_like():
+    g = GhostEngine({"agent_store": "compact"})
+
+    agent = g.agents.ensure("Alice")
+
+    assert agent["mood"] == 0.5
+    assert agent["memory"] == {}
+    assert agent == {"mood": 0.5, "memory": {}, "last_intent": None, "tension": 0.0}
+
+    g.state()["agents"]["Alice"]["mood"] = 0.25
+    g.state()["agents"]["Alice"]["memory"]["seen"] = 1
+
+    assert g.agents.get("Alice")["mood"] == 0.25
+    assert g.snapshot()["agents"]["Alice"]["memory"] == {"seen": 1}
+    assert "Bob" not in g.state()["agents"]
+    assert g.agents.get("Bob") is None
+
+
+def test_compact_store_adopts_existing_agents():
+    ctx = {
+        "agent_store": "compact",
+        "agents": {"Alice": {"mood": 0.9, "memory": {}, "last_intent": "greet", "tension": 0.1}},
+    }
+
+    g = GhostEngine(ctx)
+
+    assert g.state()["agents"]["Alice"]["mood"] == 0.9
+    assert g.state()["agents"]["Alice"]["last_intent"] == "greet"
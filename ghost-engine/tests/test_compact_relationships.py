@@ -0,0 +1,77 @@
+import json
+
+from ghost.engine import GhostEngine
+from ghost.relationships import RelationshipGraph
+
+
+def _drive(g):
+    r = g.relationships
+
+    r.apply_delta("Alice", "Bob", {"trust": 0.3, "attachment": 0.1})
+    r.apply_delta("Bob", "Alice", {"trust": -0.5})
+    r.apply_delta("Carol", "Alice", {"trust": 0.2, "rivalry": 0.4})
+    r.set_personality("Carol", "Dave", "resentful")
+    r.apply_delta("Dave", "Carol", {"trust": -0.7})
+    r.set_personality("Eve", "Alice", "resentful")
+
+    for _ in range(5):
+        r.tick()
+
+    g.step({"source": "npc_engine", "intent": "threat", "actor": "Bob", "target": "Alice", "intensity": 0.8})
+
+
+def test_compact_store_matches_dict_store():
+    plain = GhostEngine()
+    compact = GhostEngine({"relationship_store": "compact"})
+
+    _drive(plain)
+    _drive(compact)
+
+    for a, b in [("Alice", "Bob"), ("Carol", "Alice"), ("Dave", "Carol"), ("Eve", "Alice"), ("X", "Y")]:
+        assert compact.relationships.get(a, b) == plain.relationships.get(a, b)
+
+    snap = compact.snapshot()
+    snap.pop("relationship_store")
+
+    assert snap == plain.snapshot()
+    json.dumps(snap)
+
+
+def test_compact_store_shares_preset_parameters():
+    g = GhostEngine({"relationship_store": "compact"})
+    r = g.relationships
+
+    for i in range(50):
+        r.set_personality(f"A{i}", f"B{i}", "volatile")
+        r.set_personality(f"A{i}", f"C{i}", "forgiving")
+
+    # defaults + two presets, regardless of edge count
+    assert len(r._profiles) == 3
+    assert r.get("A7", "B7")["pos_decay"] == RelationshipGraph.PERSONALITY_PRESETS["volatile"]["pos_decay"]
+
+
+def test_compact_relationship_view_lookup():
+    g = GhostEngine({"relationship_store": "compact"})
+
+    g.relationships.apply_delta("b|x", "a", {"trust": 0.1})
+
+    rels = g.relationships.all()
+
+    assert len(rels) == 1
+    assert list(rels) == ["a|b|x"]
+    assert rels["a|b|x"]["pos"] == 0.1
+
+
+def test_compact_snapshot_serializes_like_dict_store():
+    plain = GhostEngine({"relationship_store": "dict"})
+    compact = GhostEngine({"relationship_store": "compact"})
+
+    _drive(plain)
+    _drive(compact)
+
+    plain_snap = plain.snapshot()
+    compact_snap = compact.snapshot()
+    compact_snap["relationship_store"] = "dict"
+
+    assert list(compact_snap) == list(plain_snap)
+    assert json.dumps(compact_snap) == json.dumps(plain_snap)
@@ -0,0 +1,90 @@
+import pytest
+
+from ghost import EnginePool, GhostEngine
+from ghost.api import DEFAULT_EVENT_MAP
+
+
+def _threat(actor, target):
+    return {"source": "test", "intent": "threat", "actor": actor, "target": target, "intensity": 1.0}
+
+
+def test_worlds_are_isolated():
+    pool = EnginePool({"relationship_store": "compact"})
+
+    pool.create("w1")
+    pool.create("w2")
+
+    pool.step("w1", _threat("A", "B"))
+
+    assert pool.get("w1").state()["cycles"] == 1
+    assert pool.get("w2").state()["cycles"] == 0
+    assert pool.get("w2").state()["agents"] == {}
+
+    assert pool.get("w1").state()["relationship_store"] == "compact"
+    assert pool.get("w1").state() is not pool.get("w2").state()
+
+
+def test_step_many_matches_individual_engines():
+    pool = EnginePool()
+    reference = {}
+
+    batches = {}
+    for w in range(5):
+        pool.create(w)
+        reference[w] = GhostEngine()
+        batches[w] = [_threat(f"A{i % 3}", f"A{(i + w) % 4}") for i in range(10)]
+
+    pool.step_many(batches)
+
+    for w, events in batches.items():
+        for event in events:
+            reference[w].step(event)
+
+        assert pool.snapshot(w) == reference[w].snapshot()
+
+
+def test_shared_tables_are_not_copied():
+    pool = EnginePool()
+    pool.create("w1")
+    pool.create("w2")
+
+    assert pool.event_map is DEFAULT_EVENT_MAP
+
+    pool.apply_event("w1", "A", "B", {"type": "help"})
+
+    assert pool.get("w1").relationships.get("A", "B")["trust"] == pytest.approx(0.2)
+    assert pool.get("w2").relationships.get("A", "B") is None
+
+    r1 = pool.get("w1").relationships
+    r2 = pool.get("w2").relationships
+    assert r1.PERSONALITY_PRESETS is r2.PERSONALITY_PRESETS
+
+
+def test_memory_usage_grows_with_world_state():
+    pool = EnginePool()
+    pool.create("small")
+    pool.create("big")
+
+    pool.step_many({"big": [_threat(f"A{i}", f"A{i + 1}") for i in range(50)]})
+
+    usage = pool.memory_usage()
+
+    assert set(usage) == {"small", "big"}
+    assert 0 < usage["small"] < usage["big"]
+    assert pool.memory_usage("small") == usage["small"]
+
+
+def test_registry_errors():
+    pool = EnginePool()
+    pool.create("w1")
+
+    with pytest.raises(ValueError):
+        pool.create("w1")
+
+    with pytest.raises(KeyError):
+        pool.step("missing", None)
+
+    pool.remove("w1")
+
+    assert "w1" not in pool
+    assert len(pool) == 0
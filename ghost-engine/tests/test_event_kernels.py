@@ -0,0 +1,150 @@
+import json
+import random
+
+import pytest
+
+from ghost.api import DEFAULT_EVENT_MAP, GhostAPI, event_deltas
+from ghost.engine import _json_safe
+from ghost.pool import EnginePool
+
+
+CUSTOM_MAP = {
+    "help": {"trust": 0.2},
+    "gift": {"attachment": 0.1},
+    "bond": {"attachment": 0.05, "trust": 0.1},
+    "praise": {"trust": 0.05, "respect": 0.2},
+    "noop": {},
+}
+
+
+def _dump(api):
+    return json.dumps(_json_safe(api.engine.snapshot()))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("event_map", [DEFAULT_EVENT_MAP, CUSTOM_MAP])
+def test_compiled_events_match_generic_path(store, event_map):
+    rng = random.Random(16)
+    compiled = GhostAPI({"relationship_store": store}, event_map=event_map)
+    generic = GhostAPI({"relationship_store": store}, event_map=event_map)
+
+    agents = [f"A{i}" for i in range(12)]
+    kinds = list(event_map)
+
+    for _ in range(800):
+        a, b = rng.sample(agents, 2)
+        event = {"type": rng.choice(kinds), "intensity": rng.choice([1, 0, -0.5, rng.random()])}
+
+        compiled.apply_event(a, b, event)
+        generic.engine.relationships.apply_delta(a, b, event_deltas(event_map, event))
+
+    assert _dump(compiled) == _dump(generic)
+
+
+def test_recompiles_when_the_map_changes():
+    api = GhostAPI()
+
+    api.apply_event("A", "B", {"type": "help"})
+    assert api.get_relationship("A", "B")["trust"] == pytest.approx(0.2)
+
+    # replaced map
+    api.event_map = {"help": {"trust": 0.5}}
+    api.apply_event("A", "B", {"type": "help"})
+    assert api.get_relationship("A", "B")["trust"] == pytest.approx(0.7)
+
+    with pytest.raises(ValueError):
+        api.apply_event("A", "B", {"type": "insult"})
+
+    # replaced / added / removed entries
+    api.event_map["help"] = {"trust": -0.1}
+    api.event_map["hug"] = {"attachment": 0.3}
+    api.apply_event("A", "B", {"type": "help"})
+    api.apply_event("A", "B", {"type": "hug"})
+
+    rel = api.get_relationship("A", "B")
+    assert rel["trust"] == pytest.approx(0.6)
+    assert rel["attachment"] == pytest.approx(0.3)
+
+    del api.event_map["hug"]
+    with pytest.raises(ValueError):
+        api.apply_event("A", "B", {"type": "hug"})
+
+
+def test_recompiles_after_in_place_edits():
+    single = GhostAPI(event_map={"insult": {"trust": -0.3}, "hug": {"attachment": 0.1}})
+    batch = GhostAPI(event_map={"insult": {"trust": -0.3}, "hug": {"attachment": 0.1}})
+
+    single.apply_event("A", "B", {"type": "insult"})
+    batch.apply_events(["A"], ["B"], ["insult"])
+
+    for api in (single, batch):
+        api.event_map["insult"]["trust"] = -0.9
+        api.event_map["hug"]["respect"] = 0.2
+    
+    single.apply_event("A", "B", {"type": "insult"})
+    single.apply_event("A", "B", {"type": "hug"})
+    batch.apply_events(["A", "A"], ["B", "B"], ["insult", "hug"])
+
+    assert _dump(single) == _dump(batch)
+    assert single.engine.relationships.trust("A", "B") == pytest.approx(-1.2)
+    assert single.engine.relationships.get("A", "B")["respect"] == pytest.approx(0.2)
+
+
+def test_in_place_edits_apply_on_both_paths():
+    event_map = {"insult": {"trust": -0.3}, "help": {"trust": 0.2}}
+    single = GhostAPI(event_map=event_map)
+    batch = GhostAPI(event_map=event_map)
+    pool = EnginePool(event_map=event_map)
+    pool.create("w")
+
+    # compile every kernel before editing
+    single.apply_event("A", "B", {"type": "insult"})
+    single.apply_event("A", "B", {"type": "help"})
+    batch.apply_events(["A", "A"], ["B", "B"], ["insult", "help"])
+    pool.apply_event("w", "A", "B", {"type": "insult"})
+
+    event_map["insult"]["trust"] = -0.5
+    event_map["help"] = {"trust": 0.1, "attachment": 0.4}
+
+    single.apply_event("A", "B", {"type": "insult", "intensity": 0.5})
+    single.apply_event("A", "B", {"type": "help"})
+    batch.apply_events(["A", "A"], ["B", "B"], ["insult", "help"], [0.5, 1.0])
+    pool.apply_event("w", "A", "B", {"type": "insult"})
+
+    assert _dump(single) == _dump(batch)
+    assert single.engine.relationships.trust("A", "B") == pytest.approx(-0.25)
+    assert pool.get("w").relationships.trust("A", "B") == pytest.approx(-0.8)
+
+    # a deleted type no longer applies on either path
+    del event_map["insult"]
+    with pytest.raises(ValueError):
+        single.apply_event("A", "B", {"type": "insult"})
+    with pytest.raises(ValueError):
+        batch.apply_events(["A"], ["B"], ["insult"])
+    with pytest.raises(ValueError):
+        pool.apply_event("w", "A", "B", {"type": "insult"})
+
+
+def test_edits_to_the_shared_default_map_apply():
+    api = GhostAPI()
+    api.apply_event("A", "B", {"type": "help"})
+
+    saved = DEFAULT_EVENT_MAP["help"]["trust"]
+    DEFAULT_EVENT_MAP["help"]["trust"] = 0.4
+    try:
+        api.apply_event("A", "B", {"type": "help"})
+        api.apply_events(["A"], ["B"], ["help"])
+    finally:
+        DEFAULT_EVENT_MAP["help"]["trust"] = saved
+
+    assert api.engine.relationships.trust("A", "B") == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("event", [
+    "help",
+    {"type": "help", "intensity": "x"},
+    {"type": "hug"},
+])
+def test_validation(event):
+    with pytest.raises(ValueError):
+        GhostAPI().apply_event("A", "B", event)
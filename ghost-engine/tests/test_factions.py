@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from ghost import factions
+from ghost.engine import GhostEngine
+
+
+STRONG = 0.2
+
+
+def _brute_force(graph):
+    """Factions recomputed from scratch: components over trust >= STRONG."""
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    for a, b in graph.pairs():
+        if graph.trust(a, b) >= STRONG:
+            parent.setdefault(a, a)
+            parent.setdefault(b, b)
+            parent[find(a)] = find(b)
+
+    groups = {}
+    for x in parent:
+        groups.setdefault(find(x), set()).add(x)
+
+    return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+
+def _normalized(factions):
+    return sorted(sorted(members) for members in factions)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_incremental_factions_match_recompute(store, decay_mode):
+    rng = random.Random(4)
+    rt = GhostEngine({"relationship_store": store, "decay_mode": decay_mode})
+    graph = rt.relationships
+
+    agents = [f"A{i}" for i in range(40)]
+
+    # index built mid-run, then maintained incrementally
+    for step in range(1500):
+        a, b = rng.sample(agents, 2)
+        graph.apply_delta(a, b, {"trust": rng.uniform(-0.12, 0.2)})
+
+        if rng.random() < 0.02:
+            # forgiving edges: neg decays faster, so trust can rise on its own
+            graph.set_personality(a, b, "forgiving")
+
+        if step == 300:
+            rt.faction_index()
+
+        if step % 50 == 49:
+            rt.tick(dt=rng.choice([1, 2.5]))
+
+        if step > 300 and step % 25 == 0:
+            assert _normalized(rt.factions()) == _brute_force(graph)
+
+    assert _normalized(rt.factions()) == _brute_force(graph)
+
+
+def test_faction_membership():
+    rt = GhostEngine()
+    graph = rt.relationships
+    index = rt.faction_index()
+
+    graph.apply_delta("A", "B", {"trust": 0.3})
+    graph.apply_delta("B", "C", {"trust": 0.3})
+    graph.apply_delta("X", "Y", {"trust": 0.1})
+
+    assert index.faction_of("A") == index.faction_of("C") is not None
+    assert index.faction_of("X") is None
+
+    # a weakened tie splits the faction
+    graph.apply_delta("B", "C", {"trust": -0.2})
+
+    assert index.faction_of("C") is None
+    assert rt.factions() == [["A", "B"]] or rt.factions() == [["B", "A"]]
+
+
+def test_split_only_walks_the_faction_that_lost_a_tie():
+    rt = GhostEngine()
+    graph = rt.relationships
+    index = rt.faction_index()
+
+    for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("X", "Y"), ("Y", "Z")]:
+        graph.apply_delta(a, b, {"trust": 0.3})
+
+    other = index._members[index._label["X"]]
+
+    graph.apply_delta("B", "C", {"trust": -0.2})
+
+    assert _normalized(rt.factions()) == [["A", "B"], ["C", "D"], ["X", "Y", "Z"]]
+    assert index._members[index._label["X"]] is other
+
+
+@pytest.mark.parametrize("local_check", [64, 2])
+def test_reads_between_every_change_match_recompute(monkeypatch, local_check):
+    # a small bound sends most splits through the dirty re-split
+    monkeypatch.setattr(factions, "_LOCAL_CHECK", local_check)
+
+    rng = random.Random(9)
+    rt = GhostEngine()
+    graph = rt.relationships
+    index = rt.faction_index()
+
+    agents = [f"A{i}" for i in range(12)]
+
+    for step in range(600):
+        a, b = rng.sample(agents, 2)
+        graph.apply_delta(a, b, {"trust": rng.uniform(-0.3, 0.3)})
+
+        if step % 40 == 39:
+            rt.tick()
+
+        assert _normalized(index.factions()) == _brute_force(graph)
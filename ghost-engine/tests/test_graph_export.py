@@ -0,0 +1,115 @@
+import copy
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ghost.engine import GhostEngine
+from ghost.export import EDGE_FIELDS, read_edge_list
+
+
+def _engine(store, decay_mode="eager"):
+    rt = GhostEngine({"relationship_store": store, "decay_mode": decay_mode})
+    graph = rt.relationships
+
+    graph.apply_delta("A", "B", {"trust": 0.3, "attachment": 0.1})
+    graph.apply_delta("C", "A", {"trust": -0.25})
+    graph.apply_delta('x<&"y', "B", {"trust": 0.05})
+    graph.set_personality("C", "A", "resentful")
+
+    rt.tick(dt=2)
+    return rt
+
+
+def _expected(rt):
+    out = {}
+    for a, b in rt.relationships.pairs():
+        rel = rt.relationships.get(a, b)
+        out[(a, b)] = tuple(rel[name] for name in EDGE_FIELDS)
+    return out
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_binary_edge_list_round_trip(tmp_path, store, decay_mode):
+    rt = _engine(store, decay_mode)
+    path = tmp_path / "graph.ghel"
+
+    assert rt.export_relationship_graph_edges(path) == 3
+
+    rows = {(a, b): tuple(values) for a, b, *values in read_edge_list(path)}
+    assert rows == _expected(rt)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_gexf_export(tmp_path, store):
+    rt = _engine(store)
+    path = tmp_path / "graph.gexf"
+
+    assert rt.export_relationship_graph_gexf(path) == 3
+
+    ns = {"g": "http://www.gexf.net/1.2draft"}
+    root = ET.parse(path).getroot()
+
+    titles = {
+        a.get("id"): a.get("title")
+        for a in root.iterfind("g:graph/g:attributes/g:attribute", ns)
+    }
+    nodes = {n.get("id") for n in root.iterfind("g:graph/g:nodes/g:node", ns)}
+    assert nodes == {"A", "B", "C", 'x<&"y'}
+
+    edges = {}
+    for edge in root.iterfind("g:graph/g:edges/g:edge", ns):
+        values = {
+            titles[v.get("for")]: float(v.get("value"))
+            for v in edge.iterfind("g:attvalues/g:attvalue", ns)
+        }
+        edges[(edge.get("source"), edge.get("target"))] = tuple(
+            values[name] for name in EDGE_FIELDS
+        )
+
+    assert edges == _expected(rt)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_graphml_export(tmp_path, store):
+    rt = _engine(store)
+    path = tmp_path / "graph.graphml"
+
+    assert rt.export_relationship_graph_graphml(path) == 3
+
+    ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+    root = ET.parse(path).getroot()
+
+    edges = {}
+    for edge in root.iterfind("g:graph/g:edge", ns):
+        values = {d.get("key"): float(d.text) for d in edge.iterfind("g:data", ns)}
+        edges[(edge.get("source"), edge.get("target"))] = tuple(
+            values[name] for name in EDGE_FIELDS
+        )
+
+    assert edges == _expected(rt)
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "graph.ghel"
+    path.write_bytes(b"not an edge list")
+
+    with pytest.raises(ValueError):
+        list(read_edge_list(path))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_edge_rows_name_ids_containing_the_key_separator(store):
+    rt = GhostEngine({"relationship_store": store})
+    rt.relationships.apply_delta("x|y", "z", {"trust": 0.3})  # key "x|y|z"
+    rt.relationships.apply_delta("z", "w", {"trust": 0.1})
+
+    expected = [("x|y", "z"), ("w", "z")]
+    assert [tuple(row[:2]) for row in rt.relationships.edge_rows()] == expected
+
+    # a context adopted from a snapshot names its edges the same way
+    state = copy.deepcopy(rt.snapshot())
+    state["relationship_store"] = store
+    adopted = GhostEngine(state).relationships
+
+    assert [tuple(row[:2]) for row in adopted.edge_rows()] == expected
@@ -0,0 +1,132 @@
+import copy
+import json
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine, _json_safe
+from ghost.snapshot import plain
+
+
+def _full(g):
+    g.relationships.materialize()
+    return _json_safe(copy.deepcopy(g.state()))
+
+
+@pytest.mark.parametrize("agent_store", ["dict", "compact"])
+@pytest.mark.parametrize("relationship_store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_incremental_snapshot_matches_full_rebuild(agent_store, relationship_store, decay_mode):
+    rng = random.Random(11)
+    g = GhostEngine({
+        "agent_store": agent_store,
+        "relationship_store": relationship_store,
+        "decay_mode": decay_mode,
+    })
+
+    agents = [f"A{i}" for i in range(25)]
+
+    for _ in range(80):
+        for _ in range(rng.randint(0, 6)):
+            g.step({
+                "source": "test",
+                "intent": rng.choice(["greet", "help", "threat", "idle"]),
+                "actor": rng.choice(agents),
+                "target": rng.choice(agents + [None]),
+                "intensity": rng.random(),
+            })
+
+        if rng.random() < 0.2:
+            g.relationships.tick()
+
+        if rng.random() < 0.1:
+            g.relationships.set_personality(*rng.sample(agents, 2), "volatile")
+
+        snap = g.snapshot()
+
+        # same content and key order as the deepcopy path
+        assert json.dumps(snap) == json.dumps(_full(g))
+
+
+def test_untouched_records_are_shared():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "help", "actor": "A", "target": "B", "intensity": 1.0})
+    g.step({"source": "test", "intent": "greet", "actor": "C", "target": "D", "intensity": 1.0})
+
+    first = g.snapshot()
+
+    g.step({"source": "test", "intent": "threat", "actor": "C", "target": "D", "intensity": 1.0})
+
+    second = g.snapshot()
+
+    assert second["agents"]["A"] is first["agents"]["A"]
+    assert second["relationships"]["A|B"] is first["relationships"]["A|B"]
+    assert second["neighbors"]["A"] is first["neighbors"]["A"]
+
+    assert second["agents"]["C"] is not first["agents"]["C"]
+    assert second["relationships"]["C|D"] != first["relationships"]["C|D"]
+
+    # nothing changed: every record is reused
+    third = g.snapshot()
+    assert all(third["agents"][k] is second["agents"][k] for k in second["agents"])
+
+
+def test_tick_rebuilds_relationships():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "help", "actor": "A", "target": "B", "intensity": 1.0})
+
+    before = g.snapshot()
+    g.relationships.tick()
+    after = g.snapshot()
+
+    assert after["relationships"]["A|B"]["pos"] < before["relationships"]["A|B"]["pos"]
+
+
+def test_snapshot_records_are_read_only():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "threat", "actor": "A", "target": "B", "intensity": 1.0})
+
+    snap = g.snapshot()
+
+    with pytest.raises(TypeError):
+        snap["agents"]["A"]["mood"] = 0.0
+
+    with pytest.raises(TypeError):
+        snap["neighbors"]["A"].append("X")
+
+    with pytest.raises(TypeError):
+        snap["npc"]["actors"]["A"]["threat_count"] = 0
+
+    # the containers holding the records are the caller's
+    snap["agents"]["X"] = {"mood": 1.0}
+    del snap["relationships"]["A|B"]
+    snap["npc"]["actors"].clear()
+    assert "X" not in g.snapshot()["agents"]
+    assert "A|B" in g.snapshot()["relationships"]
+
+    # deep copies are ordinary, caller-owned containers
+    owned = copy.deepcopy(snap)
+    owned["agents"]["A"]["mood"] = 0.0
+    owned["neighbors"]["A"].append("X")
+
+    assert type(owned["agents"]["A"]) is dict
+    assert g.snapshot()["agents"]["A"]["mood"] != 0.0
+
+    # plain() is the documented migration for code that edits in place
+    owned = plain(g.snapshot())
+    owned["agents"]["A"]["mood"] = 0.0
+    owned["npc"]["actors"]["A"]["threat_count"] = 0
+
+    assert owned == json.loads(json.dumps(owned))
+    assert g.snapshot()["agents"]["A"]["mood"] != 0.0
+
+
+def test_invalidate_snapshot_after_manual_edit():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "greet", "actor": "A", "target": "B", "intensity": 1.0})
+    g.snapshot()
+
+    g.state()["agents"]["A"]["mood"] = 0.123
+    g.invalidate_snapshot()
+
+    assert g.snapshot()["agents"]["A"]["mood"] == 0.123
@@ -0,0 +1,86 @@
+import math
+import random
+
+import pytest
+
+import ghost.relationships as relationships_mod
+from ghost.engine import GhostEngine
+
+
+def _run(store, decay_mode, seed=3):
+    rng = random.Random(seed)
+    g = GhostEngine({"relationship_store": store, "decay_mode": decay_mode})
+    r = g.relationships
+
+    agents = [f"N{i}" for i in range(40)]
+    reads = []
+
+    for _ in range(60):
+        for _ in range(30):
+            a, b = rng.sample(agents, 2)
+            r.apply_delta(a, b, {"trust": rng.uniform(-0.5, 0.5)})
+
+            if rng.random() < 0.05:
+                r.set_personality(a, b, rng.choice(["forgiving", "volatile"]))
+
+        a, b = rng.sample(agents, 2)
+        rel = r.get(a, b)
+        reads.append(None if rel is None else rel["trust"])
+
+        for _ in range(rng.randint(0, 3)):
+            r.tick()
+
+    return reads, g.snapshot()
+
+
+def _close(x, y):
+    if isinstance(x, dict):
+        return x.keys() == y.keys() and all(_close(x[k], y[k]) for k in x)
+    if isinstance(x, list):
+        return len(x) == len(y) and all(_close(a, b) for a, b in zip(x, y))
+    if isinstance(x, float):
+        return math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-12)
+    return x == y
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_lazy_decay_matches_eager(store):
+    eager_reads, eager_snap = _run(store, "eager")
+    lazy_reads, lazy_snap = _run(store, "lazy")
+
+    eager_snap.pop("decay_mode")
+    lazy_snap.pop("decay_mode")
+
+    assert _close(lazy_reads, eager_reads)
+    assert _close(lazy_snap, eager_snap)
+
+
+def test_lazy_decay_without_numpy(monkeypatch):
+    monkeypatch.setattr(relationships_mod, "np", None)
+
+    eager_reads, eager_snap = _run("compact", "eager")
+    lazy_reads, lazy_snap = _run("compact", "lazy")
+
+    eager_snap.pop("decay_mode")
+    lazy_snap.pop("decay_mode")
+
+    assert _close(lazy_snap, eager_snap)
+
+
+def test_lazy_tick_is_clock_only():
+    g = GhostEngine({"decay_mode": "lazy"})
+    r = g.relationships
+
+    r.apply_delta("a", "b", {"trust": 1.0})
+
+    for _ in range(10):
+        r.tick()
+
+    # nothing touched until the edge is read
+    assert g.state()["relationships"]["a|b"]["pos"] == 1.0
+    assert math.isclose(r.get("a", "b")["pos"], 0.97 ** 10)
+
+
+def test_unknown_decay_mode_rejected():
+    with pytest.raises(ValueError):
+        GhostEngine({"decay_mode": "sometimes"})
@@ -0,0 +1,199 @@
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine
+from ghost.metrics import RelationshipMetrics
+
+
+def _check(rt):
+    live = rt.metrics_aggregator().summary()
+    expected = rt.relationships.trust_summary(0.2, -0.2)
+
+    assert live["edges"] == expected["edges"]
+    assert live["strong_edges"] == expected["strong_edges"]
+    assert live["hostile_edges"] == expected["hostile_edges"]
+    assert live["min_trust"] == pytest.approx(expected["min_trust"])
+    assert live["total_trust"] == pytest.approx(expected["total_trust"], abs=1e-9)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_streaming_metrics_match_full_scan(store, decay_mode):
+    rng = random.Random(13)
+    rt = GhostEngine({"relationship_store": store, "decay_mode": decay_mode})
+    graph = rt.relationships
+
+    agents = [f"A{i}" for i in range(30)]
+
+    for step in range(1500):
+        a, b = rng.sample(agents, 2)
+        graph.apply_delta(a, b, {"trust": rng.uniform(-0.15, 0.15)})
+
+        if step == 200:
+            rt.metrics_aggregator()
+
+        if step % 60 == 59:
+            rt.tick(dt=rng.choice([1, 2.5]))
+
+        if step > 200 and step % 20 == 0:
+            _check(rt)
+
+    _check(rt)
+
+
+def test_reads_between_ticks_do_not_rescan(monkeypatch):
+    rt = GhostEngine()
+    graph = rt.relationships
+
+    graph.apply_delta("A", "B", {"trust": -0.3})
+    metrics = rt.metrics_aggregator()
+    metrics.summary()
+
+    def scan(*args):
+        raise AssertionError("full scan")
+
+    monkeypatch.setattr(graph, "trust_summary", scan)
+
+    graph.apply_delta("A", "C", {"trust": 0.25})
+    graph.apply_delta("B", "C", {"trust": -0.5})
+    graph.apply_delta("A", "B", {"trust": 0.05})
+
+    m = rt.relationship_metrics()
+    assert m["edges"] == 3
+    assert m["strong_edges"] == 1
+    assert m["hostile_edges"] == 2
+    assert m["max_rivalry"] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_ticks_and_raised_minimum_do_not_rescan(monkeypatch, store):
+    rng = random.Random(5)
+    rt = GhostEngine({"relationship_store": store})
+    graph = rt.relationships
+
+    agents = [f"A{i}" for i in range(20)]
+    for _ in range(300):
+        a, b = rng.sample(agents, 2)
+        graph.apply_delta(a, b, {"trust": rng.uniform(-0.3, 0.3)})
+
+    metrics = rt.metrics_aggregator()
+    metrics.summary()
+    scan = graph.trust_summary
+
+    def no_scan(*args):
+        raise AssertionError("full scan")
+
+    monkeypatch.setattr(graph, "trust_summary", no_scan)
+
+    for step in range(20):
+        rt.tick(dt=rng.choice([1, 2.5]))
+
+        # raise the current minimum edge a few times
+        for _ in range(3):
+            low = min(graph.pairs(), key=lambda pair: graph.trust(*pair))
+            graph.apply_delta(*low, {"trust": 0.4})
+
+            live = metrics.summary()
+            expected = scan(0.2, -0.2)
+
+            assert live["strong_edges"] == expected["strong_edges"]
+            assert live["hostile_edges"] == expected["hostile_edges"]
+            assert live["min_trust"] == expected["min_trust"]
+            assert live["total_trust"] == pytest.approx(expected["total_trust"], abs=1e-9)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_lazy_ticks_rescan_on_the_next_read(monkeypatch, store):
+    rt = GhostEngine({"relationship_store": store, "decay_mode": "lazy"})
+    graph = rt.relationships
+
+    graph.apply_delta("A", "B", {"trust": -0.3})
+    graph.apply_delta("A", "C", {"trust": 0.25})
+    metrics = rt.metrics_aggregator()
+    metrics.summary()
+
+    scan = graph.trust_summary
+    scans = []
+
+    def counted(*args):
+        scans.append(args)
+        return scan(*args)
+
+    monkeypatch.setattr(graph, "trust_summary", counted)
+
+    for tick in range(1, 4):
+        rt.tick()
+        assert len(scans) == tick - 1
+
+        # one full pass on the first read after a tick, none after that
+        live = metrics.summary()
+        metrics.summary()
+        assert len(scans) == tick
+
+        assert live["total_trust"] == pytest.approx(scan(0.2, -0.2)["total_trust"], abs=1e-9)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_set_params_reports_new_edges(store):
+    rt = GhostEngine({"relationship_store": store})
+    graph = rt.relationships
+    seen = []
+
+    class Recorder:
+        def on_delta(self, a, b, old_trust, new_trust, rel):
+            seen.append((a, b, old_trust, new_trust))
+
+        def on_tick(self, dt):
+            pass
+
+    graph.add_observer(Recorder())
+    graph.apply_delta("A", "B", {"trust": 0.5})
+    metrics = rt.metrics_aggregator()
+
+    graph.set_personality("C", "D", "forgiving")
+    graph.set_params("A", "B", pos_decay=0.5)
+
+    assert seen[1:] == [("C", "D", 0.0, 0.0), ("A", "B", 0.5, 0.5)]
+    assert metrics.summary()["min_trust"] == 0.0
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_bare_ensure_pair_counts_towards_the_minimum(store):
+    rt = GhostEngine({"relationship_store": store})
+    graph = rt.relationships
+
+    graph.apply_delta("A", "B", {"trust": 0.5})
+    metrics = rt.metrics_aggregator()
+    assert metrics.summary()["min_trust"] == 0.5
+
+    # a new edge with no delta: trust 0.0 is the new minimum
+    graph.ensure_pair("C", "D")
+    assert metrics.summary()["min_trust"] == 0.0
+    assert metrics.summary()["edges"] == 2
+
+    graph.apply_delta("C", "D", {"trust": 0.7})
+    assert metrics.summary()["min_trust"] == 0.5
+
+
+def test_threat_propagation_counters():
+    rt = GhostEngine()
+
+    for n in ("N1", "N2", "N3"):
+        rt.step({"source": "test", "intent": "help", "actor": "T", "target": n})
+
+    before = rt.snapshot()
+    rt.step({"source": "test", "intent": "threat", "actor": "X", "target": "T"})
+    rt.step({"source": "test", "intent": "threat", "actor": "X", "target": "Q"})
+
+    m = rt.relationship_metrics()
+    assert m["threat_cascades"] == 1
+    assert m["threat_reach"] == 3
+
+    # counters stay out of the public state
+    assert set(rt.snapshot()) == set(before)
+
+
+def test_thresholds_must_bracket_zero():
+    with pytest.raises(ValueError):
+        RelationshipMetrics(GhostEngine().relationships, 0.2, 0.1)
@@ -0,0 +1,31 @@
+import pytest
+
+from ghost.engine import GhostEngine
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_hub_neighbors_keep_first_interaction_order(store):
+    g = GhostEngine({"relationship_store": store})
+    r = g.relationships
+
+    players = [f"P{i}" for i in range(2000)]
+
+    for _ in range(3):
+        for p in players:
+            r.apply_delta(p, "guard", {"trust": -0.01})
+
+    assert r.neighbors("guard") == players
+    assert r.neighbors("P5") == ["guard"]
+    assert r.has_neighbor("guard", "P1999")
+    assert r.has_neighbor("P1999", "guard")
+    assert not r.has_neighbor("P1", "P2")
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_self_pair_listed_once(store):
+    g = GhostEngine({"relationship_store": store})
+
+    g.relationships.apply_delta("a", "a", {"trust": 0.1})
+    g.relationships.apply_delta("a", "a", {"trust": 0.1})
+
+    assert g.relationships.neighbors("a") == ["a"]
@@ -0,0 +1,154 @@
+import copy
+import json
+import math
+
+import pytest
+
+from ghost.engine import GhostEngine, _json_safe
+
+
+def _event(kind, a, b, intensity=1.0):
+    return {"kind": kind, "actor_id": a, "target_id": b, "payload": {"intensity": intensity}}
+
+
+def test_apply_event_kinds():
+    rt = GhostEngine()
+
+    rt.apply_event(_event("support", "A", "B"))
+    rt.apply_event(_event("alliance", "A", "B", 0.5))
+
+    rel = rt.relationships.get("A", "B")
+    assert rel["trust"] == pytest.approx(0.05 + 0.04)
+    assert rel["attachment"] == pytest.approx(0.02 + 0.025)
+    assert rt.state()["agents"]["B"]["mood"] > 0.5
+
+    rt.apply_event(_event("betrayal", "C", "D"))
+    assert rt.relationships.get("C", "D")["trust"] == pytest.approx(-0.15)
+    assert rt.state()["agents"]["D"]["tension"] == pytest.approx(0.12)
+
+    # no step: cycles and npc state are untouched
+    assert rt.state()["cycles"] == 0
+    assert rt.state()["npc"]["last_intent"] is None
+
+
+@pytest.mark.parametrize("event", [
+    "conflict",
+    {"kind": "hug", "actor_id": "A", "target_id": "B"},
+    {"kind": "argue", "actor_id": "A"},
+    {"kind": "argue", "actor_id": "A", "target_id": "B", "payload": {"intensity": "x"}},
+])
+def test_apply_event_validation(event):
+    with pytest.raises(ValueError):
+        GhostEngine().apply_event(event)
+
+
+def test_breaking_a_relationship_cascades_to_bounded_neighbors():
+    rt = GhostEngine()
+
+    for i in range(20):
+        rt.apply_event(_event("support", "T", f"N{i}"))
+
+    # first betrayal crosses into the hostile band: one cascade
+    rt.apply_event(_event("betrayal", "X", "T"))
+    rt.apply_event(_event("betrayal", "X", "T"))
+
+    assert rt.relationship_metrics()["cascade_events"] == 1
+
+    touched = [i for i in range(20) if rt.state()["agents"][f"N{i}"]["tension"] > 0.0]
+    assert touched == list(range(8))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_tick_dt_matches_repeated_ticks(store):
+    a = GhostEngine({"relationship_store": store})
+    b = GhostEngine({"relationship_store": store})
+
+    for rt in (a, b):
+        rt.apply_event(_event("support", "A", "B"))
+        rt.apply_event(_event("conflict", "A", "C"))
+
+    a.tick(dt=3)
+    for _ in range(3):
+        b.tick()
+
+    for pair in (("A", "B"), ("A", "C")):
+        ra, rb = a.relationships.get(*pair), b.relationships.get(*pair)
+        assert math.isclose(ra["pos"], rb["pos"], rel_tol=1e-12)
+        assert math.isclose(ra["neg"], rb["neg"], rel_tol=1e-12)
+
+    assert a.state()["agents"]["C"]["tension"] == pytest.approx(b.state()["agents"]["C"]["tension"])
+
+    with pytest.raises(ValueError):
+        a.tick(dt=-1)
+
+
+def test_tick_refreshes_summaries_and_snapshot():
+    rt = GhostEngine()
+    rt.apply_event(_event("conflict", "A", "B"))
+
+    rt.snapshot()
+    rt.tick(dt=1.0)
+
+    state = rt.state()
+    assert 0.0 < state["global_tension"] < 0.08
+    assert state["stability_index"] == 0.0
+
+    # agent affect changed in bulk: the snapshot must see it
+    rt.relationships.materialize()
+    assert json.dumps(rt.snapshot()) == json.dumps(_json_safe(copy.deepcopy(rt.state())))
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_relationship_metrics(store):
+    rt = GhostEngine({"relationship_store": store})
+
+    for _ in range(5):
+        rt.apply_event(_event("alliance", "A", "B"))
+    for _ in range(3):
+        rt.apply_event(_event("betrayal", "C", "D"))
+    rt.apply_event(_event("argue", "A", "C"))
+
+    m = rt.relationship_metrics()
+
+    assert m["edges"] == 3
+    assert m["strong_edges"] == 1
+    assert m["hostile_edges"] == 1
+    assert m["max_rivalry"] == pytest.approx(0.45)
+    assert m["mean_trust"] == pytest.approx((0.40 - 0.45 - 0.03) / 3)
+
+
+def test_faction_snapshot():
+    rt = GhostEngine()
+
+    for a, b in [("A", "B"), ("B", "C"), ("D", "E")]:
+        for _ in range(5):
+            rt.apply_event(_event("alliance", a, b))
+
+    rt.apply_event(_event("support", "C", "D"))  # weak tie: no merge
+
+    f = rt.faction_snapshot(["A", "B", "C", "D", "E", "F"])
+    assert f == {"nodes": 6, "factions": 2, "top_sizes": [3, 2]}
+
+    # factions are global: A and B belong to the A-B-C faction
+    assert rt.faction_snapshot(["A", "B", "C", "D"], max_nodes=2)["top_sizes"] == [3]
+
+
+def test_runtime_views():
+    rt = GhostEngine()
+    rt.apply_event(_event("argue", "A", "B"))
+
+    assert rt._neighbors.get("A") == ["B"]
+    assert len(rt._rels) == 1
+
+
+def test_bench_runtime_stress_runs(tmp_path, monkeypatch):
+    from docs.tests.bench_runtime_stress import run_runtime_stress
+
+    monkeypatch.chdir(tmp_path)
+
+    stats = run_runtime_stress(
+        n_agents=200, ticks=3, interactions_per_tick=300, report_every=1, track_mem=False,
+    )
+
+    assert stats["ips"] > 0
+    assert stats["rels"] > 0
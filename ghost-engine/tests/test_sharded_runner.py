@@ -0,0 +1,229 @@
+import json
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine
+from ghost.sharding import ShardedRunner, shard_of
+
+
+def _batches(seed=1, n_batches=20):
+    rng = random.Random(seed)
+    agents = [f"A{i}" for i in range(30)]
+
+    batches = []
+    for _ in range(n_batches):
+        batch = []
+        for _ in range(rng.randint(0, 40)):
+            if rng.random() < 0.1:
+                batch.append(None)
+                continue
+
+            batch.append({
+                "source": "test",
+                "intent": rng.choice(["greet", "help", "threat", "threat", "idle"]),
+                "actor": rng.choice(agents),
+                "target": rng.choice(agents + [None]),
+                "intensity": rng.random() * 1.2,
+            })
+        batches.append(batch)
+
+    return batches
+
+
+def _events(seed=1, n_batches=10):
+    rng = random.Random(seed)
+    agents = [f"A{i}" for i in range(30)]
+
+    return [
+        [
+            {
+                "kind": rng.choice(["conflict", "argue", "betrayal", "betrayal", "support", "alliance"]),
+                "actor_id": rng.choice(agents),
+                "target_id": rng.choice(agents),
+                "payload": {"intensity": rng.choice([1, 0.5, 1.5, rng.random()])},
+            }
+            for _ in range(rng.randint(0, 60))
+        ]
+        for _ in range(n_batches)
+    ]
+
+
+def _run_both(runner, config, batches):
+    engine = GhostEngine(dict(config))
+
+    for i, batch in enumerate(batches):
+        engine.step_many(batch)
+        runner.step_many(batch)
+
+        if i % 3 == 0:
+            engine.tick()
+            runner.tick()
+
+    return json.dumps(engine.snapshot()), json.dumps(runner.snapshot())
+
+
+@pytest.mark.parametrize("n_shards", [1, 2, 3, 7])
+@pytest.mark.parametrize("config", [
+    {},
+    {"relationship_store": "compact", "decay_mode": "lazy"},
+])
+def test_in_process_shards_match_sequential_engine(n_shards, config):
+    runner = ShardedRunner(n_shards, dict(config), processes=False)
+
+    expected, merged = _run_both(runner, config, _batches())
+
+    assert merged == expected
+
+
+@pytest.mark.parametrize("n_shards", [1, 2, 3, 7])
+@pytest.mark.parametrize("config", [
+    {},
+    {"relationship_store": "compact", "decay_mode": "lazy"},
+])
+def test_runtime_events_match_sequential_engine(n_shards, config):
+    engine = GhostEngine(dict(config))
+    runner = ShardedRunner(n_shards, dict(config), processes=False)
+
+    for i, (events, steps) in enumerate(zip(_events(), _batches(n_batches=10))):
+        for event in events:
+            engine.apply_event(event)
+        runner.apply_events(events)
+
+        # both surfaces on one world
+        if i % 2:
+            engine.step_many(steps)
+            runner.step_many(steps)
+
+        engine.tick(dt=0.5 + i % 3)
+        runner.tick(dt=0.5 + i % 3)
+
+    snap = engine.snapshot()
+    assert snap["cascade_events"] > 0
+    assert json.dumps(runner.snapshot()) == json.dumps(snap)
+
+
+def test_shards_only_receive_their_rows():
+    runner = ShardedRunner(4, processes=False)
+    received = []
+
+    for shard in runner._shards:
+        run = shard._shard.run
+
+        def counted(*columns, index=shard._shard.index, run=run):
+            received.append((index, len(columns[0])))
+            return run(*columns)
+
+        shard._shard.run = counted
+
+    # no edges yet: each step goes to its actor's and target's shards
+    steps = [
+        {"source": "test", "intent": "help", "actor": f"A{i}", "target": f"B{i}"}
+        for i in range(40)
+    ]
+    runner.step_many(steps)
+
+    expected = {}
+    for step in steps:
+        for agent in (step["actor"], step["target"]):
+            expected.setdefault(shard_of(agent, 4), set()).add(step["actor"])
+
+    assert {index for index, _ in received} == set(expected)
+    for index, n in received:
+        assert n == len(expected[index])
+
+
+def test_worker_processes_match_sequential_engine():
+    with ShardedRunner(2) as runner:
+        expected, merged = _run_both(runner, {}, _batches(seed=2, n_batches=6))
+
+    assert merged == expected
+
+    engine = GhostEngine()
+
+    with ShardedRunner(2) as runner:
+        for events in _events(seed=2, n_batches=4):
+            for event in events:
+                engine.apply_event(event)
+            runner.apply_events(events)
+
+            engine.tick()
+            runner.tick()
+
+        assert runner.snapshot() == engine.snapshot()
+
+
+def test_step_and_columns_match_engine():
+    engine = GhostEngine()
+    runner = ShardedRunner(3, processes=False)
+
+    step = {"source": "test", "intent": "threat", "actor": "A", "target": "B", "intensity": 1.0}
+    columns = {"source": ["test", "test"], "intent": ["help", "threat"], "actor": ["B", "C"], "target": ["C", "A"]}
+
+    engine.step(step)
+    runner.step(step)
+    engine.step(None)
+    runner.step(None)
+    engine.step_many(columns)
+    runner.step_many(columns)
+
+    assert runner.snapshot() == engine.snapshot()
+
+
+def test_bad_batch_leaves_world_untouched():
+    runner = ShardedRunner(2, processes=False)
+    runner.step({"source": "test", "intent": "help", "actor": "A", "target": "B"})
+
+    before = runner.snapshot()
+
+    with pytest.raises(TypeError):
+        runner.step_many([
+            {"source": "test", "intent": "help", "actor": "A", "target": "C"},
+            {"intent": "help"},
+        ])
+
+    assert runner.snapshot() == before
+
+
+def test_bad_runtime_batch_leaves_world_untouched():
+    runner = ShardedRunner(2, processes=False)
+    runner.apply_event({"kind": "support", "actor_id": "A", "target_id": "B"})
+
+    before = runner.snapshot()
+
+    with pytest.raises(ValueError):
+        runner.apply_events([
+            {"kind": "conflict", "actor_id": "A", "target_id": "C"},
+            {"kind": "hug", "actor_id": "A", "target_id": "B"},
+        ])
+
+    assert runner.snapshot() == before
+
+
+def test_shard_assignment_is_stable():
+    assert shard_of("N42", 4) == shard_of("N42", 4)
+    assert {shard_of(f"N{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_rejects_prebuilt_state():
+    with pytest.raises(ValueError):
+        ShardedRunner(2, {"agents": {}}, processes=False)
+
+
+def test_bad_batch_leaves_worker_shards_untouched():
+    with ShardedRunner(2) as runner:
+        runner.step({"source": "test", "intent": "help", "actor": "A", "target": "B"})
+
+        before = runner.snapshot()
+
+        with pytest.raises(TypeError):
+            runner.step_many([
+                {"source": "test", "intent": "threat", "actor": "C", "target": "A"},
+                {"intent": "help"},
+            ])
+
+        assert runner.snapshot() == before
+
+        # the shards are still in step with each other
+        runner.step({"source": "test", "intent": "threat", "actor": "C", "target": "A"})
+        assert runner.snapshot()["cycles"] == 2
@@ -0,0 +1,141 @@
+import json
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine
+from ghost.snapshot import apply_snapshot_delta
+
+
+def _event(rng, agents):
+    return {
+        "source": "test",
+        "intent": rng.choice(["greet", "help", "threat", "idle"]),
+        "actor": rng.choice(agents),
+        "target": rng.choice(agents + [None]),
+        "intensity": rng.random(),
+    }
+
+
+@pytest.mark.parametrize("relationship_store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_delta_chain_reproduces_snapshot(relationship_store, decay_mode):
+    rng = random.Random(5)
+    g = GhostEngine({
+        "agent_store": rng.choice(["dict", "compact"]),
+        "relationship_store": relationship_store,
+        "decay_mode": decay_mode,
+    })
+
+    agents = [f"A{i}" for i in range(30)]
+
+    client = g.snapshot()
+
+    for _ in range(60):
+        g.step_many([_event(rng, agents) for _ in range(rng.randint(0, 8))])
+
+        if rng.random() < 0.3:
+            g.step(_event(rng, agents))
+
+        if rng.random() < 0.15:
+            g.relationships.tick()
+
+        if rng.random() < 0.1:
+            # direct API use without advancing cycles
+            g.relationships.apply_delta(*rng.sample(agents, 2), {"trust": 0.1})
+
+        delta = g.snapshot_delta(client["cycles"])
+
+        # plain JSON in, plain JSON out
+        delta = json.loads(json.dumps(delta))
+
+        client = apply_snapshot_delta(client, delta)
+
+        assert json.dumps(client) == json.dumps(g.snapshot())
+
+
+def test_delta_only_carries_changes():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "help", "actor": "A", "target": "B", "intensity": 1.0})
+    g.step({"source": "test", "intent": "greet", "actor": "C", "target": "D", "intensity": 1.0})
+
+    since = g.snapshot()["cycles"]
+
+    g.step({"source": "test", "intent": "threat", "actor": "C", "target": "A", "intensity": 1.0})
+
+    delta = g.snapshot_delta(since)
+
+    assert set(delta["agents"]) == {"A", "B", "C"}
+    assert list(delta["relationships"]) == ["A|C"]
+    assert delta["neighbors"] == {"C": ["A"], "A": ["C"]}
+    assert delta["npc"]["actors"] == {"C": {"threat_count": 1}}
+    assert delta["state"]["cycles"] == 3
+
+
+def test_delta_after_tick_resends_relationships():
+    g = GhostEngine()
+    g.step({"source": "test", "intent": "help", "actor": "A", "target": "B", "intensity": 1.0})
+    g.step({"source": "test", "intent": "help", "actor": "C", "target": "D", "intensity": 1.0})
+
+    since = g.snapshot()["cycles"]
+    g.relationships.tick()
+
+    delta = g.snapshot_delta(since)
+
+    assert list(delta["relationships"]) == ["A|B", "C|D"]
+    assert delta["agents"] == {}
+
+
+@pytest.mark.parametrize("relationship_store", ["dict", "compact"])
+def test_journals_record_from_first_snapshot(relationship_store):
+    g = GhostEngine({"relationship_store": relationship_store})
+
+    for i in range(20):
+        g.step({"source": "test", "intent": "help", "actor": f"A{i}", "target": "B", "intensity": 1.0})
+
+    journals = (*g.agents.journals(), *g.relationships.journals(), g._actors_touched)
+    assert all(not journal.items() for journal in journals)
+
+    g.snapshot()
+    g.step({"source": "test", "intent": "help", "actor": "A0", "target": "B", "intensity": 1.0})
+
+    assert [key for key, _ in g.agents.journals()[0].items()] == ["A0", "B"]
+
+
+@pytest.mark.parametrize("relationship_store", ["dict", "compact"])
+def test_journals_trimmed_to_snapshot_history(relationship_store):
+    g = GhostEngine({"relationship_store": relationship_store, "snapshot_history": 2})
+    old = g.snapshot()
+
+    for i in range(10):
+        g.step({"source": "test", "intent": "help", "actor": f"A{i}", "target": "B", "intensity": 1.0})
+        g.snapshot()
+
+    floor = g.snapshot()["cycles"] - 1
+    for journal in (*g.agents.journals(), *g.relationships.journals()):
+        assert all(stamp >= floor for _, stamp in journal.items())
+
+    # a delta from before the kept marks resends whole sections
+    delta = json.loads(json.dumps(g.snapshot_delta(old["cycles"])))
+    assert json.dumps(apply_snapshot_delta(old, delta)) == json.dumps(g.snapshot())
+
+
+@pytest.mark.parametrize("relationship_store", ["dict", "compact"])
+@pytest.mark.parametrize("agent_store", ["dict", "compact"])
+def test_delta_from_inside_a_batch(agent_store, relationship_store):
+    rng = random.Random(11)
+    agents = [f"A{i}" for i in range(12)]
+    events = [_event(rng, agents) for _ in range(40)]
+    g = GhostEngine({"agent_store": agent_store, "relationship_store": relationship_store})
+    g.snapshot()
+    g.step_many(events)
+
+    # the same run, paused for a snapshot 25 steps into the batch
+    paused = GhostEngine({"agent_store": agent_store, "relationship_store": relationship_store})
+    paused.step_many(events[:25])
+    client = paused.snapshot()
+    assert client["cycles"] == 25
+
+    delta = json.loads(json.dumps(g.snapshot_delta(client["cycles"])))
+
+    assert json.dumps(apply_snapshot_delta(client, delta)) == json.dumps(g.snapshot())
@@ -0,0 +1,141 @@
+import random
+
+from ghost.engine import GhostEngine
+from ghost.step import GhostStep
+
+
+def _events(seed=11, n=2000):
+    rng = random.Random(seed)
+    intents = ["greet", "help", "threat", "observe", None]
+    actors = [f"a{i}" for i in range(12)]
+
+    events = []
+    for _ in range(n):
+        intent = rng.choice(intents)
+        if intent is None:
+            events.append(None)
+            continue
+
+        events.append({
+            "source": "npc_engine",
+            "intent": intent,
+            "actor": rng.choice(actors),
+            "target": rng.choice(actors + [None]),
+            "intensity": rng.random() * 1.5,
+        })
+
+    return events
+
+
+def test_step_many_matches_step_loop():
+    events = _events()
+
+    looped = GhostEngine()
+    for event in events:
+        looped.step(event)
+
+    batched = GhostEngine()
+    batched.step_many(events)
+
+    assert batched.snapshot() == looped.snapshot()
+
+
+def test_step_many_columnar_matches_step_loop():
+    events = [e for e in _events(seed=3) if e is not None]
+
+    looped = GhostEngine()
+    for event in events:
+        looped.step(event)
+
+    batched = GhostEngine()
+    batched.step_many({
+        "source": [e["source"] for e in events],
+        "intent": [e["intent"] for e in events],
+        "actor": [e["actor"] for e in events],
+        "target": [e["target"] for e in events],
+        "intensity": [e["intensity"] for e in events],
+    })
+
+    assert batched.snapshot() == looped.snapshot()
+
+
+def test_step_many_records_only_final_input():
+    e = GhostEngine()
+
+    e.step_many([
+        {"source": "npc_engine", "intent": "greet", "actor": "a", "target": "b"},
+        GhostStep(source="npc_engine", intent="threat", actor="b", intensity=0.5),
+        None,
+    ])
+
+    state = e.state()
+
+    assert state["cycles"] == 3
+    assert isinstance(state["input"], dict)
+    assert state["input"]["intent"] == "threat"
+    assert state["last_step"] == state["input"]
+
+
+def test_step_many_stops_at_bad_event_like_step_loop():
+    events = [
+        {"source": "npc_engine", "intent": "threat", "actor": "a", "intensity": 1.0},
+        {"intent": "threat"},
+        {"source": "npc_engine", "intent": "help", "actor": "a", "intensity": 1.0},
+    ]
+
+    looped = GhostEngine()
+    try:
+        for event in events:
+            looped.step(event)
+    except TypeError:
+        pass
+
+    batched = GhostEngine()
+    try:
+        batched.step_many(events)
+    except TypeError:
+        pass
+
+    assert batched.snapshot() == looped.snapshot()
+
+
+def test_columnar_input_follows_ghost_step_rules():
+    e = GhostEngine()
+
+    # source is required, like GhostStep(**event)
+    try:
+        e.step_many({"intent": ["greet"], "actor": ["a"]})
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("columns without 'source' must be rejected")
+
+    # missing actor / intent default as in GhostStep
+    looped = GhostEngine()
+    looped.step({"source": "npc_engine", "target": "b"})
+
+    batched = GhostEngine()
+    batched.step_many({"source": ["npc_engine"], "target": ["b"]})
+
+    assert batched.snapshot() == looped.snapshot()
+
+
+def test_numpy_columns_record_plain_values():
+    import json
+
+    import pytest
+
+    np = pytest.importorskip("numpy")
+
+    e = GhostEngine()
+    e.step_many({
+        "source": np.array(["npc_engine", "npc_engine"]),
+        "intent": np.array(["greet", "threat"]),
+        "actor": np.array(["a", "b"]),
+        "target": np.array(["b", "a"]),
+        "intensity": np.array([1, 1], dtype=np.int64),
+    })
+
+    json.dumps(e.snapshot())
+    assert type(e.state()["input"]["intensity"]) is int
+    assert all(type(agent) is str for agent in e.state()["agents"])
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine
+from ghost.sharding import ShardedRunner
+
+
+def _world(**config):
+    """B is threatened; its neighbors were met in order C, D, E (trust 0.1, 0.5, 0.3)."""
+    rt = GhostEngine(dict(config))
+    graph = rt.relationships
+
+    for other, trust in (("C", 0.1), ("D", 0.5), ("E", 0.3)):
+        graph.apply_delta("B", other, {"trust": trust})
+
+    graph.apply_delta("C", "F", {"trust": 0.4})
+    graph.apply_delta("D", "G", {"trust": 0.4})
+    graph.apply_delta("G", "H", {"trust": 0.4})
+
+    rt.step({"source": "test", "intent": "threat", "actor": "A", "target": "B", "intensity": 1.0})
+    return rt
+
+
+def _unsettled(rt):
+    agents = rt.state()["agents"]
+    return {agent for agent in "CDEFGH" if agent in agents and agents[agent]["tension"] > 0}
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_explicit_defaults_match_unbounded(store):
+    rng = random.Random(20)
+    events = [
+        {"source": "test", "intent": rng.choice(["threat", "help"]), "actor": f"A{rng.randrange(12)}",
+         "target": f"A{rng.randrange(12)}", "intensity": rng.random()}
+        for _ in range(400)
+    ]
+
+    default = GhostEngine({"relationship_store": store})
+    explicit = GhostEngine({
+        "relationship_store": store,
+        "threat_fanout": 1000, "threat_order": "strength", "threat_hops": 1,
+    })
+
+    default.step_many(events)
+    explicit.step_many(events)
+
+    # same neighbors unsettled, same amount (only the order differs)
+    assert default.state()["agents"] == explicit.state()["agents"]
+    assert default.propagation_stats() == explicit.propagation_stats()
+
+
+def test_fanout_cap_and_order():
+    assert _unsettled(_world()) == {"C", "D", "E"}
+    assert _unsettled(_world(threat_fanout=2)) == {"C", "D"}
+    assert _unsettled(_world(threat_fanout=2, threat_order="strength")) == {"D", "E"}
+    assert _unsettled(_world(threat_fanout=0)) == set()
+
+
+def test_multi_hop_attenuation():
+    rt = _world(threat_fanout=1, threat_order="strength", threat_hops=3, threat_attenuation=0.5)
+    agents = rt.state()["agents"]
+
+    # B -> D (strongest) -> G -> H; B is visited, so D's pick is G
+    assert _unsettled(rt) == {"D", "G", "H"}
+    assert agents["G"]["tension"] == pytest.approx(agents["D"]["tension"] / 2)
+    assert agents["H"]["tension"] == pytest.approx(agents["D"]["tension"] / 4)
+
+    stats = rt.propagation_stats()
+    assert stats == {"propagations": 1, "touched": 3, "last_touched": 3, "max_touched": 3}
+
+
+def test_strength_order_asks_for_fanout_results():
+    asked = []
+    rt = GhostEngine({"threat_fanout": 1, "threat_order": "strength", "threat_hops": 3})
+    top_trusted = rt.propagation._top_trusted
+
+    def counted(agent, k, skip):
+        asked.append(k)
+        return top_trusted(agent, k, skip)
+
+    rt.propagation._top_trusted = counted
+
+    graph = rt.relationships
+    for a, b, trust in (("B", "C", 0.1), ("B", "D", 0.5), ("D", "G", 0.4), ("G", "H", 0.4)):
+        graph.apply_delta(a, b, {"trust": trust})
+
+    rt.step({"source": "test", "intent": "threat", "actor": "A", "target": "B", "intensity": 1.0})
+
+    # B -> D -> G -> H, however many agents were visited on the way
+    assert _unsettled(rt) == {"D", "G", "H"}
+    assert asked == [1, 1, 1]
+
+
+def test_stats_and_bad_config():
+    rt = _world(threat_hops=2)
+    assert _unsettled(rt) == {"C", "D", "E", "F", "G"}
+
+    rt.step({"source": "test", "intent": "threat", "actor": "A", "target": "H", "intensity": 1.0})
+    assert rt.propagation_stats() == {
+        "propagations": 2, "touched": 7, "last_touched": 2, "max_touched": 5,
+    }
+
+    with pytest.raises(ValueError):
+        GhostEngine({"threat_order": "random"})
+    with pytest.raises(ValueError):
+        GhostEngine({"threat_hops": 0})
+    with pytest.raises(ValueError):
+        ShardedRunner(2, {"threat_fanout": 3}, processes=False)
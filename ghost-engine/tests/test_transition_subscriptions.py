@@ -0,0 +1,113 @@
+import queue
+import random
+
+import pytest
+
+import ghost.relationships as relationships_mod
+from ghost.api import GhostAPI
+from ghost.transitions import TransitionWatch
+
+
+def _states(api):
+    """Band of every edge, recomputed from scratch."""
+    graph = api.engine.relationships
+    return {
+        tuple(sorted(pair)): api._get_state(graph.trust(*pair))
+        for pair in graph.pairs()
+    }
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pushed_transitions_match_recomputed_bands(monkeypatch, store, decay_mode, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(relationships_mod, "np", None)
+
+    rng = random.Random(17)
+    api = GhostAPI({"relationship_store": store, "decay_mode": decay_mode})
+    graph = api.engine.relationships
+
+    received = []
+    api.subscribe_transitions(received.append)
+
+    agents = [f"A{i}" for i in range(15)]
+    states = {}
+
+    for step in range(600):
+        if step % 40 == 39:
+            api.tick()
+        else:
+            a, b = rng.sample(agents, 2)
+            api.apply_event(a, b, {"type": rng.choice(["help", "insult"]), "intensity": rng.random()})
+
+            if rng.random() < 0.05:
+                graph.set_personality(a, b, "forgiving")
+
+        now = _states(api)
+        expected = sorted(
+            (pair, states.get(pair, "neutral"), state)
+            for pair, state in now.items()
+            if state != states.get(pair, "neutral")
+        )
+        got = sorted((tuple(sorted((e["a"], e["b"]))), e["from"], e["to"]) for e in received)
+
+        assert got == expected
+        received.clear()
+        states = now
+
+
+def test_trigger_payload_and_queue_subscriber():
+    api = GhostAPI()
+    q = api.subscribe_transitions(queue.Queue())
+
+    api.apply_event("A", "B", {"type": "help", "intensity": 0.5})  # 0.1: friendly
+    api.apply_event("A", "B", {"type": "betrayal"})  # -0.7: hostile
+
+    first, second = q.get_nowait(), q.get_nowait()
+    assert first == {
+        "event": "forgiveness", "from": "neutral", "to": "friendly",
+        "a": "A", "b": "B", "trust": pytest.approx(0.1),
+    }
+    assert second["event"] == "relationship_broken"
+    assert second["from"] == "friendly"
+    assert q.empty()
+
+    # pushing does not touch polling state
+    assert api._transitions == {}
+
+
+def test_unsubscribe_detaches_the_watch():
+    api = GhostAPI()
+    received = []
+
+    api.subscribe_transitions(received.append)
+    api.unsubscribe_transitions(received.append)
+
+    api.apply_event("A", "B", {"type": "betrayal"})
+
+    assert received == []
+    assert api.engine.relationships._observers == []
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+def test_lazy_tick_reports_edges_without_materializing(store):
+    engine = GhostAPI({"relationship_store": store, "decay_mode": "lazy"}).engine
+    graph = engine.relationships
+
+    graph.apply_delta("x|y", "z", {"trust": 0.3})  # key "x|y|z"
+    graph.apply_delta("P", "Q", {"trust": 0.3})
+    graph.apply_delta("R", "S", {"trust": 0.9})
+
+    received = []
+    TransitionWatch(graph, (0.2,), ("low", "high"), lambda *args: received.append(args))
+    synced = graph._synced
+
+    graph.tick(dt=20)
+
+    assert sorted(received) == [
+        ("P", "Q", "high", "low", pytest.approx(0.3 * 0.97 ** 20)),
+        ("x|y", "z", "high", "low", pytest.approx(0.3 * 0.97 ** 20)),
+    ]
+    assert graph._synced == synced
+    assert graph.trust("R", "S") == pytest.approx(0.9 * 0.97 ** 20)
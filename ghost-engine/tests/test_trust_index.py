@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from ghost.engine import GhostEngine
+
+
+def _ranking(graph, agent, reverse):
+    """Neighbors ranked from scratch (ties on neighbor id)."""
+    rows = [(graph.trust(agent, other), other) for other in graph.neighbors(agent)]
+    sign = -1.0 if reverse else 1.0
+    return [(other, trust) for trust, other in sorted(rows, key=lambda r: (sign * r[0], r[1]))]
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+@pytest.mark.parametrize("min_degree", [0, 6])
+def test_rankings_match_recompute(store, decay_mode, min_degree):
+    rng = random.Random(19)
+    rt = GhostEngine({
+        "relationship_store": store,
+        "decay_mode": decay_mode,
+        "trust_index_min_degree": min_degree,
+    })
+    graph = rt.relationships
+    agents = [f"A{i}" for i in range(20)]
+
+    for step in range(2000):
+        a, b = rng.sample(agents[: 4 + step // 100], 2)
+        graph.apply_delta(a, b, {"trust": rng.uniform(-0.2, 0.2)})
+
+        if rng.random() < 0.02:
+            graph.set_personality(a, b, rng.choice(["forgiving", "resentful"]))
+
+        if step == 150:
+            rt.trust_index()
+
+        if step % 70 == 69:
+            rt.tick(dt=rng.choice([1, 3]))
+
+        if step > 150 and step % 13 == 0:
+            agent = rng.choice(agents)
+            k = rng.randint(1, 6)
+
+            assert rt.top_trusted(agent, k) == _ranking(graph, agent, True)[:k]
+            assert rt.top_hostile(agent, k) == _ranking(graph, agent, False)[:k]
+
+            skip = set(rng.sample(agents, 5))
+            assert rt.top_trusted(agent, k, skip) == [
+                row for row in _ranking(graph, agent, True) if row[0] not in skip
+            ][:k]
+
+
+def test_degree_threshold_limits_the_index():
+    rt = GhostEngine({"trust_index_min_degree": 3})
+    graph = rt.relationships
+    index = rt.trust_index()
+
+    for other, trust in [("B", 0.3), ("C", -0.4), ("D", 0.1)]:
+        graph.apply_delta("A", other, {"trust": trust})
+
+    assert index.is_indexed("A")
+    assert not index.is_indexed("B")
+
+    assert rt.top_trusted("A", 2) == [("B", pytest.approx(0.3)), ("D", pytest.approx(0.1))]
+    assert rt.top_hostile("B", 5) == [("A", pytest.approx(0.3))]
+    assert rt.top_trusted("nobody", 3) == []
+
+
+def test_heaps_stay_bounded():
+    rt = GhostEngine()
+    graph = rt.relationships
+    index = rt.trust_index()
+
+    for i in range(5000):
+        graph.apply_delta("A", f"N{i % 10}", {"trust": 0.01})
+
+    assert len(index._high["A"]) <= 2 * 10 + 17
+    assert rt.top_trusted("A", 1)[0][1] == pytest.approx(5.0)
+
+
+@pytest.mark.parametrize("store", ["dict", "compact"])
+@pytest.mark.parametrize("decay_mode", ["eager", "lazy"])
+def test_ticks_do_not_force_a_rebuild(store, decay_mode):
+    rt = GhostEngine({"relationship_store": store, "decay_mode": decay_mode})
+    graph = rt.relationships
+    index = rt.trust_index()
+
+    for i in range(200):
+        graph.apply_delta("H", f"N{i}", {"trust": (i - 100) / 50})
+        if i % 3 == 0:
+            graph.set_personality("H", f"N{i}", "forgiving")
+
+    rt.top_trusted("H", 3)
+    built = index._built["H"]
+
+    for _ in range(2):
+        rt.tick()
+        assert rt.top_trusted("H", 3) == _ranking(graph, "H", True)[:3]
+        assert rt.top_hostile("H", 3) == _ranking(graph, "H", False)[:3]
+
+    assert index._built["H"] == built
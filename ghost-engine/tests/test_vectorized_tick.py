@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+import ghost.relationships as relationships_mod
+from ghost.engine import GhostEngine
+
+
+PRESETS = [None, "balanced", "forgiving", "resentful", "volatile"]
+
+
+def _build(store, seed=7, n_edges=3000):
+    rng = random.Random(seed)
+    g = GhostEngine({"relationship_store": store})
+    r = g.relationships
+
+    agents = [f"N{i}" for i in range(300)]
+
+    for _ in range(n_edges):
+        a, b = rng.sample(agents, 2)
+        r.apply_delta(a, b, {"trust": rng.uniform(-1.0, 1.0)})
+
+        preset = rng.choice(PRESETS)
+        if preset is not None:
+            r.set_personality(a, b, preset)
+
+    return g
+
+
+def _decayed(g):
+    rels = g.relationships.all()
+    return {k: (rel["pos"], rel["neg"]) for k, rel in rels.items()}
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_vectorized_tick_bit_identical_to_dict_loop(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(relationships_mod, "np", None)
+    elif relationships_mod.np is None:
+        pytest.skip("numpy not installed")
+
+    plain = _build("dict")
+    compact = _build("compact")
+
+    for _ in range(25):
+        plain.relationships.tick()
+        compact.relationships.tick()
+
+    assert _decayed(compact) == _decayed(plain)
+
+
+def test_vectorized_tick_allows_growth_afterwards():
+    g = _build("compact", n_edges=50)
+
+    g.relationships.tick()
+    g.relationships.apply_delta("new_a", "new_b", {"trust": 0.5})
+    g.relationships.tick()
+
+    assert g.relationships.get("new_a", "new_b")["pos"] == 0.5 * 0.97